@@ -7,6 +7,7 @@ stochastic models from OHLCV (Open, High, Low, Close, Volume) data:
 - Geometric Brownian Motion (GBM)
 - Heston Stochastic Volatility
 - GARCH(1,1)
+- GJR-GARCH and EGARCH, with Gaussian or Student-t innovations
 - Markov Regime-Switching
 - Block Bootstrap
 
@@ -26,9 +27,11 @@ Example usage:
     print(f"GARCH persistence: {result.garch.persistence.value:.4f}")
 """
 
-__version__ = "0.1.0"
+__version__ = "0.5.0"
 
 from .core import Calibrator, CalibratorConfig
+from .cache import ResultCache
+from .rolling import RollingCalibrator, RollingConfig
 from .data import (
     load_ohlcv,
     OHLCVData,
@@ -41,6 +44,9 @@ from .output import ResultFormatter
 __all__ = [
     "Calibrator",
     "CalibratorConfig",
+    "ResultCache",
+    "RollingCalibrator",
+    "RollingConfig",
     "load_ohlcv",
     "OHLCVData",
     "OHLCVBar",
@@ -0,0 +1,183 @@
+"""
+Content-addressed on-disk cache of calibration results.
+
+A result is stored under the SHA-256 of everything it depends on: the
+dataset's ticker and price arrays, the result-affecting fields of the
+CalibratorConfig, the models estimated and the calibrator version. Any
+change to one of them gives a new key, so entries never need invalidating;
+stale ones simply stop being read and are evicted, least recently used
+first, once the cache grows beyond its size limit.
+"""
+
+import hashlib
+import os
+import pickle
+import threading
+from dataclasses import asdict
+from pathlib import Path
+from typing import Iterable, Optional
+
+import numpy as np
+
+from .data.types import CalibrationResult, ModelType, OHLCVData
+
+CACHE_SUFFIX = ".result"
+
+# 256 MB; a pickled CalibrationResult is a few kB
+DEFAULT_MAX_BYTES = 256 * 1024 * 1024
+
+# CalibratorConfig fields that only decide how estimation is scheduled
+_SCHEDULING_FIELDS = ("executor", "max_workers")
+
+_HASHED_COLUMNS = ("dates", "opens", "highs", "lows", "closes", "volumes")
+
+
+def result_key(
+        data: OHLCVData,
+        config,
+        models: Iterable[ModelType],
+        version: Optional[str] = None,
+) -> str:
+    """
+    Cache key of the result of calibrating `models` on `data` with `config`.
+
+    Args:
+        data: Dataset to calibrate
+        config: CalibratorConfig of the calibrator
+        models: Models estimated
+        version: Calibrator version (defaults to the installed one)
+
+    Returns:
+        Hex SHA-256 digest
+    """
+    if version is None:
+        from . import __version__ as version
+
+    h = hashlib.sha256()
+    h.update(f"calibrator {version}\n".encode())
+    h.update(f"ticker {data.ticker}\n".encode())
+
+    for name in _HASHED_COLUMNS:
+        column = np.ascontiguousarray(getattr(data, name))
+        h.update(f"{name} {column.dtype.str} {column.shape}\n".encode())
+        h.update(column.view(np.uint8).data)
+
+    settings = {k: v for k, v in asdict(config).items() if k not in _SCHEDULING_FIELDS}
+    h.update(f"config {sorted(settings.items())!r}\n".encode())
+    h.update(f"models {sorted(m.name for m in models)!r}\n".encode())
+
+    return h.hexdigest()
+
+
+class ResultCache:
+    """
+    Pickled CalibrationResults in a directory, one file per key.
+
+    Usage:
+        cache = ResultCache(".result_cache")
+        calibrator = Calibrator(config, cache=cache)
+        calibrator.calibrate(data)  # computed and stored
+        calibrator.calibrate(data)  # read back
+
+    Reading an entry refreshes its modification time, which is what eviction
+    orders by. Safe to share between threads, and between processes in the
+    sense that files are written atomically.
+    """
+
+    def __init__(self, directory: str | Path, max_bytes: int = DEFAULT_MAX_BYTES):
+        """
+        Args:
+            directory: Where results are stored (created if missing)
+            max_bytes: Total size of stored results above which the least
+                recently used ones are deleted
+        """
+        if max_bytes <= 0:
+            raise ValueError("max_bytes must be positive")
+
+        self.directory = Path(directory)
+        self.max_bytes = max_bytes
+        self.hits = 0
+        self.misses = 0
+        self._lock = threading.Lock()
+
+        self.directory.mkdir(parents=True, exist_ok=True)
+
+    def get(self, key: str) -> Optional[CalibrationResult]:
+        """The stored result for `key`, or None."""
+        path = self._path(key)
+        try:
+            with open(path, "rb") as f:
+                result = pickle.load(f)
+            os.utime(path)
+        except FileNotFoundError:
+            result = None
+        except Exception:
+            # Truncated or from an incompatible version of the types
+            path.unlink(missing_ok=True)
+            result = None
+
+        with self._lock:
+            if isinstance(result, CalibrationResult):
+                self.hits += 1
+                return result
+            self.misses += 1
+            return None
+
+    def put(self, key: str, result: CalibrationResult) -> None:
+        """Stores `result` under `key`, then evicts down to max_bytes."""
+        path = self._path(key)
+        tmp_path = path.with_name(f".{path.name}.{os.getpid()}.{threading.get_ident()}.tmp")
+        with open(tmp_path, "wb") as f:
+            pickle.dump(result, f, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(tmp_path, path)
+
+        self.evict()
+
+    def evict(self) -> int:
+        """Deletes least recently used results until under max_bytes; returns how many."""
+        with self._lock:
+            entries = []
+            for path in self.directory.glob(f"*{CACHE_SUFFIX}"):
+                try:
+                    stat = path.stat()
+                except FileNotFoundError:
+                    continue
+                entries.append((stat.st_mtime, stat.st_size, path))
+
+            total = sum(size for _, size, _ in entries)
+            removed = 0
+            for _, size, path in sorted(entries, key=lambda e: e[0]):
+                if total <= self.max_bytes:
+                    break
+                path.unlink(missing_ok=True)
+                total -= size
+                removed += 1
+            return removed
+
+    def clear(self) -> None:
+        """Deletes all stored results."""
+        with self._lock:
+            for path in self.directory.glob(f"*{CACHE_SUFFIX}"):
+                path.unlink(missing_ok=True)
+
+    def size(self) -> int:
+        """Total bytes of stored results."""
+        return sum(p.stat().st_size for p in self.directory.glob(f"*{CACHE_SUFFIX}"))
+
+    def stats(self) -> dict[str, int]:
+        return {"hits": self.hits, "misses": self.misses}
+
+    def __repr__(self) -> str:
+        return f"ResultCache({str(self.directory)!r}, hits={self.hits}, misses={self.misses})"
+
+    def __getstate__(self):
+        state = self.__dict__.copy()
+        del state["_lock"]
+        return state
+
+    def __setstate__(self, state):
+        self.__dict__.update(state)
+        self._lock = threading.Lock()
+
+    def _path(self, key: str) -> Path:
+        return self.directory / f"{key}{CACHE_SUFFIX}"
@@ -2,19 +2,26 @@
 Main calibrator that orchestrates all model estimators.
 """
 
+import threading
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor, as_completed
 from dataclasses import dataclass, field
-from typing import Callable
+from typing import Callable, Iterable, Iterator, NamedTuple, Optional
 
 from .data.types import (
     CalibrationResult,
     OHLCVData,
     ModelType,
 )
+from .cache import ResultCache, result_key
+from .math.features import FeatureCache, feature_cache
 from .estimators import (
+    BaseEstimator,
     EstimatorConfig,
     GBMEstimator,
     HestonEstimator,
     GARCHEstimator,
+    GJRGARCHEstimator,
+    EGARCHEstimator,
     RegimeSwitchingEstimator,
     BlockBootstrapEstimator,
 )
@@ -30,6 +37,8 @@ class CalibratorConfig:
     estimate_garch: bool = True
     estimate_regime_switching: bool = True
     estimate_bootstrap: bool = True
+    estimate_gjr_garch: bool = False
+    estimate_egarch: bool = False
 
     # Shared estimator config
     trading_days_per_year: float = 252.0
@@ -38,6 +47,21 @@ class CalibratorConfig:
 
     # Model-specific
     n_regimes: int = 2
+    garch_innovations: str = "student_t"  # GJR-GARCH and EGARCH: "normal" or "student_t"
+
+    # Seed for bootstrap resampling and EM restarts, so a ticker's result is
+    # the same whichever process calibrates it and in whatever order
+    random_seed: int = 0
+
+    # Run the estimators of one calibration concurrently: None (one after
+    # another), "thread" or "process". A calibration still takes as long as
+    # its slowest model, so this only pays off when no single model
+    # dominates; with regime-switching enabled it does, and "process" is
+    # slower than sequential because of pickling and worker start-up. For
+    # many tickers, parallelize over tickers instead (calibrate_many with an
+    # executor, which ignores this setting).
+    executor: Optional[str] = None
+    max_workers: Optional[int] = None  # executor size, None for the library default
 
     def to_estimator_config(self) -> EstimatorConfig:
         """Convert to EstimatorConfig."""
@@ -46,9 +70,84 @@ class CalibratorConfig:
             confidence_level=self.confidence_level,
             n_bootstrap=self.n_bootstrap,
             n_regimes=self.n_regimes,
+            random_seed=self.random_seed,
         )
 
 
+class _ModelStep(NamedTuple):
+    model: ModelType
+    config_flag: str  # CalibratorConfig switch
+    result_field: str  # CalibrationResult attribute
+    label: str  # used in failure warnings
+    description: str  # used in progress messages
+    cost: int  # relative runtime; costlier models are scheduled first
+
+
+# Estimation order, which is also the order results and warnings are merged in
+_MODEL_STEPS = (
+    _ModelStep(ModelType.GBM, "estimate_gbm", "gbm", "GBM", "GBM", 0),
+    _ModelStep(ModelType.HESTON, "estimate_heston", "heston", "Heston", "Heston", 1),
+    _ModelStep(ModelType.GARCH, "estimate_garch", "garch", "GARCH", "GARCH", 3),
+    _ModelStep(ModelType.REGIME_SWITCHING, "estimate_regime_switching", "regime_switching",
+               "Regime-switching", "regime-switching", 4),
+    _ModelStep(ModelType.BLOCK_BOOTSTRAP, "estimate_bootstrap", "block_bootstrap",
+               "Block bootstrap", "block bootstrap", 2),
+    _ModelStep(ModelType.GJR_GARCH, "estimate_gjr_garch", "gjr_garch",
+               "GJR-GARCH", "asymmetric GJR-GARCH", 3),
+    _ModelStep(ModelType.EGARCH, "estimate_egarch", "egarch",
+               "EGARCH", "exponential GARCH", 4),
+)
+
+# Calibrators of the current worker thread or process, by config
+_worker_state = threading.local()
+
+
+def _run_estimator(
+        estimator: BaseEstimator,
+        data: OHLCVData,
+        features: FeatureCache,
+) -> tuple[object, list[str], Optional[str]]:
+    """
+    Runs one estimator, returning (parameters, warnings, error message).
+
+    Module-level and exception-free so it can run in a worker process.
+    """
+    try:
+        params = estimator.estimate(data, features)
+    except Exception as e:
+        return None, [], str(e)
+    return params, estimator.warnings, None
+
+
+def _worker_calibrator(config: "CalibratorConfig") -> "Calibrator":
+    """Calibrator reused by every task a worker runs with the same config."""
+    calibrators = getattr(_worker_state, "calibrators", None)
+    if calibrators is None:
+        calibrators = _worker_state.calibrators = {}
+
+    key = repr(config)
+    if key not in calibrators:
+        calibrators[key] = Calibrator(config)
+    return calibrators[key]
+
+
+def _estimate_models(
+        config: "CalibratorConfig",
+        data: OHLCVData,
+        models: list[ModelType],
+) -> list[tuple[object, list[str], Optional[str]]]:
+    """
+    Executor task of calibrate_many: the given models for one dataset.
+
+    The models share one FeatureCache, so series such as the Yang-Zhang
+    volatility and the return moments are computed once per dataset, and
+    the dataset is sent to the worker once.
+    """
+    estimators = _worker_calibrator(config)._estimators
+    features = FeatureCache(data)
+    return [_run_estimator(estimators[model], data, features) for model in models]
+
+
 class Calibrator:
     """
     Main calibrator that estimates parameters for all stochastic models.
@@ -56,12 +155,20 @@ class Calibrator:
     Usage:
         calibrator = Calibrator()
         result = calibrator.calibrate(ohlcv_data)
+
+        with ProcessPoolExecutor() as pool:
+            for result in calibrator.calibrate_many(datasets, executor=pool):
+                ...
+
+        # Serve unchanged datasets from disk
+        calibrator = Calibrator(cache=ResultCache(".result_cache"))
     """
 
     def __init__(
             self,
             config: CalibratorConfig | None = None,
             progress_callback: Callable[[str], None] | None = None,
+            cache: ResultCache | None = None,
     ):
         """
         Initialize calibrator.
@@ -69,9 +176,13 @@ class Calibrator:
         Args:
             config: Calibration configuration
             progress_callback: Optional callback for progress updates
+            cache: Where to look up and store results; a dataset whose
+                prices, config and models match a stored result is not
+                recalibrated
         """
         self.config = config or CalibratorConfig()
         self.progress_callback = progress_callback or (lambda x: None)
+        self.cache = cache
 
         # Initialize estimators
         est_config = self.config.to_estimator_config()
@@ -84,75 +195,217 @@ class Calibrator:
             n_regimes=self.config.n_regimes
         )
         self._bootstrap_estimator = BlockBootstrapEstimator(est_config)
-
-    def calibrate(self, data: OHLCVData) -> CalibrationResult:
+        self._gjr_garch_estimator = GJRGARCHEstimator(est_config, innovations=self.config.garch_innovations)
+        self._egarch_estimator = EGARCHEstimator(est_config, innovations=self.config.garch_innovations)
+
+        self._estimators: dict[ModelType, BaseEstimator] = {
+            ModelType.GBM: self._gbm_estimator,
+            ModelType.HESTON: self._heston_estimator,
+            ModelType.GARCH: self._garch_estimator,
+            ModelType.REGIME_SWITCHING: self._regime_estimator,
+            ModelType.BLOCK_BOOTSTRAP: self._bootstrap_estimator,
+            ModelType.GJR_GARCH: self._gjr_garch_estimator,
+            ModelType.EGARCH: self._egarch_estimator,
+        }
+        self._executor: Executor | None = None
+
+    def calibrate(self, data: OHLCVData, features: FeatureCache | None = None) -> CalibrationResult:
         """
         Calibrate all configured models to the data.
 
+        Derived series (log ranges, squared returns, moments, ...) are
+        computed once and shared by all estimators through a FeatureCache.
+        With config.executor set, the estimators run concurrently; results
+        and warnings are still merged in the fixed model order.
+
         Args:
             data: OHLCV data to calibrate from
+            features: Feature cache of `data` to use (and whose hit/miss
+                counters to update); a new one is built if omitted
 
         Returns:
             CalibrationResult with all parameter estimates
         """
-        warnings = []
+        steps = self._steps()
+        key, result = self._lookup(data, steps)
+        if result is not None:
+            self.progress_callback("Using cached calibration.")
+            return result
+
+        estimators = [self._estimators[step.model] for step in steps]
+        executor = self._get_executor() if len(steps) > 1 else None
+        features = feature_cache(data, features)
+
+        if executor is None:
+            outcomes = []
+            for step, estimator in zip(steps, estimators):
+                self.progress_callback(f"Estimating {step.description} parameters...")
+                outcomes.append(_run_estimator(estimator, data, features))
+        else:
+            self.progress_callback(f"Estimating {len(steps)} models concurrently...")
+            # Worker processes each get (and fill) a copy of the feature cache.
+            # The costliest models are submitted first so they start first
+            futures = {
+                i: executor.submit(_run_estimator, estimators[i], data, features)
+                for i in sorted(range(len(steps)), key=lambda i: -steps[i].cost)
+            }
+            outcomes = [futures[i].result() for i in range(len(steps))]
+
+        result = self._merge(data, steps, outcomes)
+        self._store(key, result, outcomes)
+        self.progress_callback("Calibration complete.")
 
+        return result
+
+    def calibrate_many(
+            self,
+            datasets: Iterable[OHLCVData],
+            models: Iterable[ModelType] | None = None,
+            executor: Executor | None = None,
+    ) -> Iterator[CalibrationResult]:
+        """
+        Calibrate many datasets, yielding each result as soon as it is complete.
+
+        With an executor, every dataset is a separate task that runs all its
+        models on one shared FeatureCache. The longest datasets are submitted
+        first so they do not end up as a long tail, and each worker reuses
+        one set of estimators for all its tasks. Results are yielded in
+        completion order; without an executor, datasets are calibrated one
+        after another in input order.
+
+        A failing model only adds a warning to its dataset's result, like in
+        calibrate(), so one bad ticker never stops the batch. Datasets found
+        in the result cache are yielded first, without submitting any task.
+
+        Args:
+            datasets: Data to calibrate, one OHLCVData per ticker
+            models: Models to estimate (defaults to the ones enabled in config)
+            executor: Thread or process pool to run the tasks on
+
+        Returns:
+            Iterator of CalibrationResult, one per dataset
+        """
+        steps = self._steps(models)
+
+        if executor is None:
+            for data in datasets:
+                key, result = self._lookup(data, steps)
+                if result is None:
+                    features = FeatureCache(data)
+                    outcomes = [
+                        _run_estimator(self._estimators[step.model], data, features)
+                        for step in steps
+                    ]
+                    result = self._merge(data, steps, outcomes)
+                    self._store(key, result, outcomes)
+                yield result
+            return
+
+        datasets, keys, pending = list(datasets), [], []
+        for i, data in enumerate(datasets):
+            key, result = self._lookup(data, steps)
+            keys.append(key)
+            if result is not None:
+                yield result
+            else:
+                pending.append(i)
+
+        if not steps:
+            # Nothing to submit; an empty result per dataset, as without an executor
+            for i in pending:
+                result = self._merge(datasets[i], [], [])
+                self._store(keys[i], result, [])
+                yield result
+            return
+
+        models = [step.model for step in steps]
+        futures = {
+            executor.submit(_estimate_models, self.config, datasets[i], models): i
+            for i in sorted(pending, key=lambda i: -len(datasets[i]))
+        }
+
+        try:
+            for future in as_completed(futures):
+                i = futures[future]
+                try:
+                    outcomes = future.result()
+                except Exception as e:
+                    # The task itself failed, e.g. a worker process died
+                    outcomes = [(None, [], str(e))] * len(steps)
+
+                result = self._merge(datasets[i], steps, outcomes)
+                self._store(keys[i], result, outcomes)
+                yield result
+        finally:
+            # Stopped early: drop what has not started yet
+            for future in futures:
+                future.cancel()
+
+    def close(self) -> None:
+        """Shut down the estimator executor, if one was started."""
+        if self._executor is not None:
+            self._executor.shutdown()
+            self._executor = None
+
+    def __enter__(self) -> "Calibrator":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+    def _steps(self, models: Iterable[ModelType] | None = None) -> list[_ModelStep]:
+        """The steps to run, in merge order."""
+        if models is None:
+            return [step for step in _MODEL_STEPS if getattr(self.config, step.config_flag)]
+        models = set(models)
+        return [step for step in _MODEL_STEPS if step.model in models]
+
+    def _lookup(self, data: OHLCVData, steps: list[_ModelStep]) -> tuple[Optional[str], Optional[CalibrationResult]]:
+        """(cache key, cached result) of a dataset; (None, None) without a cache."""
+        if self.cache is None:
+            return None, None
+        key = result_key(data, self.config, [step.model for step in steps])
+        return key, self.cache.get(key)
+
+    def _store(self, key: Optional[str], result: CalibrationResult, outcomes: list[tuple]) -> None:
+        """Caches a result, unless a model failed (the failure may be transient)."""
+        if key is None or any(error is not None for _, _, error in outcomes):
+            return
+        self.cache.put(key, result)
+
+    @staticmethod
+    def _merge(data: OHLCVData, steps: list[_ModelStep], outcomes: list[tuple]) -> CalibrationResult:
+        """Collects estimator outcomes into one result, in step order."""
         result = CalibrationResult(
             ticker=data.ticker,
             n_observations=len(data),
-            date_range=(data.bars[0].date, data.bars[-1].date),
+            date_range=data.date_range,
         )
 
-        # GBM
-        if self.config.estimate_gbm:
-            self.progress_callback("Estimating GBM parameters...")
-            try:
-                result.gbm = self._gbm_estimator.estimate(data)
-                warnings.extend(self._gbm_estimator.warnings)
-            except Exception as e:
-                warnings.append(f"GBM estimation failed: {e}")
-
-        # Heston
-        if self.config.estimate_heston:
-            self.progress_callback("Estimating Heston parameters...")
-            try:
-                result.heston = self._heston_estimator.estimate(data)
-                warnings.extend(self._heston_estimator.warnings)
-            except Exception as e:
-                warnings.append(f"Heston estimation failed: {e}")
-
-        # GARCH
-        if self.config.estimate_garch:
-            self.progress_callback("Estimating GARCH parameters...")
-            try:
-                result.garch = self._garch_estimator.estimate(data)
-                warnings.extend(self._garch_estimator.warnings)
-            except Exception as e:
-                warnings.append(f"GARCH estimation failed: {e}")
-
-        # Regime-Switching
-        if self.config.estimate_regime_switching:
-            self.progress_callback("Estimating regime-switching parameters...")
-            try:
-                result.regime_switching = self._regime_estimator.estimate(data)
-                warnings.extend(self._regime_estimator.warnings)
-            except Exception as e:
-                warnings.append(f"Regime-switching estimation failed: {e}")
-
-        # Block Bootstrap
-        if self.config.estimate_bootstrap:
-            self.progress_callback("Estimating block bootstrap parameters...")
-            try:
-                result.block_bootstrap = self._bootstrap_estimator.estimate(data)
-                warnings.extend(self._bootstrap_estimator.warnings)
-            except Exception as e:
-                warnings.append(f"Block bootstrap estimation failed: {e}")
+        warnings = []
+        for step, (params, estimator_warnings, error) in zip(steps, outcomes):
+            if error is not None:
+                warnings.append(f"{step.label} estimation failed: {error}")
+                continue
+            setattr(result, step.result_field, params)
+            warnings.extend(estimator_warnings)
 
         result.warnings = warnings
-        self.progress_callback("Calibration complete.")
-
         return result
 
+    def _get_executor(self) -> Executor | None:
+        """Executor for concurrent estimation, created on first use."""
+        if self.config.executor is None:
+            return None
+        if self._executor is None:
+            if self.config.executor == "thread":
+                self._executor = ThreadPoolExecutor(max_workers=self.config.max_workers)
+            elif self.config.executor == "process":
+                self._executor = ProcessPoolExecutor(max_workers=self.config.max_workers)
+            else:
+                raise ValueError(f"Unknown executor: {self.config.executor}")
+        return self._executor
+
     def calibrate_single(
             self,
             data: OHLCVData,
@@ -171,29 +424,16 @@ class Calibrator:
         result = CalibrationResult(
             ticker=data.ticker,
             n_observations=len(data),
-            date_range=(data.bars[0].date, data.bars[-1].date),
+            date_range=data.date_range,
         )
 
-        warnings = []
+        step = next(step for step in _MODEL_STEPS if step.model == model)
+        params, warnings, error = _run_estimator(self._estimators[model], data, FeatureCache(data))
 
-        try:
-            if model == ModelType.GBM:
-                result.gbm = self._gbm_estimator.estimate(data)
-                warnings.extend(self._gbm_estimator.warnings)
-            elif model == ModelType.HESTON:
-                result.heston = self._heston_estimator.estimate(data)
-                warnings.extend(self._heston_estimator.warnings)
-            elif model == ModelType.GARCH:
-                result.garch = self._garch_estimator.estimate(data)
-                warnings.extend(self._garch_estimator.warnings)
-            elif model == ModelType.REGIME_SWITCHING:
-                result.regime_switching = self._regime_estimator.estimate(data)
-                warnings.extend(self._regime_estimator.warnings)
-            elif model == ModelType.BLOCK_BOOTSTRAP:
-                result.block_bootstrap = self._bootstrap_estimator.estimate(data)
-                warnings.extend(self._bootstrap_estimator.warnings)
-        except Exception as e:
-            warnings.append(f"{model.name} estimation failed: {e}")
+        if error is not None:
+            warnings = [f"{model.name} estimation failed: {error}"]
+        else:
+            setattr(result, step.result_field, params)
 
         result.warnings = warnings
         return result
@@ -8,6 +8,8 @@ from .types import (
     GBMParameters,
     HestonParameters,
     GARCHParameters,
+    GJRGARCHParameters,
+    EGARCHParameters,
     RegimeParameters,
     RegimeSwitchingParameters,
     BlockBootstrapParameters,
@@ -15,15 +17,20 @@ from .types import (
     ModelType,
 )
 from .loader import OHLCVLoader, load_ohlcv, DataLoadError
+from .store import save_ohlcv_store, open_ohlcv_store
+from .panel import OHLCVPanel
 
 __all__ = [
     "OHLCVBar",
     "OHLCVData",
+    "OHLCVPanel",
     "ConfidenceInterval",
     "ParameterEstimate",
     "GBMParameters",
     "HestonParameters",
     "GARCHParameters",
+    "GJRGARCHParameters",
+    "EGARCHParameters",
     "RegimeParameters",
     "RegimeSwitchingParameters",
     "BlockBootstrapParameters",
@@ -32,4 +39,6 @@ __all__ = [
     "OHLCVLoader",
     "load_ohlcv",
     "DataLoadError",
+    "save_ohlcv_store",
+    "open_ohlcv_store",
 ]
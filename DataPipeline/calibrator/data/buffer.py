@@ -0,0 +1,61 @@
+"""Growable column buffers for incremental OHLCV construction."""
+
+import numpy as np
+from numpy.typing import DTypeLike, NDArray
+
+
+class ColumnBuffer:
+    """
+    Set of equal-length column arrays with amortized O(1) appends.
+
+    Each column is preallocated with spare capacity and doubled when full,
+    so appending k rows costs O(k) on average regardless of the rows
+    already held.
+    """
+
+    def __init__(self, dtypes: dict[str, DTypeLike], capacity: int = 1024):
+        self._columns = {
+            name: np.empty(max(1, capacity), dtype=dtype)
+            for name, dtype in dtypes.items()
+        }
+        self._size = 0
+
+    def __len__(self) -> int:
+        return self._size
+
+    @property
+    def capacity(self) -> int:
+        return len(next(iter(self._columns.values())))
+
+    def reserve(self, capacity: int) -> None:
+        """Ensure room for at least `capacity` rows."""
+        if capacity <= self.capacity:
+            return
+        new_capacity = max(capacity, 2 * self.capacity)
+        for name, values in self._columns.items():
+            grown = np.empty(new_capacity, dtype=values.dtype)
+            grown[:self._size] = values[:self._size]
+            self._columns[name] = grown
+
+    def append(self, columns: dict[str, NDArray]) -> None:
+        """Append rows given as one array per column (all of equal length)."""
+        if set(columns) != set(self._columns):
+            raise ValueError(
+                f"Expected columns {sorted(self._columns)}, got {sorted(columns)}"
+            )
+        n_new = len(next(iter(columns.values())))
+        if any(len(values) != n_new for values in columns.values()):
+            raise ValueError("All columns must have the same length")
+
+        self.reserve(self._size + n_new)
+        for name, values in columns.items():
+            self._columns[name][self._size:self._size + n_new] = values
+        self._size += n_new
+
+    def column(self, name: str) -> NDArray:
+        """View of the filled part of a column."""
+        return self._columns[name][:self._size]
+
+    def columns(self) -> dict[str, NDArray]:
+        """Views of the filled part of every column."""
+        return {name: values[:self._size] for name, values in self._columns.items()}
@@ -1,12 +1,30 @@
 """Data loading utilities for OHLCV data."""
 
-from datetime import datetime
+from datetime import date
 from pathlib import Path
-from typing import Optional
+from typing import Iterable, Optional
 
+import numpy as np
 import pandas as pd
+from numpy.typing import NDArray
 
-from .types import OHLCVBar, OHLCVData
+from .buffer import ColumnBuffer
+from .store import STORE_SUFFIX, open_ohlcv_store
+from .types import OHLCVData
+
+DateLike = date | str | pd.Timestamp | np.datetime64
+
+# Rows per chunk for streaming loads
+DEFAULT_CHUNK_SIZE = 100_000
+
+_COLUMN_DTYPES = {
+    "dates": "datetime64[D]",
+    "opens": np.float64,
+    "highs": np.float64,
+    "lows": np.float64,
+    "closes": np.float64,
+    "volumes": np.float64,
+}
 
 
 class DataLoadError(Exception):
@@ -49,13 +67,32 @@ class OHLCVLoader:
         self.date_format = date_format
         self.column_mapping = column_mapping or {}
 
-    def load(self, path: str | Path, ticker: Optional[str] = None) -> OHLCVData:
+    def load(
+            self,
+            path: str | Path,
+            ticker: Optional[str] = None,
+            chunk_size: Optional[int] = None,
+            start: Optional[DateLike] = None,
+            end: Optional[DateLike] = None,
+            columns: Optional[Iterable[str]] = None,
+    ) -> OHLCVData:
         """
         Load OHLCV data from a file.
 
         Args:
-            path: Path to the data file (CSV, Parquet, or Excel)
+            path: Path to the data file (CSV, Parquet, Excel, or .ohlcv store)
             ticker: Optional ticker symbol (defaults to filename)
+            chunk_size: If given, stream CSV/Parquet files in chunks of this
+                many rows (see load_chunked)
+            start: Optional first date to keep (inclusive)
+            end: Optional last date to keep (inclusive)
+            columns: Optional OHLCV fields to read ("date", "open", "high",
+                "low", "close", "volume"); the date and OHLC fields are always
+                read. Other file columns are never read from CSV or Parquet.
+
+        For Parquet files the date range and column selection are pushed down
+        to the reader, so row groups outside [start, end] and unused columns
+        are skipped without being decoded.
 
         Returns:
             OHLCVData object with the loaded data
@@ -65,26 +102,148 @@ class OHLCVLoader:
         if not path.exists():
             raise DataLoadError(f"File not found: {path}")
 
-        ticker = ticker or path.stem.upper()
-
         # Load based on file extension
         suffix = path.suffix.lower()
+        if suffix == STORE_SUFFIX:
+            data = self.load_mmap(path, ticker)
+            return data if start is None and end is None else data.window(start, end)
+
+        if chunk_size is not None and suffix in (".csv", ".parquet"):
+            return self.load_chunked(path, ticker, chunk_size, start, end, columns)
+
+        ticker = ticker or path.stem.upper()
+
         if suffix == ".csv":
-            df = pd.read_csv(path)
+            column_map = self._csv_column_map(path, columns)
+            df = pd.read_csv(path, usecols=_mapped_columns(column_map))
         elif suffix == ".parquet":
-            df = pd.read_parquet(path)
+            import pyarrow.parquet as pq
+
+            column_map, filters = self._parquet_plan(path, columns, start, end)
+            table = pq.read_table(path, columns=_mapped_columns(column_map), filters=filters)
+            df = table.to_pandas(ignore_metadata=True)
         elif suffix in (".xlsx", ".xls"):
             df = pd.read_excel(path)
+            return self._process_dataframe(df, ticker, start, end)
         else:
             raise DataLoadError(f"Unsupported file format: {suffix}")
 
-        return self._process_dataframe(df, ticker)
+        return self._build_data(df, column_map, ticker, start, end)
+
+    def load_chunked(
+            self,
+            path: str | Path,
+            ticker: Optional[str] = None,
+            chunk_size: int = DEFAULT_CHUNK_SIZE,
+            start: Optional[DateLike] = None,
+            end: Optional[DateLike] = None,
+            columns: Optional[Iterable[str]] = None,
+    ) -> OHLCVData:
+        """
+        Stream a CSV or Parquet file in chunks.
+
+        Each chunk is validated and appended to a growable column buffer, so
+        peak memory is the output arrays plus one chunk of rows rather than
+        the whole file as a DataFrame.
+
+        Args:
+            path: Path to a CSV or Parquet file
+            ticker: Optional ticker symbol (defaults to filename)
+            chunk_size: Rows per chunk (CSV) or per record batch (Parquet)
+            start, end, columns: As for load()
+
+        Returns:
+            OHLCVData object with the loaded data
+        """
+        path = Path(path)
+
+        if not path.exists():
+            raise DataLoadError(f"File not found: {path}")
+
+        ticker = ticker or path.stem.upper()
+
+        suffix = path.suffix.lower()
+        if suffix == ".csv":
+            column_map = self._csv_column_map(path, columns)
+            chunks = pd.read_csv(path, usecols=_mapped_columns(column_map), chunksize=chunk_size)
+        elif suffix == ".parquet":
+            column_map, filters = self._parquet_plan(path, columns, start, end)
+            chunks = _parquet_chunks(path, chunk_size, _mapped_columns(column_map), filters)
+        else:
+            raise DataLoadError(f"Chunked loading not supported for: {suffix}")
+
+        buffer = ColumnBuffer(_COLUMN_DTYPES, capacity=chunk_size)
+        n_errors = 0
+        errors: list[str] = []
+
+        for chunk in chunks:
+            chunk_columns, rejected, chunk_errors = self._extract_columns(chunk, column_map)
+            if rejected.any():
+                n_errors += int(rejected.sum())
+                errors.extend(chunk_errors[:max(0, 5 - len(errors))])
+
+            keep = ~rejected & _date_mask(chunk_columns["dates"], start, end)
+            if not keep.all():
+                chunk_columns = {name: values[keep] for name, values in chunk_columns.items()}
+
+            buffer.append(chunk_columns)
+
+        if len(buffer) == 0:
+            if n_errors:
+                raise DataLoadError(f"No valid bars loaded. Errors: {errors[:5]}")
+            raise DataLoadError(f"No bars found between {start} and {end}")
+
+        self._report_rejected(n_errors, errors)
+
+        return OHLCVData.from_arrays(**buffer.columns(), ticker=ticker)
+
+    def load_mmap(self, path: str | Path, ticker: Optional[str] = None) -> OHLCVData:
+        """
+        Load OHLCV data from a binary store written by save_ohlcv_store.
+
+        The file is memory-mapped read-only, so the returned arrays are views
+        into the OS page cache rather than private copies.
+
+        Args:
+            path: Path to the .ohlcv store file
+            ticker: Optional ticker symbol (defaults to the ticker in the file)
+
+        Returns:
+            OHLCVData backed by the mapped file
+        """
+        path = Path(path)
+
+        if not path.exists():
+            raise DataLoadError(f"File not found: {path}")
+
+        try:
+            return open_ohlcv_store(path, ticker)
+        except ValueError as e:
+            raise DataLoadError(str(e)) from e
 
     def load_from_dataframe(self, df: pd.DataFrame, ticker: str = "UNKNOWN") -> OHLCVData:
         """Load OHLCV data from an existing DataFrame."""
         return self._process_dataframe(df.copy(), ticker)
 
-    def _process_dataframe(self, df: pd.DataFrame, ticker: str) -> OHLCVData:
+    def validate_dataframe(self, df: pd.DataFrame) -> NDArray[np.bool_]:
+        """
+        Validate a DataFrame without building OHLCVData.
+
+        Returns:
+            Boolean mask (in row order) of the rows that would be rejected
+        """
+        df = df.copy(deep=False)
+        df.columns = df.columns.str.lower().str.strip()
+        _, rejected, _ = self._extract_columns(df, self._detect_columns(df))
+        return rejected
+
+    def _process_dataframe(
+            self,
+            df: pd.DataFrame,
+            ticker: str,
+            start: Optional[DateLike] = None,
+            end: Optional[DateLike] = None,
+    ) -> OHLCVData:
         """Process a DataFrame into OHLCVData."""
         # Normalize column names
         df.columns = df.columns.str.lower().str.strip()
@@ -92,35 +251,139 @@ class OHLCVLoader:
         # Map columns to standard names
         column_map = self._detect_columns(df)
 
-        # Extract and validate data
-        bars = []
-        errors = []
-
-        for idx, row in df.iterrows():
-            try:
-                bar = self._row_to_bar(row, column_map)
-                bars.append(bar)
-            except (ValueError, KeyError) as e:
-                errors.append(f"Row {idx}: {e}")
+        return self._build_data(df, column_map, ticker, start, end)
 
-        if not bars:
+    def _build_data(
+            self,
+            df: pd.DataFrame,
+            column_map: dict[str, Optional[str]],
+            ticker: str,
+            start: Optional[DateLike] = None,
+            end: Optional[DateLike] = None,
+    ) -> OHLCVData:
+        """Validate mapped columns and build OHLCVData from the rows that pass."""
+        # Extract and validate whole columns at once
+        columns, rejected, errors = self._extract_columns(df, column_map)
+
+        if len(rejected) and rejected.all():
             raise DataLoadError(f"No valid bars loaded. Errors: {errors[:5]}")
 
-        if errors:
-            # Log warning but continue if we have some data
-            n_errors = len(errors)
-            if n_errors > 5:
-                error_summary = "\n".join(errors[:5]) + f"\n... and {n_errors - 5} more"
-            else:
-                error_summary = "\n".join(errors)
-            print(f"Warning: {n_errors} rows skipped:\n{error_summary}")
+        keep = ~rejected & _date_mask(columns["dates"], start, end)
+        if not keep.any():
+            raise DataLoadError(f"No bars found between {start} and {end}")
+
+        self._report_rejected(int(rejected.sum()), errors)
+
+        if not keep.all():
+            columns = {name: values[keep] for name, values in columns.items()}
 
-        return OHLCVData.from_bars(bars, ticker)
+        return OHLCVData.from_arrays(**columns, ticker=ticker)
+
+    def _select_fields(
+            self,
+            column_map: dict[str, Optional[str]],
+            fields: Optional[Iterable[str]],
+    ) -> dict[str, Optional[str]]:
+        """Drop optional fields that were not requested."""
+        if fields is None:
+            return column_map
+
+        fields = {f.lower() for f in fields}
+        unknown = fields - set(self.COLUMN_ALIASES)
+        if unknown:
+            raise DataLoadError(
+                f"Unknown columns requested: {unknown}. "
+                f"Valid columns: {list(self.COLUMN_ALIASES)}"
+            )
+
+        if "volume" not in fields:
+            column_map = {**column_map, "volume": None}
+        return column_map
+
+    def _csv_column_map(
+            self,
+            path: Path,
+            fields: Optional[Iterable[str]],
+    ) -> dict[str, Optional[str]]:
+        """Detect OHLCV columns from a CSV header without reading the rows."""
+        header = pd.read_csv(path, nrows=0)
+        return self._select_fields(self._detect_columns(header), fields)
+
+    def _parquet_plan(
+            self,
+            path: Path,
+            fields: Optional[Iterable[str]],
+            start: Optional[DateLike],
+            end: Optional[DateLike],
+    ) -> tuple[dict[str, Optional[str]], Optional[list[tuple]]]:
+        """
+        Plan a Parquet read from the file schema alone.
+
+        Returns:
+            (column map onto the file's column names, pyarrow row filters)
+        """
+        import pyarrow as pa
+        import pyarrow.parquet as pq
+
+        schema = pq.read_schema(path)
+
+        # pandas stores a named index as an ordinary column plus metadata
+        pandas_metadata = schema.pandas_metadata or {}
+        index_columns = [
+            c for c in pandas_metadata.get("index_columns", [])
+            if isinstance(c, str) and c in schema.names
+        ]
+
+        probe = pd.DataFrame(columns=[n for n in schema.names if n not in index_columns])
+        if len(index_columns) == 1:
+            index_type = schema.field(index_columns[0]).type
+            if pa.types.is_timestamp(index_type) or pa.types.is_date(index_type):
+                probe.index = pd.DatetimeIndex([])
+
+        column_map = self._select_fields(self._detect_columns(probe), fields)
+        if column_map["date"] == "__index__":
+            column_map["date"] = index_columns[0]
+
+        date_column = column_map["date"]
+        date_type = schema.field(date_column).type
+
+        if pa.types.is_timestamp(date_type):
+            def bound(value: DateLike, days: int = 0):
+                ts = pd.Timestamp(value).normalize() + pd.Timedelta(days=days)
+                if date_type.tz is not None and ts.tz is None:
+                    ts = ts.tz_localize(date_type.tz)
+                return ts
+        elif pa.types.is_date(date_type):
+            def bound(value: DateLike, days: int = 0):
+                return (pd.Timestamp(value).normalize() + pd.Timedelta(days=days)).date()
+        else:
+            # e.g. string dates: no usable statistics, filtered after parsing
+            return column_map, None
+
+        filters = []
+        if start is not None:
+            filters.append((date_column, ">=", bound(start)))
+        if end is not None:
+            # Dates are compared by day, so keep everything before the next day
+            filters.append((date_column, "<", bound(end, days=1)))
+
+        return column_map, filters or None
+
+    @staticmethod
+    def _report_rejected(n_errors: int, errors: list[str]) -> None:
+        """Log a warning for skipped rows (we continue if some data is left)."""
+        if not n_errors:
+            return
+        if n_errors > 5:
+            error_summary = "\n".join(errors[:5]) + f"\n... and {n_errors - 5} more"
+        else:
+            error_summary = "\n".join(errors)
+        print(f"Warning: {n_errors} rows skipped:\n{error_summary}")
 
     def _detect_columns(self, df: pd.DataFrame) -> dict[str, str]:
         """Detect which columns correspond to OHLCV fields."""
         column_map = {}
-        columns_lower = {c.lower(): c for c in df.columns}
+        columns_lower = {c.lower().strip(): c for c in df.columns}
 
         for field, aliases in self.COLUMN_ALIASES.items():
             # Check custom mapping first
@@ -156,43 +419,127 @@ class OHLCVLoader:
 
         return column_map
 
-    def _row_to_bar(self, row: pd.Series, column_map: dict[str, str]) -> OHLCVBar:
-        """Convert a DataFrame row to an OHLCVBar."""
-        # Parse date
+    def _extract_columns(
+            self,
+            df: pd.DataFrame,
+            column_map: dict[str, str],
+    ) -> tuple[dict[str, NDArray], NDArray[np.bool_], list[str]]:
+        """
+        Convert mapped DataFrame columns to arrays and validate them.
+
+        Applies the OHLCVBar invariants to whole columns.
+
+        Returns:
+            (columns, rejected mask, error messages for the first rejected rows)
+        """
         if column_map["date"] == "__index__":
-            date_val = row.name
-        else:
-            date_val = row[column_map["date"]]
-
-        if isinstance(date_val, str):
-            if self.date_format:
-                parsed_date = datetime.strptime(date_val, self.date_format).date()
-            else:
-                parsed_date = pd.to_datetime(date_val).date()
-        elif isinstance(date_val, (datetime, pd.Timestamp)):
-            parsed_date = date_val.date()
+            dates = self._parse_dates(df.index.to_series())
         else:
-            parsed_date = pd.to_datetime(date_val).date()
+            dates = self._parse_dates(df[column_map["date"]])
 
-        # Extract OHLCV values
-        open_price = float(row[column_map["open"]])
-        high = float(row[column_map["high"]])
-        low = float(row[column_map["low"]])
-        close = float(row[column_map["close"]])
+        def numeric(field: str) -> NDArray[np.float64]:
+            return pd.to_numeric(df[column_map[field]], errors="coerce").to_numpy(dtype=np.float64)
+
+        opens = numeric("open")
+        highs = numeric("high")
+        lows = numeric("low")
+        closes = numeric("close")
 
         if column_map["volume"] is not None:
-            volume = float(row[column_map["volume"]])
+            volumes = numeric("volume")
         else:
-            volume = 0.0
-
-        return OHLCVBar(
-            date=parsed_date,
-            open=open_price,
-            high=high,
-            low=low,
-            close=close,
-            volume=volume,
-        )
+            volumes = np.zeros(len(df))
+
+        # One mask per check, in the same order as OHLCVBar.__post_init__
+        checks = [
+            (np.isnat(dates), "Invalid date"),
+            (~np.isfinite(opens) | ~np.isfinite(highs) | ~np.isfinite(lows)
+             | ~np.isfinite(closes) | ~np.isfinite(volumes), "Non-numeric OHLCV value"),
+            (highs < lows, "High ({high}) cannot be less than Low ({low})"),
+            (highs < np.maximum(opens, closes), "High must be >= Open and Close"),
+            (lows > np.minimum(opens, closes), "Low must be <= Open and Close"),
+            (volumes < 0, "Volume cannot be negative"),
+        ]
+
+        rejected = np.zeros(len(df), dtype=bool)
+        for mask, _ in checks:
+            rejected |= mask
+
+        # Only describe the first few rejected rows
+        errors = []
+        for i in np.flatnonzero(rejected)[:5]:
+            reason = next(message for mask, message in checks if mask[i])
+            reason = reason.format(high=highs[i], low=lows[i])
+            errors.append(f"Row {df.index[i]}: {reason}")
+
+        columns = {
+            "dates": dates,
+            "opens": opens,
+            "highs": highs,
+            "lows": lows,
+            "closes": closes,
+            "volumes": volumes,
+        }
+        return columns, rejected, errors
+
+    def _parse_dates(self, values: pd.Series) -> NDArray[np.datetime64]:
+        """Parse a date column to datetime64[D], with NaT for unparseable entries."""
+        values = values.reset_index(drop=True)
+        parsed = pd.to_datetime(values, format=self.date_format, errors="coerce")
+
+        if self.date_format is None:
+            # Inferred formats come from the first entry; retry stragglers one by one
+            retry = parsed.isna() & values.notna()
+            if retry.any():
+                parsed = parsed.astype(object)
+                parsed[retry] = pd.to_datetime(values[retry], format="mixed", errors="coerce")
+                parsed = pd.to_datetime(parsed, errors="coerce")
+
+        if isinstance(parsed.dtype, pd.DatetimeTZDtype):
+            parsed = parsed.dt.tz_localize(None)
+
+        return parsed.to_numpy(dtype="datetime64[ns]").astype("datetime64[D]")
+
+
+def _mapped_columns(column_map: dict[str, Optional[str]]) -> list[str]:
+    """File columns referenced by a column map."""
+    return [c for c in column_map.values() if c is not None and c != "__index__"]
+
+
+def _date_mask(
+        dates: NDArray[np.datetime64],
+        start: Optional[DateLike],
+        end: Optional[DateLike],
+) -> NDArray[np.bool_]:
+    """Mask of dates within [start, end] (both inclusive)."""
+    mask = np.ones(len(dates), dtype=bool)
+    if start is not None:
+        mask &= dates >= np.datetime64(pd.Timestamp(start), "D")
+    if end is not None:
+        mask &= dates <= np.datetime64(pd.Timestamp(end), "D")
+    return mask
+
+
+def _parquet_chunks(
+        path: Path,
+        chunk_size: int,
+        columns: list[str],
+        filters: Optional[list[tuple]],
+):
+    """Yield a Parquet file as DataFrames of at most chunk_size rows."""
+    import pyarrow.dataset as ds
+
+    dataset = ds.dataset(path, format="parquet")
+    expression = None
+    for name, op, value in filters or []:
+        term = ds.field(name) >= value if op == ">=" else ds.field(name) < value
+        expression = term if expression is None else expression & term
+
+    # The scanner skips row groups whose statistics fall outside the filter
+    scanner = dataset.scanner(columns=columns, filter=expression, batch_size=chunk_size)
+    for batch in scanner.to_batches():
+        if batch.num_rows:
+            yield batch.to_pandas(ignore_metadata=True)
 
 
 def load_ohlcv(
@@ -0,0 +1,117 @@
+"""Multi-ticker OHLCV panel aligned on a shared date index."""
+
+from dataclasses import dataclass, field
+from functools import reduce
+from typing import Iterable
+
+import numpy as np
+from numpy.typing import NDArray
+
+from .types import OHLCVData
+
+_PRICE_COLUMNS = ("opens", "highs", "lows", "closes", "volumes")
+
+
+@dataclass(frozen=True, slots=True)
+class OHLCVPanel:
+    """
+    OHLCV data for many tickers on one date index.
+
+    Price arrays have shape (n_dates, n_tickers). Cells where a ticker has
+    no bar are NaN and False in `mask`.
+    """
+    tickers: tuple[str, ...]
+    dates: NDArray[np.datetime64] = field(repr=False)  # datetime64[D]
+
+    opens: NDArray[np.float64] = field(repr=False)
+    highs: NDArray[np.float64] = field(repr=False)
+    lows: NDArray[np.float64] = field(repr=False)
+    closes: NDArray[np.float64] = field(repr=False)
+    volumes: NDArray[np.float64] = field(repr=False)
+    mask: NDArray[np.bool_] = field(repr=False)
+
+    @classmethod
+    def from_datasets(cls, datasets: Iterable[OHLCVData], join: str = "outer") -> "OHLCVPanel":
+        """
+        Align several datasets on a shared date index.
+
+        Args:
+            datasets: One OHLCVData per ticker (tickers must be unique)
+            join: "outer" keeps every date seen in any dataset,
+                "inner" keeps only dates present in all of them
+
+        Returns:
+            OHLCVPanel with one column per dataset, in input order
+        """
+        datasets = list(datasets)
+        if not datasets:
+            raise ValueError("Need at least one dataset to build a panel")
+
+        tickers = tuple(d.ticker for d in datasets)
+        if len(set(tickers)) != len(tickers):
+            raise ValueError(f"Duplicate tickers in panel: {tickers}")
+
+        if join == "outer":
+            dates = np.unique(np.concatenate([d.dates for d in datasets]))
+        elif join == "inner":
+            dates = reduce(np.intersect1d, (d.dates for d in datasets))
+        else:
+            raise ValueError(f"Unknown join: {join}")
+
+        shape = (len(dates), len(datasets))
+        columns = {name: np.full(shape, np.nan) for name in _PRICE_COLUMNS}
+        mask = np.zeros(shape, dtype=bool)
+
+        for j, data in enumerate(datasets):
+            rows = np.searchsorted(dates, data.dates)
+            present = rows < len(dates)
+            present[present] = dates[rows[present]] == data.dates[present]
+            rows = rows[present]
+
+            for name in _PRICE_COLUMNS:
+                columns[name][rows, j] = getattr(data, name)[present]
+            mask[rows, j] = True
+
+        return cls(tickers=tickers, dates=dates, mask=mask, **columns)
+
+    def __len__(self) -> int:
+        return len(self.dates)
+
+    @property
+    def n_tickers(self) -> int:
+        return len(self.tickers)
+
+    def common(self) -> "OHLCVPanel":
+        """Panel restricted to the dates on which every ticker has a bar."""
+        rows = self.mask.all(axis=1)
+        return OHLCVPanel(
+            tickers=self.tickers,
+            dates=self.dates[rows],
+            mask=self.mask[rows],
+            **{name: getattr(self, name)[rows] for name in _PRICE_COLUMNS},
+        )
+
+    def log_returns(self) -> NDArray[np.float64]:
+        """Log returns between consecutive panel dates, shape (n_dates - 1, n_tickers)."""
+        return np.diff(np.log(self.closes), axis=0)
+
+    def simple_returns(self) -> NDArray[np.float64]:
+        """Simple returns between consecutive panel dates, shape (n_dates - 1, n_tickers)."""
+        return self.closes[1:] / self.closes[:-1] - 1.0
+
+    def correlation_matrix(self) -> NDArray[np.float64]:
+        """Pearson correlation of simple returns over the dates all tickers share."""
+        returns = self.common().simple_returns()
+        if len(returns) < 2:
+            raise ValueError("Need at least 3 common dates to compute correlations")
+        return np.atleast_2d(np.corrcoef(returns, rowvar=False))
+
+    def __getitem__(self, ticker: str) -> OHLCVData:
+        """The bars of one ticker, as OHLCVData."""
+        j = self.tickers.index(ticker)
+        rows = self.mask[:, j]
+        return OHLCVData.from_arrays(
+            dates=self.dates[rows],
+            ticker=ticker,
+            **{name: getattr(self, name)[rows, j] for name in _PRICE_COLUMNS},
+        )
@@ -0,0 +1,123 @@
+"""
+Binary per-ticker OHLCV store for memory-mapped loading.
+
+File layout (little-endian):
+
+    header       64 bytes (magic, version, bar count, ticker)
+    dates        int64[n]    days since 1970-01-01
+    opens        float64[n]
+    highs        float64[n]
+    lows         float64[n]
+    closes       float64[n]
+    volumes      float64[n]
+    log_returns  float64[n-1]
+
+Every column is fixed-width and 8-byte aligned, so a reader can map the
+file once and hand out zero-copy views to OHLCVData.
+"""
+
+import os
+from pathlib import Path
+from typing import Optional
+
+import numpy as np
+
+from .types import OHLCVData
+
+STORE_SUFFIX = ".ohlcv"
+STORE_MAGIC = b"OHLCVBIN"
+STORE_VERSION = 1
+
+HEADER_DTYPE = np.dtype([
+    ("magic", "S8"),
+    ("version", "<u4"),
+    ("reserved", "<u4"),
+    ("n_bars", "<i8"),
+    ("ticker", "S40"),
+])
+
+_PRICE_COLUMNS = ("opens", "highs", "lows", "closes", "volumes")
+
+
+def save_ohlcv_store(data: OHLCVData, path: str | Path) -> Path:
+    """
+    Write OHLCVData to a binary store file.
+
+    The file is written next to its destination and renamed into place, so
+    readers never observe a partially written store.
+
+    Returns:
+        Path of the written file
+    """
+    path = Path(path)
+    ticker = data.ticker.encode("utf-8")
+    if len(ticker) > HEADER_DTYPE["ticker"].itemsize:
+        raise ValueError(f"Ticker too long for store header: {data.ticker}")
+
+    header = np.zeros(1, dtype=HEADER_DTYPE)
+    header["magic"] = STORE_MAGIC
+    header["version"] = STORE_VERSION
+    header["n_bars"] = len(data)
+    header["ticker"] = ticker
+
+    tmp_path = path.with_name(f".{path.name}.{os.getpid()}.tmp")
+    with open(tmp_path, "wb") as f:
+        header.tofile(f)
+        data.dates.astype("<M8[D]").view("<i8").tofile(f)
+        for name in _PRICE_COLUMNS:
+            getattr(data, name).astype("<f8").tofile(f)
+        data.log_returns.astype("<f8").tofile(f)
+    os.replace(tmp_path, path)
+
+    return path
+
+
+def open_ohlcv_store(path: str | Path, ticker: Optional[str] = None) -> OHLCVData:
+    """
+    Open a binary store file as OHLCVData backed by a read-only memory map.
+
+    Args:
+        path: Path to the store file
+        ticker: Optional ticker override (defaults to the ticker in the header)
+
+    Returns:
+        OHLCVData whose arrays are views into the mapped file
+    """
+    path = Path(path)
+    raw = np.memmap(path, dtype=np.uint8, mode="r")
+
+    if len(raw) < HEADER_DTYPE.itemsize:
+        raise ValueError(f"File too small to be an OHLCV store: {path}")
+
+    header = raw[:HEADER_DTYPE.itemsize].view(HEADER_DTYPE)[0]
+    if header["magic"] != STORE_MAGIC:
+        raise ValueError(f"Not an OHLCV store: {path}")
+    if header["version"] != STORE_VERSION:
+        raise ValueError(f"Unsupported OHLCV store version {header['version']}: {path}")
+
+    n = int(header["n_bars"])
+    expected_size = HEADER_DTYPE.itemsize + 8 * (7 * n - 1)
+    if n < 2 or len(raw) != expected_size:
+        raise ValueError(
+            f"Corrupt OHLCV store {path}: {len(raw)} bytes for {n} bars "
+            f"(expected {expected_size})"
+        )
+
+    offset = HEADER_DTYPE.itemsize
+
+    def column(dtype: str, length: int) -> np.ndarray:
+        nonlocal offset
+        values = raw[offset:offset + 8 * length].view(dtype)
+        offset += 8 * length
+        return values
+
+    dates = column("<M8[D]", n)
+    columns = {name: column("<f8", n) for name in _PRICE_COLUMNS}
+    log_returns = column("<f8", n - 1)
+
+    return OHLCVData(
+        ticker=ticker or header["ticker"].decode("utf-8"),
+        dates=dates,
+        log_returns=log_returns,
+        **columns,
+    )
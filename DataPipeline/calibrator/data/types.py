@@ -3,10 +3,12 @@
 from dataclasses import dataclass, field
 from datetime import date
 from enum import Enum, auto
-from typing import Optional
+from typing import Mapping, Optional, Sequence
 
 import numpy as np
-from numpy.typing import NDArray
+from numpy.typing import ArrayLike, NDArray
+
+from .buffer import ColumnBuffer
 
 
 class ModelType(Enum):
@@ -16,6 +18,8 @@ class ModelType(Enum):
     GARCH = auto()
     REGIME_SWITCHING = auto()
     BLOCK_BOOTSTRAP = auto()
+    GJR_GARCH = auto()
+    EGARCH = auto()
 
 
 @dataclass(frozen=True, slots=True)
@@ -41,11 +45,14 @@ class OHLCVBar:
 
 @dataclass(frozen=True, slots=True)
 class OHLCVData:
-    """Complete OHLCV dataset with computed returns."""
-    bars: tuple[OHLCVBar, ...]
+    """
+    Complete OHLCV dataset with computed returns.
+
+    Stored column-wise; OHLCVBar objects are only built when `bars` is accessed.
+    """
     ticker: str
 
-    # Precomputed arrays for efficiency
+    dates: NDArray[np.datetime64] = field(repr=False)  # datetime64[D]
     opens: NDArray[np.float64] = field(repr=False)
     highs: NDArray[np.float64] = field(repr=False)
     lows: NDArray[np.float64] = field(repr=False)
@@ -53,6 +60,15 @@ class OHLCVData:
     volumes: NDArray[np.float64] = field(repr=False)
     log_returns: NDArray[np.float64] = field(repr=False)
 
+    # Materialized bars, filled on first access to `bars`
+    _bars: Optional[tuple[OHLCVBar, ...]] = field(
+        default=None, init=False, repr=False, compare=False
+    )
+    # Growable storage behind the arrays, set by append()
+    _buffer: Optional[ColumnBuffer] = field(
+        default=None, init=False, repr=False, compare=False
+    )
+
     @classmethod
     def from_bars(cls, bars: list[OHLCVBar], ticker: str = "UNKNOWN") -> "OHLCVData":
         """Construct OHLCVData from a list of bars."""
@@ -62,18 +78,66 @@ class OHLCVData:
         # Sort by date
         sorted_bars = tuple(sorted(bars, key=lambda b: b.date))
 
-        opens = np.array([b.open for b in sorted_bars], dtype=np.float64)
-        highs = np.array([b.high for b in sorted_bars], dtype=np.float64)
-        lows = np.array([b.low for b in sorted_bars], dtype=np.float64)
-        closes = np.array([b.close for b in sorted_bars], dtype=np.float64)
-        volumes = np.array([b.volume for b in sorted_bars], dtype=np.float64)
+        data = cls.from_arrays(
+            dates=np.array([b.date for b in sorted_bars], dtype="datetime64[D]"),
+            opens=np.array([b.open for b in sorted_bars], dtype=np.float64),
+            highs=np.array([b.high for b in sorted_bars], dtype=np.float64),
+            lows=np.array([b.low for b in sorted_bars], dtype=np.float64),
+            closes=np.array([b.close for b in sorted_bars], dtype=np.float64),
+            volumes=np.array([b.volume for b in sorted_bars], dtype=np.float64),
+            ticker=ticker,
+        )
+
+        # We already have the bar objects, so keep them
+        object.__setattr__(data, "_bars", sorted_bars)
+        return data
+
+    @classmethod
+    def from_arrays(
+            cls,
+            dates: NDArray[np.datetime64],
+            opens: NDArray[np.float64],
+            highs: NDArray[np.float64],
+            lows: NDArray[np.float64],
+            closes: NDArray[np.float64],
+            volumes: NDArray[np.float64],
+            ticker: str = "UNKNOWN",
+    ) -> "OHLCVData":
+        """
+        Construct OHLCVData from column arrays.
+
+        The columns must already satisfy the OHLCVBar invariants (see
+        OHLCVLoader.validate_dataframe); only the date order is enforced here.
+        """
+        n = len(dates)
+        if n < 2:
+            raise ValueError("Need at least 2 bars to compute returns")
+        if any(len(col) != n for col in (opens, highs, lows, closes, volumes)):
+            raise ValueError("All columns must have the same length")
+
+        dates = np.asarray(dates, dtype="datetime64[D]")
+        opens = np.asarray(opens, dtype=np.float64)
+        highs = np.asarray(highs, dtype=np.float64)
+        lows = np.asarray(lows, dtype=np.float64)
+        closes = np.asarray(closes, dtype=np.float64)
+        volumes = np.asarray(volumes, dtype=np.float64)
+
+        # Sort by date (stable, so same-day bars keep their input order)
+        if np.any(dates[1:] < dates[:-1]):
+            order = np.argsort(dates, kind="stable")
+            dates = dates[order]
+            opens = opens[order]
+            highs = highs[order]
+            lows = lows[order]
+            closes = closes[order]
+            volumes = volumes[order]
 
         # Log returns: ln(C[t] / C[t-1])
         log_returns = np.diff(np.log(closes))
 
         return cls(
-            bars=sorted_bars,
             ticker=ticker,
+            dates=dates,
             opens=opens,
             highs=highs,
             lows=lows,
@@ -82,8 +146,151 @@ class OHLCVData:
             log_returns=log_returns,
         )
 
+    @property
+    def bars(self) -> tuple[OHLCVBar, ...]:
+        """Bars as OHLCVBar objects (materialized on first access)."""
+        if self._bars is None:
+            bars = tuple(
+                OHLCVBar(date=d, open=o, high=h, low=l, close=c, volume=v)
+                for d, o, h, l, c, v in zip(
+                    self.dates.tolist(), self.opens.tolist(), self.highs.tolist(),
+                    self.lows.tolist(), self.closes.tolist(), self.volumes.tolist(),
+                )
+            )
+            object.__setattr__(self, "_bars", bars)
+        return self._bars
+
+    @property
+    def date_range(self) -> tuple[date, date]:
+        """First and last date in the dataset."""
+        return self.dates[0].item(), self.dates[-1].item()
+
+    def islice(self, start: Optional[int] = None, stop: Optional[int] = None) -> "OHLCVData":
+        """
+        Bars [start, stop) by position, as views over this dataset's arrays.
+
+        Negative indices count from the end, as with Python slices.
+        """
+        start, stop, _ = slice(start, stop).indices(len(self))
+        if stop - start < 2:
+            raise ValueError("Need at least 2 bars to compute returns")
+
+        return OHLCVData(
+            ticker=self.ticker,
+            dates=self.dates[start:stop],
+            opens=self.opens[start:stop],
+            highs=self.highs[start:stop],
+            lows=self.lows[start:stop],
+            closes=self.closes[start:stop],
+            volumes=self.volumes[start:stop],
+            # Return i is ln(C[i+1] / C[i]), so the window owns returns [start, stop - 1)
+            log_returns=self.log_returns[start:stop - 1],
+        )
+
+    def window(
+            self,
+            start: Optional[date | str | np.datetime64] = None,
+            end: Optional[date | str | np.datetime64] = None,
+    ) -> "OHLCVData":
+        """Bars dated within [start, end] (both inclusive), as views."""
+        i = 0
+        j = len(self)
+        if start is not None:
+            i = int(np.searchsorted(self.dates, np.datetime64(start, "D"), side="left"))
+        if end is not None:
+            j = int(np.searchsorted(self.dates, np.datetime64(end, "D"), side="right"))
+        return self.islice(i, j)
+
+    def tail(self, n: int) -> "OHLCVData":
+        """Last n bars, as views."""
+        return self.islice(max(0, len(self) - n), None)
+
+    def append(
+            self,
+            new: "Sequence[OHLCVBar] | Mapping[str, ArrayLike] | OHLCVData",
+    ) -> "OHLCVData":
+        """
+        Return a new dataset with bars added after the last date.
+
+        Args:
+            new: Bars to add, as OHLCVBar objects, another OHLCVData, or a
+                mapping of column arrays ("dates", "opens", "highs", "lows",
+                "closes" and optionally "volumes") that already satisfy the
+                OHLCVBar invariants
+
+        The result lives in a growable buffer with spare capacity. Appending
+        to the most recent result reuses that buffer, so each update costs
+        O(new bars), and only the new log returns are computed. This dataset
+        is left unchanged; appending to it a second time copies it instead.
+
+        Returns:
+            OHLCVData with the new bars
+        """
+        columns = _append_columns(new)
+        n_new = len(columns["dates"])
+        if n_new == 0:
+            return self
+
+        if np.any(columns["dates"][1:] < columns["dates"][:-1]):
+            order = np.argsort(columns["dates"], kind="stable")
+            columns = {name: values[order] for name, values in columns.items()}
+
+        if columns["dates"][0] <= self.dates[-1]:
+            raise ValueError(
+                f"Appended bars must start after {self.dates[-1]}, "
+                f"got {columns['dates'][0]}"
+            )
+
+        # Only the new returns: ln(C[t] / C[t-1]) chained from our last close
+        columns["log_returns"] = np.diff(
+            np.log(np.concatenate(([self.closes[-1]], columns["closes"])))
+        )
+
+        buffer = self._buffer
+        if buffer is None or len(buffer) != len(self):
+            # Not the newest version of the buffer (or no buffer yet): copy once
+            buffer = ColumnBuffer(_BUFFER_DTYPES, capacity=2 * (len(self) + n_new))
+            buffer.append({
+                "dates": self.dates,
+                "opens": self.opens,
+                "highs": self.highs,
+                "lows": self.lows,
+                "closes": self.closes,
+                "volumes": self.volumes,
+                # The buffer row for bar 0 has no return
+                "log_returns": np.concatenate(([np.nan], self.log_returns)),
+            })
+
+        buffer.append(columns)
+
+        views = buffer.columns()
+        data = OHLCVData(
+            ticker=self.ticker,
+            dates=views["dates"],
+            opens=views["opens"],
+            highs=views["highs"],
+            lows=views["lows"],
+            closes=views["closes"],
+            volumes=views["volumes"],
+            log_returns=views["log_returns"][1:],
+        )
+        object.__setattr__(data, "_buffer", buffer)
+        return data
+
     def __len__(self) -> int:
-        return len(self.bars)
+        return len(self.closes)
+
+    def __reduce__(self):
+        # Pickle (e.g. for worker processes) only the columns as plain arrays:
+        # no materialized bars, no spare buffer capacity, no memory maps
+        columns = tuple(
+            None if values is None else np.asarray(values)
+            for values in (
+                self.dates, self.opens, self.highs, self.lows,
+                self.closes, self.volumes, self.log_returns,
+            )
+        )
+        return (OHLCVData, (self.ticker, *columns))
 
     @property
     def n_returns(self) -> int:
@@ -91,6 +298,60 @@ class OHLCVData:
         return len(self.log_returns)
 
 
+_BUFFER_DTYPES = {
+    "dates": "datetime64[D]",
+    "opens": np.float64,
+    "highs": np.float64,
+    "lows": np.float64,
+    "closes": np.float64,
+    "volumes": np.float64,
+    "log_returns": np.float64,
+}
+
+
+def _append_columns(
+        new: "Sequence[OHLCVBar] | Mapping[str, ArrayLike] | OHLCVData",
+) -> dict[str, NDArray]:
+    """Normalize the argument of OHLCVData.append to column arrays."""
+    if isinstance(new, OHLCVData):
+        return {
+            "dates": new.dates,
+            "opens": new.opens,
+            "highs": new.highs,
+            "lows": new.lows,
+            "closes": new.closes,
+            "volumes": new.volumes,
+        }
+
+    if isinstance(new, Mapping):
+        missing = {"dates", "opens", "highs", "lows", "closes"} - set(new)
+        if missing:
+            raise ValueError(f"Missing columns to append: {missing}")
+        columns = {
+            "dates": np.asarray(new["dates"], dtype="datetime64[D]").ravel(),
+            **{
+                name: np.asarray(new[name], dtype=np.float64).ravel()
+                for name in ("opens", "highs", "lows", "closes")
+            },
+        }
+        if "volumes" in new:
+            columns["volumes"] = np.asarray(new["volumes"], dtype=np.float64).ravel()
+        else:
+            columns["volumes"] = np.zeros(len(columns["dates"]))
+        if any(len(values) != len(columns["dates"]) for values in columns.values()):
+            raise ValueError("All columns must have the same length")
+        return columns
+
+    return {
+        "dates": np.array([b.date for b in new], dtype="datetime64[D]"),
+        "opens": np.array([b.open for b in new], dtype=np.float64),
+        "highs": np.array([b.high for b in new], dtype=np.float64),
+        "lows": np.array([b.low for b in new], dtype=np.float64),
+        "closes": np.array([b.close for b in new], dtype=np.float64),
+        "volumes": np.array([b.volume for b in new], dtype=np.float64),
+    }
+
+
 @dataclass(frozen=True, slots=True)
 class ConfidenceInterval:
     """Confidence interval for a parameter estimate."""
@@ -171,6 +432,44 @@ class GARCHParameters:
     model_type: ModelType = field(default=ModelType.GARCH, repr=False)
 
 
+@dataclass(frozen=True, slots=True)
+class GJRGARCHParameters:
+    """
+    GJR-GARCH(1,1) parameters:
+    r[t] = μ + ε[t], ε[t] = √h[t]·z[t], z ~ N(0, 1) or standardized Student-t(ν)
+    h[t] = ω + (α + γ·1[ε[t-1] < 0])·ε[t-1]² + β·h[t-1]
+    """
+    mu: ParameterEstimate  # Mean return
+    omega: ParameterEstimate  # Constant term
+    alpha: ParameterEstimate  # ARCH coefficient
+    gamma: ParameterEstimate  # Extra ARCH coefficient after negative shocks
+    beta: ParameterEstimate  # GARCH coefficient
+    persistence: ParameterEstimate  # α + γ/2 + β
+    unconditional_var: ParameterEstimate  # ω / (1 - α - γ/2 - β)
+    nu: Optional[ParameterEstimate] = None  # Student-t degrees of freedom
+
+    model_type: ModelType = field(default=ModelType.GJR_GARCH, repr=False)
+
+
+@dataclass(frozen=True, slots=True)
+class EGARCHParameters:
+    """
+    EGARCH(1,1) parameters:
+    r[t] = μ + ε[t], ε[t] = √h[t]·z[t], z ~ N(0, 1) or standardized Student-t(ν)
+    ln h[t] = ω + α·(|z[t-1]| - √(2/π)) + γ·z[t-1] + β·ln h[t-1]
+    """
+    mu: ParameterEstimate  # Mean return
+    omega: ParameterEstimate  # Constant term (log-variance)
+    alpha: ParameterEstimate  # Magnitude effect
+    gamma: ParameterEstimate  # Sign (leverage) effect
+    beta: ParameterEstimate  # Log-variance persistence
+    persistence: ParameterEstimate  # β
+    unconditional_var: ParameterEstimate  # exp(ω / (1 - β)), the geometric mean of h
+    nu: Optional[ParameterEstimate] = None  # Student-t degrees of freedom
+
+    model_type: ModelType = field(default=ModelType.EGARCH, repr=False)
+
+
 @dataclass(frozen=True, slots=True)
 class RegimeParameters:
     """Parameters for a single regime."""
@@ -217,6 +516,8 @@ class CalibrationResult:
     garch: Optional[GARCHParameters] = None
     regime_switching: Optional[RegimeSwitchingParameters] = None
     block_bootstrap: Optional[BlockBootstrapParameters] = None
+    gjr_garch: Optional[GJRGARCHParameters] = None
+    egarch: Optional[EGARCHParameters] = None
 
     warnings: list[str] = field(default_factory=list)
 
@@ -277,4 +578,19 @@ class CalibrationResult:
                 "decorrelation_lag": self.block_bootstrap.decorrelation_lag.to_dict(),
             }
 
+        for name, params in (("gjr_garch", self.gjr_garch), ("egarch", self.egarch)):
+            if params:
+                result["models"][name] = {
+                    "mu": params.mu.to_dict(),
+                    "omega": params.omega.to_dict(),
+                    "alpha": params.alpha.to_dict(),
+                    "gamma": params.gamma.to_dict(),
+                    "beta": params.beta.to_dict(),
+                    "persistence": params.persistence.to_dict(),
+                    "unconditional_var": params.unconditional_var.to_dict(),
+                    "innovations": "normal" if params.nu is None else "student_t",
+                }
+                if params.nu is not None:
+                    result["models"][name]["nu"] = params.nu.to_dict()
+
         return result
@@ -4,6 +4,7 @@ from .base import BaseEstimator, EstimatorConfig
 from .gbm import GBMEstimator
 from .heston import HestonEstimator
 from .garch import GARCHEstimator
+from .garch_family import GJRGARCHEstimator, EGARCHEstimator
 from .regime import RegimeSwitchingEstimator
 from .bootstrap import BlockBootstrapEstimator
 
@@ -13,6 +14,8 @@ __all__ = [
     "GBMEstimator",
     "HestonEstimator",
     "GARCHEstimator",
+    "GJRGARCHEstimator",
+    "EGARCHEstimator",
     "RegimeSwitchingEstimator",
     "BlockBootstrapEstimator",
 ]
@@ -4,7 +4,10 @@ from abc import ABC, abstractmethod
 from dataclasses import dataclass
 from typing import Generic, TypeVar
 
+import numpy as np
+
 from ..data.types import OHLCVData
+from ..math.features import FeatureCache
 
 T = TypeVar("T")  # Parameter type
 
@@ -27,6 +30,10 @@ class EstimatorConfig:
     # Model-specific
     n_regimes: int = 2  # For regime-switching
 
+    # Randomness (bootstrap resampling, EM restarts); each estimate starts
+    # from this seed, so results do not depend on what ran before
+    random_seed: int = 0
+
 
 class BaseEstimator(ABC, Generic[T]):
     """
@@ -40,12 +47,13 @@ class BaseEstimator(ABC, Generic[T]):
         self._warnings: list[str] = []
 
     @abstractmethod
-    def estimate(self, data: OHLCVData) -> T:
+    def estimate(self, data: OHLCVData, features: FeatureCache | None = None) -> T:
         """
         Estimate model parameters from OHLCV data.
 
         Args:
             data: OHLCV data to calibrate from
+            features: Feature cache of `data`, shared with other estimators
 
         Returns:
             Model-specific parameter object with uncertainty estimates
@@ -64,3 +72,7 @@ class BaseEstimator(ABC, Generic[T]):
     def _clear_warnings(self) -> None:
         """Clear all warnings."""
         self._warnings.clear()
+
+    def _rng(self, offset: int = 0) -> np.random.RandomState:
+        """Fresh random state seeded from the config (plus an optional offset)."""
+        return np.random.RandomState(self.config.random_seed + offset)
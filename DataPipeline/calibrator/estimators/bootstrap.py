@@ -24,10 +24,10 @@ from ..data.types import (
     ParameterEstimate,
 )
 from ..math.statistics import (
-    autocorrelation,
     find_decorrelation_lag,
     bootstrap_statistic,
 )
+from ..math.features import FeatureCache, feature_cache
 from .base import BaseEstimator, EstimatorConfig
 
 
@@ -52,9 +52,10 @@ class BlockBootstrapEstimator(BaseEstimator[BlockBootstrapParameters]):
         self.use_squared_returns = use_squared_returns
         self.significance_level = significance_level
 
-    def estimate(self, data: OHLCVData) -> BlockBootstrapParameters:
+    def estimate(self, data: OHLCVData, features: FeatureCache | None = None) -> BlockBootstrapParameters:
         """Estimate optimal block size from OHLCV data."""
         self._clear_warnings()
+        features = feature_cache(data, features)
 
         returns = data.log_returns
         n = len(returns)
@@ -65,19 +66,21 @@ class BlockBootstrapEstimator(BaseEstimator[BlockBootstrapParameters]):
             )
 
         # Use squared returns for volatility dynamics (captures clustering)
+        acf_series = "squared_returns" if self.use_squared_returns else "log_returns"
         if self.use_squared_returns:
-            series_for_acf = returns ** 2
+            series_for_acf = features.get("squared_returns")
         else:
             series_for_acf = returns
 
         # Method 1: ACF-based decorrelation lag
         max_lag = min(n // 4, 100)
-        acf = autocorrelation(series_for_acf, max_lag)
+        acf = features.acf(acf_series, max_lag)
 
         decorr_lag = find_decorrelation_lag(
             series_for_acf,
             significance_level=self.significance_level,
             max_lag=max_lag,
+            acf=acf,
         )
 
         # Politis & White (2004) recommendation: block_size ≈ 2 × decorrelation_lag
@@ -115,6 +118,7 @@ class BlockBootstrapEstimator(BaseEstimator[BlockBootstrapParameters]):
             n_bootstrap=min(self.config.n_bootstrap, 500),
             confidence_level=self.config.confidence_level,
             block_size=max(5, block_size // 2),  # Use smaller blocks for bootstrap
+            rng=self._rng(),
         )
 
         # Clamp CI bounds
@@ -174,6 +178,7 @@ class BlockBootstrapEstimator(BaseEstimator[BlockBootstrapParameters]):
 
         results = {}
         fold_size = n // (n_splits + 1)
+        rng = self._rng()
 
         for block_size in candidate_sizes:
             mse_values = []
@@ -197,7 +202,7 @@ class BlockBootstrapEstimator(BaseEstimator[BlockBootstrapParameters]):
                     n_blocks = (n_train + block_size - 1) // block_size
                     indices = []
                     for _ in range(n_blocks):
-                        start = np.random.randint(0, n_train - block_size + 1)
+                        start = rng.randint(0, n_train - block_size + 1)
                         indices.extend(range(start, start + block_size))
                     sample = train_returns[np.array(indices[:n_train])]
                     bootstrap_vars.append(np.var(sample))
@@ -20,6 +20,8 @@ Derived:
     unconditional_var = ω / (1 - α - β)
 """
 
+from typing import Sequence
+
 import numpy as np
 from scipy import stats
 from scipy.optimize import minimize
@@ -30,9 +32,14 @@ from ..data.types import (
     OHLCVData,
     ParameterEstimate,
 )
-from ..math.statistics import hessian_numerical, confidence_interval_from_hessian
+from ..math.features import FeatureCache, feature_cache
+from ..math.garch import fit_garch_batch, garch_hessian_and_opg, garch_neg_log_likelihood_and_grad
+from ..math.statistics import confidence_interval_from_covariance, sandwich_covariance
 from .base import BaseEstimator, EstimatorConfig
 
+# Series fitted together by GARCHEstimator.estimate_batch
+DEFAULT_BATCH_SIZE = 256
+
 
 class GARCHEstimator(BaseEstimator[GARCHParameters]):
     """
@@ -49,11 +56,23 @@ class GARCHEstimator(BaseEstimator[GARCHParameters]):
         super().__init__(config)
         self.use_robust_se = use_robust_se
 
-    def estimate(self, data: OHLCVData) -> GARCHParameters:
-        """Estimate GARCH(1,1) parameters via MLE."""
+    def estimate(
+            self,
+            data: OHLCVData,
+            features: FeatureCache | None = None,
+            initial_params: tuple[float, float, float] | None = None,
+    ) -> GARCHParameters:
+        """
+        Estimate GARCH(1,1) parameters via MLE.
+
+        initial_params: Starting point (ω, α, β) for the optimizer, e.g. the
+            solution on an overlapping window; defaults to a generic guess.
+        """
         self._clear_warnings()
+        features = feature_cache(data, features)
 
         returns = data.log_returns
+        squared_returns = features.get("squared_returns")
         n = len(returns)
 
         if n < 100:
@@ -62,8 +81,8 @@ class GARCHEstimator(BaseEstimator[GARCHParameters]):
             )
 
         # Sample statistics for initialization
-        sample_var = float(np.var(returns, ddof=1))
-        sample_mean = float(np.mean(returns))
+        sample_var = features.get("returns_var")
+        sample_mean = features.get("returns_mean")
 
         # Initial parameter guesses
         # Start with moderate persistence
@@ -71,39 +90,110 @@ class GARCHEstimator(BaseEstimator[GARCHParameters]):
         alpha0 = 0.08
         beta0 = 0.85
 
-        # Define negative log-likelihood
-        def neg_log_likelihood(params: np.ndarray) -> float:
-            omega, alpha, beta = params
+        if initial_params is not None:
+            omega0, alpha0, beta0 = initial_params
 
-            # Check constraints
-            if omega <= 0 or alpha < 0 or beta < 0 or alpha + beta >= 1:
-                return 1e10
+        # h[0] = sample variance, i.e. the unconditional variance.
+        # ω is optimized in units of the sample variance so that all three
+        # parameters, and their gradients, are of order one; otherwise
+        # L-BFGS-B only ever moves ω
+        scale = np.array([sample_var, 1.0, 1.0])
 
-            h = np.zeros(n)
-            h[0] = sample_var  # Initialize with unconditional variance
-
-            log_lik = 0.0
-            for t in range(1, n):
-                h[t] = omega + alpha * returns[t - 1] ** 2 + beta * h[t - 1]
-                if h[t] <= 0:
-                    return 1e10
-                log_lik += np.log(h[t]) + returns[t] ** 2 / h[t]
-
-            return 0.5 * log_lik
+        def objective(x: np.ndarray) -> tuple[float, np.ndarray]:
+            nll, grad = garch_neg_log_likelihood_and_grad(x * scale, squared_returns, sample_var)
+            return nll, grad * scale
 
         # Optimize
         result = minimize(
-            neg_log_likelihood,
-            x0=np.array([omega0, alpha0, beta0]),
+            objective,
+            x0=np.array([omega0, alpha0, beta0]) / scale,
+            jac=True,
             method='L-BFGS-B',
-            bounds=[(1e-10, None), (0, 0.999), (0, 0.999)],
+            bounds=[(1e-10 / sample_var, None), (0, 0.999), (0, 0.999)],
             options={'maxiter': self.config.max_iterations},
         )
+        params = result.x * scale
 
         if not result.success:
             self._add_warning(f"Optimization did not converge: {result.message}")
 
-        omega, alpha, beta = result.x
+        hess, opg = garch_hessian_and_opg(params, squared_returns, sample_var)
+        return self._build_parameters(params, hess, opg, sample_mean, sample_var, n)
+
+    def estimate_batch(
+            self,
+            datasets: Sequence[OHLCVData],
+            features: Sequence[FeatureCache] | None = None,
+            batch_size: int = DEFAULT_BATCH_SIZE,
+    ) -> list[GARCHParameters]:
+        """
+        Estimate GARCH(1,1) parameters of many same-length datasets at once.
+
+        The series are stacked into a (time x series) array and fitted
+        together by fit_garch_batch, batch_size series at a time, so the
+        optimizer's per-call overhead is paid once per batch instead of once
+        per ticker. The likelihood, bounds and standard errors are those of
+        estimate(); warnings are prefixed with the ticker.
+
+        Args:
+            datasets: Data to estimate from, all with the same number of bars
+            features: Feature caches of the datasets, in the same order
+            batch_size: Series fitted together (bounds memory use)
+
+        Returns:
+            GARCHParameters, one per dataset, in input order
+        """
+        self._clear_warnings()
+        datasets = list(datasets)
+        if not datasets:
+            return []
+        if len({len(data) for data in datasets}) > 1:
+            raise ValueError("Batched GARCH estimation needs datasets of the same length")
+
+        if features is None:
+            features = [FeatureCache(data) for data in datasets]
+        else:
+            features = [feature_cache(data, f) for data, f in zip(datasets, features, strict=True)]
+
+        results = []
+        for start in range(0, len(datasets), batch_size):
+            chunk = slice(start, start + batch_size)
+            squared_returns = np.column_stack([f.get("squared_returns") for f in features[chunk]])
+            sample_var = np.array([f.get("returns_var") for f in features[chunk]])
+
+            fit = fit_garch_batch(squared_returns, sample_var, max_iter=self.config.max_iterations)
+
+            for i, (data, f) in enumerate(zip(datasets[chunk], features[chunk])):
+                first_warning = len(self._warnings)
+                n = data.n_returns
+                if n < 100:
+                    self._add_warning(
+                        "Less than 100 observations - GARCH estimates may be unstable"
+                    )
+                if not fit.converged[i]:
+                    self._add_warning("Optimization did not converge: iteration limit reached")
+
+                results.append(self._build_parameters(
+                    fit.params[i], fit.hessian[i], fit.opg[i],
+                    f.get("returns_mean"), sample_var[i], n,
+                ))
+                self._warnings[first_warning:] = [
+                    f"{data.ticker}: {warning}" for warning in self._warnings[first_warning:]
+                ]
+
+        return results
+
+    def _build_parameters(
+            self,
+            params: np.ndarray,
+            hess: np.ndarray,
+            opg: np.ndarray,
+            sample_mean: float,
+            sample_var: float,
+            n: int,
+    ) -> GARCHParameters:
+        """GARCHParameters with standard errors, from fitted (ω, α, β)."""
+        omega, alpha, beta = params
 
         # Ensure constraints are satisfied
         if alpha + beta >= 1:
@@ -116,28 +206,23 @@ class GARCHEstimator(BaseEstimator[GARCHParameters]):
         persistence = alpha + beta
         unconditional_var = omega / (1 - persistence) if persistence < 1 else sample_var
 
-        # Compute standard errors from Hessian
-        hess = hessian_numerical(neg_log_likelihood, result.x)
+        # Standard errors from the analytic Hessian (and score outer product)
+        cov_matrix = self._covariance(hess, opg)
 
-        # Scale Hessian (it's for negative log-likelihood)
-        se_omega, ci_omega_l, ci_omega_u = confidence_interval_from_hessian(
-            hess, 0, self.config.confidence_level, omega
+        se_omega, ci_omega_l, ci_omega_u = confidence_interval_from_covariance(
+            cov_matrix, 0, self.config.confidence_level, omega
         )
-        se_alpha, ci_alpha_l, ci_alpha_u = confidence_interval_from_hessian(
-            hess, 1, self.config.confidence_level, alpha
+        se_alpha, ci_alpha_l, ci_alpha_u = confidence_interval_from_covariance(
+            cov_matrix, 1, self.config.confidence_level, alpha
         )
-        se_beta, ci_beta_l, ci_beta_u = confidence_interval_from_hessian(
-            hess, 2, self.config.confidence_level, beta
+        se_beta, ci_beta_l, ci_beta_u = confidence_interval_from_covariance(
+            cov_matrix, 2, self.config.confidence_level, beta
         )
 
         # Standard error for persistence (delta method)
         if not np.isnan(se_alpha) and not np.isnan(se_beta):
-            try:
-                cov_matrix = np.linalg.inv(hess)
-                var_persistence = cov_matrix[1, 1] + cov_matrix[2, 2] + 2 * cov_matrix[1, 2]
-                se_persistence = np.sqrt(max(0, var_persistence))
-            except np.linalg.LinAlgError:
-                se_persistence = np.nan
+            var_persistence = cov_matrix[1, 1] + cov_matrix[2, 2] + 2 * cov_matrix[1, 2]
+            se_persistence = np.sqrt(max(0, var_persistence))
         else:
             se_persistence = np.nan
 
@@ -145,17 +230,13 @@ class GARCHEstimator(BaseEstimator[GARCHParameters]):
         if persistence < 1 and not np.isnan(se_omega) and not np.isnan(se_persistence):
             # ∂(ω/(1-α-β))/∂ω = 1/(1-α-β)
             # ∂(ω/(1-α-β))/∂(α+β) = ω/(1-α-β)²
-            try:
-                cov_matrix = np.linalg.inv(hess)
-                grad = np.array([
-                    1 / (1 - persistence),
-                    omega / (1 - persistence) ** 2,
-                    omega / (1 - persistence) ** 2,
-                ])
-                var_uncond = grad @ cov_matrix @ grad
-                se_uncond_var = np.sqrt(max(0, var_uncond))
-            except (np.linalg.LinAlgError, ValueError):
-                se_uncond_var = np.nan
+            grad = np.array([
+                1 / (1 - persistence),
+                omega / (1 - persistence) ** 2,
+                omega / (1 - persistence) ** 2,
+            ])
+            var_uncond = grad @ cov_matrix @ grad
+            se_uncond_var = np.sqrt(max(0, var_uncond))
         else:
             se_uncond_var = np.nan
 
@@ -189,3 +270,11 @@ class GARCHEstimator(BaseEstimator[GARCHParameters]):
             persistence=make_estimate("persistence", persistence, se_persistence),
             unconditional_var=make_estimate("unconditional_var", unconditional_var, se_uncond_var),
         )
+
+    def _covariance(self, hess: np.ndarray, opg: np.ndarray) -> np.ndarray:
+        """
+        Parameter covariance: the Bollerslev-Wooldridge sandwich H⁻¹·OPG·H⁻¹,
+        valid for non-normal innovations, or H⁻¹ with use_robust_se off.
+        NaN where the Hessian is singular.
+        """
+        return sandwich_covariance(hess, opg if self.use_robust_se else None)
@@ -0,0 +1,404 @@
+"""
+Asymmetric GARCH parameter estimators (GJR-GARCH, EGARCH) using Maximum
+Likelihood, with Gaussian or Student-t innovations.
+
+Models:
+    r[t] = μ + ε[t], where ε[t] = √h[t]·z[t]
+    GJR-GARCH:  h[t] = ω + (α + γ·1[ε[t-1] < 0])·ε[t-1]² + β·h[t-1]
+    EGARCH:     ln h[t] = ω + α·(|z[t-1]| - √(2/π)) + γ·z[t-1] + β·ln h[t-1]
+
+    z[t] ~ N(0, 1), or Student-t with ν degrees of freedom scaled to unit
+    variance
+
+Parameters:
+    μ: Mean return
+    ω, α, β: As in GARCH(1,1); for EGARCH on the log-variance scale
+    γ (gamma): Asymmetry; negative returns raise volatility more than
+        positive ones when γ > 0 (GJR) or γ < 0 (EGARCH)
+    ν (nu): Degrees of freedom of Student-t innovations (> 2)
+
+Derived:
+    GJR-GARCH: persistence = α + γ/2 + β, unconditional_var = ω / (1 - persistence)
+    EGARCH: persistence = β, unconditional_var = exp(ω / (1 - β))
+
+As in GARCHEstimator, the variance equations run on the log returns and μ
+is their sample mean.
+"""
+
+from abc import abstractmethod
+from typing import Sequence
+
+import numpy as np
+from scipy import stats
+from scipy.optimize import minimize
+
+from ..data.types import (
+    ConfidenceInterval,
+    EGARCHParameters,
+    GJRGARCHParameters,
+    OHLCVData,
+    ParameterEstimate,
+)
+from ..math.features import FeatureCache, feature_cache
+from ..math.garch import MAX_PERSISTENCE
+from ..math.garch_family import (
+    INNOVATIONS,
+    garch_family_neg_log_likelihood_and_grad,
+    garch_family_scores,
+    gjr_hessian_and_opg,
+)
+from ..math.statistics import (
+    confidence_interval_from_covariance,
+    jacobian_numerical,
+    sandwich_covariance,
+)
+from .base import BaseEstimator, EstimatorConfig, T
+
+# Starting point and bounds of the Student-t degrees of freedom
+_NU_START = 8.0
+_NU_BOUNDS = (2.05, 500.0)
+
+# SLSQP stopping tolerance on the NLL; its default (1e-6) stops early on
+# nearly flat likelihoods such as those of i.i.d. returns
+_FTOL = 1e-9
+
+
+class _GARCHFamilyEstimator(BaseEstimator[T]):
+    """
+    Shared quasi-maximum likelihood fit of the asymmetric GARCH models.
+
+    Subclasses set the variance equation and turn the fitted parameter
+    vector (ω, α, γ, β[, ν]) into their parameter type.
+    """
+
+    variance: str  # variance equation in math.garch_family
+    label: str  # used in warnings
+
+    def __init__(
+            self,
+            config: EstimatorConfig | None = None,
+            innovations: str = "student_t",
+            use_robust_se: bool = True,
+    ):
+        """
+        Args:
+            config: Estimator configuration
+            innovations: "normal" or "student_t"
+            use_robust_se: Bollerslev-Wooldridge sandwich standard errors
+                instead of the inverse Hessian
+        """
+        super().__init__(config)
+        if innovations not in INNOVATIONS:
+            raise ValueError(f"Unknown innovations: {innovations!r} (expected one of {INNOVATIONS})")
+        self.innovations = innovations
+        self.use_robust_se = use_robust_se
+
+    @property
+    def student_t(self) -> bool:
+        return self.innovations == "student_t"
+
+    def estimate(
+            self,
+            data: OHLCVData,
+            features: FeatureCache | None = None,
+            initial_params: Sequence[float] | None = None,
+    ) -> T:
+        """
+        Estimate parameters via MLE.
+
+        initial_params: Starting point (ω, α, γ, β[, ν]) for the optimizer,
+            e.g. the solution on an overlapping window; defaults to a
+            generic guess.
+        """
+        self._clear_warnings()
+        features = feature_cache(data, features)
+
+        returns = data.log_returns
+        n = len(returns)
+
+        if n < 100:
+            self._add_warning(
+                f"Less than 100 observations - {self.label} estimates may be unstable"
+            )
+
+        sample_var = features.get("returns_var")
+        sample_mean = features.get("returns_mean")
+
+        params0 = self._initial_params(sample_var) if initial_params is None else list(initial_params)
+        if self.student_t and len(params0) == 4:
+            params0.append(_NU_START)
+        params0 = np.array(params0[:5 if self.student_t else 4], dtype=float)
+
+        # The optimizer works on ω in units of its typical size and on 1/ν,
+        # which keeps all variables of order one and turns the Gaussian limit
+        # ν → ∞ into the bound 1/ν → 0; with ν itself the likelihood is so
+        # flat in ν that L-BFGS-B stops far from the optimum
+        scale = np.ones(len(params0))
+        scale[0] = self._omega_scale(sample_var)
+        bounds = [
+            tuple(None if b is None else b / s for b in bound)
+            for bound, s in zip(self._bounds(sample_var), scale)
+        ]
+        if self.student_t:
+            bounds.append((1 / _NU_BOUNDS[1], 1 / _NU_BOUNDS[0]))
+
+        def objective(x: np.ndarray) -> tuple[float, np.ndarray]:
+            nll, grad = garch_family_neg_log_likelihood_and_grad(
+                self.variance, self.innovations, self._to_params(x, scale), returns, sample_var
+            )
+            return nll, grad * self._params_derivative(x, scale)
+
+        # SLSQP rather than L-BFGS-B: GJR-GARCH's admissible region is not a
+        # box, and L-BFGS-B stalls against its walls
+        result = minimize(
+            objective,
+            x0=self._to_variables(params0, scale),
+            jac=True,
+            method='SLSQP',
+            bounds=bounds,
+            constraints=self._constraints(len(params0)),
+            options={'maxiter': self.config.max_iterations, 'ftol': _FTOL},
+        )
+        params = self._to_params(result.x, scale)
+
+        if not result.success:
+            self._add_warning(f"Optimization did not converge: {result.message}")
+
+        cov_matrix = self._covariance(result.x, scale, returns, sample_var)
+        return self._build_parameters(params, cov_matrix, sample_mean, sample_var, n)
+
+    def _to_params(self, x: np.ndarray, scale: np.ndarray) -> np.ndarray:
+        """(ω, α, γ, β[, ν]) from optimizer variables."""
+        params = x * scale
+        if self.student_t:
+            params[4] = 1 / x[4]
+        return params
+
+    def _to_variables(self, params: np.ndarray, scale: np.ndarray) -> np.ndarray:
+        """Optimizer variables from (ω, α, γ, β[, ν])."""
+        x = params / scale
+        if self.student_t:
+            x[4] = 1 / params[4]
+        return x
+
+    def _params_derivative(self, x: np.ndarray, scale: np.ndarray) -> np.ndarray:
+        """Diagonal of ∂params/∂x."""
+        d = scale.copy()
+        if self.student_t:
+            d[4] = -1 / x[4] ** 2
+        return d
+
+    def _covariance(
+            self,
+            x: np.ndarray,
+            scale: np.ndarray,
+            returns: np.ndarray,
+            sample_var: float,
+    ) -> np.ndarray:
+        """
+        Parameter covariance at the optimum x (in optimizer variables).
+
+        This default, used by EGARCH, takes the Hessian numerically, as the
+        central-difference Jacobian of the analytic gradient; the scores give
+        the OPG of the sandwich, both in the optimizer variables, and the
+        delta method maps the result back. GJR-GARCH overrides it with the
+        analytic Hessian.
+        """
+        def scores(x: np.ndarray) -> np.ndarray:
+            _, s = garch_family_scores(
+                self.variance, self.innovations, self._to_params(x, scale), returns, sample_var
+            )
+            return s * self._params_derivative(x, scale)[:, None]
+
+        hess = jacobian_numerical(lambda x: scores(x).sum(axis=1), x)
+        hess = (hess + hess.T) / 2
+
+        s = scores(x)
+        cov_x = sandwich_covariance(hess, s @ s.T if self.use_robust_se else None)
+
+        d = self._params_derivative(x, scale)
+        return cov_x * np.outer(d, d)
+
+    def _common_estimates(
+            self,
+            params: np.ndarray,
+            cov_matrix: np.ndarray,
+            sample_mean: float,
+            sample_var: float,
+            n: int,
+    ) -> dict[str, ParameterEstimate | None]:
+        """μ, the variance equation coefficients and ν as ParameterEstimates."""
+        estimates: dict[str, ParameterEstimate | None] = {}
+        for i, name in enumerate(("omega", "alpha", "gamma", "beta")):
+            se, ci_l, ci_u = confidence_interval_from_covariance(
+                cov_matrix, i, self.config.confidence_level, params[i]
+            )
+            estimates[name] = self._make_estimate(name, params[i], se, ci_l, ci_u)
+
+        estimates["nu"] = None
+        if self.student_t:
+            se, ci_l, ci_u = confidence_interval_from_covariance(
+                cov_matrix, 4, self.config.confidence_level, params[4]
+            )
+            estimates["nu"] = self._make_estimate("nu", params[4], se, max(_NU_BOUNDS[0], ci_l), ci_u)
+
+        # Mean return (estimated separately)
+        mu = sample_mean * self.config.trading_days_per_year
+        se_mu = np.sqrt(sample_var / n) * self.config.trading_days_per_year
+        estimates["mu"] = self._make_estimate("mu", mu, se_mu)
+
+        return estimates
+
+    def _derived_estimate(
+            self,
+            name: str,
+            value: float,
+            grad: np.ndarray,
+            cov_matrix: np.ndarray,
+    ) -> ParameterEstimate:
+        """Estimate of a function of (ω, α, γ, β) with its delta-method standard error."""
+        grad = np.concatenate([grad, np.zeros(len(cov_matrix) - len(grad))])
+        var = grad @ cov_matrix @ grad
+        se = np.sqrt(max(0, var)) if np.isfinite(var) else np.nan
+        return self._make_estimate(name, value, se)
+
+    def _make_estimate(
+            self,
+            name: str,
+            value: float,
+            se: float,
+            ci_l: float | None = None,
+            ci_u: float | None = None,
+    ) -> ParameterEstimate:
+        value = float(value)
+        if np.isnan(se) or se <= 0:
+            return ParameterEstimate(name=name, value=value)
+
+        z = stats.norm.ppf(1 - (1 - self.config.confidence_level) / 2)
+        ci = ConfidenceInterval(
+            lower=value - z * se if ci_l is None else ci_l,
+            upper=value + z * se if ci_u is None else ci_u,
+            confidence_level=self.config.confidence_level,
+        )
+        return ParameterEstimate(name=name, value=value, std_error=float(se), ci=ci)
+
+    @abstractmethod
+    def _initial_params(self, sample_var: float) -> list[float]:
+        """Default starting point (ω, α, γ, β) of the optimizer."""
+        pass
+
+    @abstractmethod
+    def _omega_scale(self, sample_var: float) -> float:
+        """Typical size of ω, its unit in the optimizer variables."""
+        pass
+
+    @abstractmethod
+    def _bounds(self, sample_var: float) -> list[tuple[float | None, float | None]]:
+        """Bounds on (ω, α, γ, β)."""
+        pass
+
+    def _constraints(self, n_params: int) -> list[dict]:
+        """Linear inequality constraints on the optimizer variables, beyond the bounds."""
+        return []
+
+    @abstractmethod
+    def _build_parameters(self, params, cov_matrix, sample_mean, sample_var, n) -> T:
+        """The model's parameter type from fitted (ω, α, γ, β[, ν]) and their covariance."""
+        pass
+
+
+class GJRGARCHEstimator(_GARCHFamilyEstimator[GJRGARCHParameters]):
+    """
+    GJR-GARCH(1,1) estimator using (quasi-)maximum likelihood.
+
+    The variance recursion is linear in h and runs on the GARCH(1,1) filter,
+    which also gives the analytic Hessian for the standard errors.
+    """
+
+    variance = "gjr"
+    label = "GJR-GARCH"
+
+    def _initial_params(self, sample_var: float) -> list[float]:
+        # Moderate persistence, unconditional variance at the sample variance
+        alpha, gamma, beta = 0.03, 0.06, 0.90
+        return [sample_var * (1 - alpha - gamma / 2 - beta), alpha, gamma, beta]
+
+    def _omega_scale(self, sample_var: float) -> float:
+        return sample_var
+
+    def _bounds(self, sample_var: float) -> list[tuple[float | None, float | None]]:
+        return [(1e-10, None), (0, 0.999), (-0.999, 0.999), (0, 0.999)]
+
+    def _constraints(self, n_params: int) -> list[dict]:
+        # α + γ ≥ 0 and α + γ/2 + β ≤ MAX_PERSISTENCE, as A·x + b ≥ 0
+        A = np.zeros((2, n_params))
+        A[0, 1:3] = (1.0, 1.0)
+        A[1, 1:4] = (-1.0, -0.5, -1.0)
+        b = np.array([0.0, MAX_PERSISTENCE])
+        return [{"type": "ineq", "fun": lambda x: A @ x + b, "jac": lambda x: A}]
+
+    def _covariance(
+            self,
+            x: np.ndarray,
+            scale: np.ndarray,
+            returns: np.ndarray,
+            sample_var: float,
+    ) -> np.ndarray:
+        """
+        Parameter covariance at the optimum x, from the analytic Hessian and
+        score outer product of gjr_hessian_and_opg, as for GARCH(1,1).
+        """
+        hess, opg = gjr_hessian_and_opg(self.innovations, self._to_params(x, scale), returns, sample_var)
+        return sandwich_covariance(hess, opg if self.use_robust_se else None)
+
+    def _build_parameters(self, params, cov_matrix, sample_mean, sample_var, n) -> GJRGARCHParameters:
+        omega, alpha, gamma, beta = params[:4]
+        persistence = alpha + gamma / 2 + beta
+        unconditional_var = omega / (1 - persistence)
+
+        # ∂persistence/∂(ω, α, γ, β), and of ω / (1 - persistence) by the quotient rule
+        d_persistence = np.array([0.0, 1.0, 0.5, 1.0])
+        d_uncond = np.array([1 / (1 - persistence), 0.0, 0.0, 0.0]) + d_persistence * omega / (1 - persistence) ** 2
+
+        return GJRGARCHParameters(
+            **self._common_estimates(params, cov_matrix, sample_mean, sample_var, n),
+            persistence=self._derived_estimate("persistence", persistence, d_persistence, cov_matrix),
+            unconditional_var=self._derived_estimate("unconditional_var", unconditional_var, d_uncond, cov_matrix),
+        )
+
+
+class EGARCHEstimator(_GARCHFamilyEstimator[EGARCHParameters]):
+    """
+    EGARCH(1,1) estimator using (quasi-)maximum likelihood.
+
+    The recursion is nonlinear in h and runs step by step, so a fit takes
+    several times as long as a GJR-GARCH fit. Standard errors use a
+    numerical Hessian (differences of the analytic gradient).
+    """
+
+    variance = "egarch"
+    label = "EGARCH"
+
+    def _initial_params(self, sample_var: float) -> list[float]:
+        # Moderate persistence, mean log-variance at the log sample variance
+        alpha, gamma, beta = 0.10, -0.05, 0.95
+        return [np.log(sample_var) * (1 - beta), alpha, gamma, beta]
+
+    def _omega_scale(self, sample_var: float) -> float:
+        return 1.0
+
+    def _bounds(self, sample_var: float) -> list[tuple[float | None, float | None]]:
+        return [(None, None), (-2.0, 2.0), (-2.0, 2.0), (-0.999, 0.999)]
+
+    def _build_parameters(self, params, cov_matrix, sample_mean, sample_var, n) -> EGARCHParameters:
+        omega, _, _, beta = params[:4]
+        unconditional_var = np.exp(omega / (1 - beta))
+
+        d_persistence = np.array([0.0, 0.0, 0.0, 1.0])
+        d_uncond = unconditional_var * np.array([1 / (1 - beta), 0.0, 0.0, omega / (1 - beta) ** 2])
+
+        return EGARCHParameters(
+            **self._common_estimates(params, cov_matrix, sample_mean, sample_var, n),
+            persistence=self._derived_estimate("persistence", beta, d_persistence, cov_matrix),
+            unconditional_var=self._derived_estimate("unconditional_var", unconditional_var, d_uncond, cov_matrix),
+        )
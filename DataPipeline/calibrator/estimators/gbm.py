@@ -22,6 +22,7 @@ from ..math.volatility import (
     estimate_volatility,
     close_to_close_variance,
 )
+from ..math.features import FeatureCache, feature_cache
 from .base import BaseEstimator, EstimatorConfig
 
 
@@ -42,9 +43,10 @@ class GBMEstimator(BaseEstimator[GBMParameters]):
         super().__init__(config)
         self.volatility_method = volatility_method
 
-    def estimate(self, data: OHLCVData) -> GBMParameters:
+    def estimate(self, data: OHLCVData, features: FeatureCache | None = None) -> GBMParameters:
         """Estimate GBM parameters from OHLCV data."""
         self._clear_warnings()
+        features = feature_cache(data, features)
 
         n = data.n_returns
         dt = 1.0 / self.config.trading_days_per_year
@@ -54,6 +56,7 @@ class GBMEstimator(BaseEstimator[GBMParameters]):
             data,
             self.volatility_method,
             self.config.trading_days_per_year,
+            features,
         )
 
         sigma_annual = vol_estimate.annualized_volatility
@@ -61,7 +64,7 @@ class GBMEstimator(BaseEstimator[GBMParameters]):
 
         # Estimate drift from sample mean of log returns
         # μ = E[r] / dt + 0.5 * σ² (converting from log-return to drift)
-        mean_log_return = float(np.mean(data.log_returns))
+        mean_log_return = features.get("returns_mean")
         mu_annual = mean_log_return * self.config.trading_days_per_year + 0.5 * sigma_annual ** 2
 
         # Standard errors
@@ -31,7 +31,7 @@ from ..data.types import (
     OHLCVData,
     ParameterEstimate,
 )
-from ..math.volatility import parkinson_variance
+from ..math.features import FeatureCache, feature_cache
 from ..math.statistics import linear_regression, correlation, bootstrap_statistic
 from .base import BaseEstimator, EstimatorConfig
 
@@ -54,9 +54,10 @@ class HestonEstimator(BaseEstimator[HestonParameters]):
         self.variance_window = variance_window
         self.v0_window = v0_window
 
-    def estimate(self, data: OHLCVData) -> HestonParameters:
+    def estimate(self, data: OHLCVData, features: FeatureCache | None = None) -> HestonParameters:
         """Estimate Heston parameters from OHLCV data."""
         self._clear_warnings()
+        features = feature_cache(data, features)
 
         n = len(data)
         dt = 1.0 / self.config.trading_days_per_year
@@ -68,8 +69,7 @@ class HestonEstimator(BaseEstimator[HestonParameters]):
 
         # Stage 1: Construct variance proxy using Parkinson
         # Daily variance: σ² = (ln(H/L))² / (4 ln 2)
-        log_hl = np.log(data.highs / data.lows)
-        var_proxy = (log_hl ** 2) / (4.0 * np.log(2.0))
+        var_proxy = features.get("parkinson")
 
         # Smooth if requested
         if self.variance_window > 1:
@@ -163,6 +163,7 @@ class HestonEstimator(BaseEstimator[HestonParameters]):
             var_proxy, v0_stat,
             n_bootstrap=self.config.n_bootstrap,
             confidence_level=self.config.confidence_level,
+            rng=self._rng(),
         )
         se_v0 = (v0_ci_upper - v0_ci_lower) / (2 * z)
 
@@ -26,6 +26,7 @@ from ..data.types import (
     RegimeParameters,
     RegimeSwitchingParameters,
 )
+from ..math.features import FeatureCache
 from ..math.statistics import kmeans_1d, bootstrap_statistic
 from .base import BaseEstimator, EstimatorConfig
 
@@ -51,8 +52,18 @@ class RegimeSwitchingEstimator(BaseEstimator[RegimeSwitchingParameters]):
         self.em_tolerance = em_tolerance
         self.em_max_iter = em_max_iter
 
-    def estimate(self, data: OHLCVData) -> RegimeSwitchingParameters:
-        """Estimate regime-switching parameters using EM."""
+    def estimate(
+            self,
+            data: OHLCVData,
+            features: FeatureCache | None = None,
+            initial: RegimeSwitchingParameters | None = None,
+    ) -> RegimeSwitchingParameters:
+        """
+        Estimate regime-switching parameters using EM.
+
+        initial: Parameters to start a single EM run from (e.g. the estimate on
+            an overlapping window) instead of n_init k-means restarts.
+        """
         self._clear_warnings()
 
         returns = data.log_returns
@@ -69,9 +80,14 @@ class RegimeSwitchingEstimator(BaseEstimator[RegimeSwitchingParameters]):
         best_log_lik = -np.inf
         best_result = None
 
-        for init_idx in range(self.n_init):
+        if initial is not None and initial.n_regimes == k:
+            starts = [self._initial_state(initial)]
+        else:
+            starts = [None] * self.n_init
+
+        for init_idx, start in enumerate(starts):
             try:
-                result = self._run_em(returns, seed=init_idx)
+                result = self._run_em(returns, seed=init_idx, start=start)
                 if result['log_likelihood'] > best_log_lik:
                     best_log_lik = result['log_likelihood']
                     best_result = result
@@ -143,30 +159,39 @@ class RegimeSwitchingEstimator(BaseEstimator[RegimeSwitchingParameters]):
             stationary_distribution=stationary,
         )
 
-    def _run_em(self, returns: np.ndarray, seed: int = 0) -> dict:
-        """Run single EM iteration with given seed."""
-        np.random.seed(seed)
+    def _initial_state(self, params: RegimeSwitchingParameters) -> tuple:
+        """Daily (means, stds, transition) of previously estimated parameters."""
+        t = self.config.trading_days_per_year
+        means = np.array([r.mu.value / t for r in params.regimes])
+        stds = np.array([r.sigma.value / np.sqrt(t) for r in params.regimes])
+        return means, np.maximum(stds, 1e-6), np.array(params.transition_matrix, dtype=float)
+
+    def _run_em(self, returns: np.ndarray, seed: int = 0, start: tuple | None = None) -> dict:
+        """Run single EM iteration with given seed (or from a given start)."""
         n = len(returns)
         k = self.n_regimes
 
-        # Initialize with k-means
-        labels, centroids = kmeans_1d(returns, k)
+        if start is not None:
+            means, stds, transition = (x.copy() for x in start)
+        else:
+            # Initialize with k-means
+            labels, centroids = kmeans_1d(returns, k, rng=self._rng(seed))
 
-        means = centroids.copy()
-        stds = np.array([
-            np.std(returns[labels == i], ddof=1) if np.sum(labels == i) > 1
-            else np.std(returns) * 0.5
-            for i in range(k)
-        ])
+            means = centroids.copy()
+            stds = np.array([
+                np.std(returns[labels == i], ddof=1) if np.sum(labels == i) > 1
+                else np.std(returns) * 0.5
+                for i in range(k)
+            ])
 
-        # Ensure positive stds
-        stds = np.maximum(stds, 1e-6)
+            # Ensure positive stds
+            stds = np.maximum(stds, 1e-6)
 
-        # Initialize transition matrix (slight diagonal bias)
-        transition = np.full((k, k), 1.0 / k)
-        for i in range(k):
-            transition[i, i] += 0.3
-        transition = transition / transition.sum(axis=1, keepdims=True)
+            # Initialize transition matrix (slight diagonal bias)
+            transition = np.full((k, k), 1.0 / k)
+            for i in range(k):
+                transition[i, i] += 0.3
+            transition = transition / transition.sum(axis=1, keepdims=True)
 
         # Initial state probabilities
         pi = np.ones(k) / k
@@ -0,0 +1,198 @@
+"""
+Per-dataset cache of derived series shared by the estimators.
+
+Several estimators need the same transformations of one OHLCVData (log
+ranges, squared returns, range-based variance series, return moments, ACF).
+A FeatureCache computes each of them once, on first request by name, and
+hands the same read-only array or value to every later caller.
+"""
+
+import threading
+from typing import Callable, Optional
+
+import numpy as np
+from numpy.typing import NDArray
+
+from ..data.types import OHLCVData
+from .statistics import autocorrelation
+
+_LN2 = np.log(2.0)
+
+
+def _log_hl(f: "FeatureCache") -> NDArray[np.float64]:
+    return np.log(f.data.highs / f.data.lows)
+
+
+def _log_co(f: "FeatureCache") -> NDArray[np.float64]:
+    return np.log(f.data.closes / f.data.opens)
+
+
+def _log_overnight(f: "FeatureCache") -> NDArray[np.float64]:
+    # ln(O[t] / C[t-1]), aligned with bars 1..n-1
+    return np.log(f.data.opens[1:] / f.data.closes[:-1])
+
+
+def _squared_returns(f: "FeatureCache") -> NDArray[np.float64]:
+    return f.data.log_returns ** 2
+
+
+def _parkinson(f: "FeatureCache") -> NDArray[np.float64]:
+    # Daily variance proxy: (ln(H/L))² / (4 ln 2)
+    return f.get("log_hl") ** 2 / (4.0 * _LN2)
+
+
+def _garman_klass(f: "FeatureCache") -> NDArray[np.float64]:
+    return 0.5 * f.get("log_hl") ** 2 - (2.0 * _LN2 - 1.0) * f.get("log_co") ** 2
+
+
+def _rogers_satchell(f: "FeatureCache") -> NDArray[np.float64]:
+    d = f.data
+    return (
+        np.log(d.highs / d.closes) * np.log(d.highs / d.opens)
+        + np.log(d.lows / d.closes) * np.log(d.lows / d.opens)
+    )
+
+
+def _yang_zhang_variance(f: "FeatureCache") -> float:
+    # Same estimator as volatility.yang_zhang_variance without prev_closes:
+    # the first bar has no previous close and is dropped
+    n = len(f.data) - 1
+    if n < 2:
+        raise ValueError("Need at least 2 observations for Yang-Zhang")
+
+    var_overnight = float(np.var(f.get("log_overnight"), ddof=1))
+    var_open_close = float(np.var(f.get("log_co")[1:], ddof=1))
+    var_rs = float(np.mean(f.get("rogers_satchell")[1:]))
+
+    k = 0.34 / (1.34 + (n + 1) / (n - 1))
+    return var_overnight + k * var_open_close + (1 - k) * var_rs
+
+
+def _returns_skew(f: "FeatureCache") -> float:
+    centered = f.data.log_returns - f.get("returns_mean")
+    m2 = np.mean(centered ** 2)
+    return float(np.mean(centered ** 3) / m2 ** 1.5) if m2 > 0 else 0.0
+
+
+def _returns_kurtosis(f: "FeatureCache") -> float:
+    # Excess kurtosis (0 for a normal distribution)
+    centered = f.data.log_returns - f.get("returns_mean")
+    m2 = np.mean(centered ** 2)
+    return float(np.mean(centered ** 4) / m2 ** 2 - 3.0) if m2 > 0 else 0.0
+
+
+# Feature name -> function computing it from the cache (and other features)
+FEATURES: dict[str, Callable[["FeatureCache"], object]] = {
+    # Series, one value per bar
+    "log_hl": _log_hl,
+    "log_co": _log_co,
+    "parkinson": _parkinson,
+    "garman_klass": _garman_klass,
+    "rogers_satchell": _rogers_satchell,
+    # Series, one value per return
+    "log_overnight": _log_overnight,
+    "squared_returns": _squared_returns,
+    # Daily variance estimates
+    "close_to_close_variance": lambda f: f.get("returns_var"),
+    "parkinson_variance": lambda f: float(np.mean(f.get("parkinson"))),
+    "garman_klass_variance": lambda f: float(np.mean(f.get("garman_klass"))),
+    "rogers_satchell_variance": lambda f: float(np.mean(f.get("rogers_satchell"))),
+    "yang_zhang_variance": _yang_zhang_variance,
+    # Moments of log returns
+    "returns_mean": lambda f: float(np.mean(f.data.log_returns)),
+    "returns_var": lambda f: float(np.var(f.data.log_returns, ddof=1)),
+    "returns_skew": _returns_skew,
+    "returns_kurtosis": _returns_kurtosis,
+}
+
+
+class FeatureCache:
+    """
+    Lazily computed features of one dataset.
+
+    Usage:
+        features = FeatureCache(data)
+        proxy = features.get("parkinson")
+        acf = features.acf("squared_returns", max_lag=50)
+
+    Arrays are returned read-only since they are shared between callers.
+    """
+
+    def __init__(self, data: OHLCVData):
+        self.data = data
+        self.hits = 0
+        self.misses = 0
+        self._values: dict[str, object] = {}
+        self._acfs: dict[str, NDArray[np.float64]] = {}
+        self._lock = threading.RLock()
+
+    def get(self, name: str):
+        """Returns the feature `name`, computing it on first request."""
+        with self._lock:
+            if name in self._values:
+                self.hits += 1
+                return self._values[name]
+
+            try:
+                compute = FEATURES[name]
+            except KeyError:
+                raise ValueError(f"Unknown feature: {name}") from None
+
+            self.misses += 1
+            value = _freeze(compute(self))
+            self._values[name] = value
+            return value
+
+    def acf(self, name: str, max_lag: int) -> NDArray[np.float64]:
+        """
+        Autocorrelation of the series feature `name` (or of "log_returns")
+        for lags 0..max_lag.
+
+        Each lag's autocorrelation does not depend on max_lag, so a longer
+        cached ACF also serves every shorter request.
+        """
+        with self._lock:
+            cached = self._acfs.get(name)
+            if cached is not None and len(cached) > max_lag:
+                self.hits += 1
+                return cached[:max_lag + 1]
+
+            series = self.data.log_returns if name == "log_returns" else self.get(name)
+            self.misses += 1
+            acf = _freeze(autocorrelation(series, max_lag))
+            self._acfs[name] = acf
+            return acf
+
+    def check(self, data: OHLCVData) -> "FeatureCache":
+        """Returns self after making sure it was built for `data`."""
+        if self.data is not data:
+            raise ValueError(
+                f"Feature cache of {self.data.ticker} used for {data.ticker}"
+            )
+        return self
+
+    def stats(self) -> dict[str, int]:
+        return {"hits": self.hits, "misses": self.misses}
+
+    def __repr__(self) -> str:
+        return f"FeatureCache({self.data.ticker}, hits={self.hits}, misses={self.misses})"
+
+    def __getstate__(self):
+        state = self.__dict__.copy()
+        del state["_lock"]
+        return state
+
+    def __setstate__(self, state):
+        self.__dict__.update(state)
+        self._lock = threading.RLock()
+
+
+def feature_cache(data: OHLCVData, features: Optional[FeatureCache]) -> FeatureCache:
+    """The given cache (checked against `data`), or a new one."""
+    return features.check(data) if features is not None else FeatureCache(data)
+
+
+def _freeze(value):
+    if isinstance(value, np.ndarray):
+        value.setflags(write=False)
+    return value
@@ -0,0 +1,578 @@
+"""
+Vectorized GARCH(1,1) variance recursion and Gaussian likelihood.
+
+    h[0] = h0
+    h[t] = ω + α·ε²[t-1] + β·h[t-1],   t = 1..n-1
+
+For fixed parameters this is a first-order linear recursion in h, i.e. an
+IIR filter with one pole at β applied to ω + α·ε²[t-1]. scipy.signal.lfilter
+evaluates it in compiled code, so a likelihood evaluation costs a handful of
+array operations instead of n Python-level steps. variance_filter and
+variance_derivatives take the filter input itself, so other variance
+equations that are linear in h (GJR-GARCH) run on the same kernel.
+
+The batch functions fit many same-length series at once. Their filter
+coefficient β differs per series, which lfilter cannot do in one call, so
+they evaluate the recursion blockwise with cumulative sums instead.
+"""
+
+from dataclasses import dataclass
+
+import numpy as np
+from numpy.typing import NDArray
+from scipy.signal import lfilter
+
+# Objective value for parameters outside the admissible region
+INVALID_NLL = 1e10
+
+# Largest persistence the batch GARCH and the GJR-GARCH fits let a model reach
+MAX_PERSISTENCE = 0.9999
+
+
+def garch_variance(
+        squared_residuals: NDArray[np.float64],
+        omega: float,
+        alpha: float,
+        beta: float,
+        h0: float,
+) -> NDArray[np.float64]:
+    """
+    Conditional variance path of a GARCH(1,1) process.
+
+    Args:
+        squared_residuals: ε²[0..n-1]
+        omega, alpha, beta: Variance equation parameters
+        h0: Variance of the first observation
+
+    Returns:
+        h[0..n-1]
+    """
+    if len(squared_residuals) == 0:
+        return np.empty(0)
+    return variance_filter(omega + alpha * squared_residuals[:-1], beta, h0)
+
+
+def variance_filter(
+        drive: NDArray[np.float64],
+        beta: float,
+        h0: float,
+) -> NDArray[np.float64]:
+    """
+    Solution of h[t] = drive[t-1] + β·h[t-1] with h[0] = h0.
+
+    Args:
+        drive: Filter input for t = 1..n-1, e.g. ω + α·ε²[t-1] for GARCH(1,1)
+        beta: Pole of the filter
+        h0: Variance of the first observation
+
+    Returns:
+        h[0..n-1]
+    """
+    h = np.empty(len(drive) + 1)
+    h[0] = h0
+    if len(drive):
+        h[1:], _ = lfilter([1.0], [1.0, -beta], drive, zi=[beta * h0])
+    return h
+
+
+def garch_neg_log_likelihood(
+        params: NDArray[np.float64],
+        squared_residuals: NDArray[np.float64],
+        h0: float,
+) -> float:
+    """
+    Gaussian negative log-likelihood of GARCH(1,1), up to a constant.
+
+        NLL = ½ Σ_{t=1}^{n-1} [ln h[t] + ε²[t] / h[t]]
+
+    The first observation only seeds the recursion. Parameters violating
+    ω > 0, α, β ≥ 0, α + β < 1 give INVALID_NLL.
+
+    Args:
+        params: (ω, α, β)
+        squared_residuals: ε²[0..n-1]
+        h0: Variance of the first observation
+    """
+    omega, alpha, beta = params
+    if omega <= 0 or alpha < 0 or beta < 0 or alpha + beta >= 1:
+        return INVALID_NLL
+
+    h = garch_variance(squared_residuals, omega, alpha, beta, h0)[1:]
+    if np.any(h <= 0):
+        return INVALID_NLL
+
+    return 0.5 * float(np.sum(np.log(h) + squared_residuals[1:] / h))
+
+
+def garch_neg_log_likelihood_and_grad(
+        params: NDArray[np.float64],
+        squared_residuals: NDArray[np.float64],
+        h0: float,
+) -> tuple[float, NDArray[np.float64]]:
+    """
+    garch_neg_log_likelihood and its gradient with respect to (ω, α, β).
+
+    The derivatives of the variance path follow the same recursion as h,
+
+        ∂h[t]/∂θ = (1, ε²[t-1], h[t-1]) + β·∂h[t-1]/∂θ,   ∂h[0]/∂θ = 0
+
+    so they are filtered by the same one-pole filter, and
+
+        ∂NLL/∂θ = ½ Σ_{t=1}^{n-1} (1/h[t] - ε²[t]/h[t]²)·∂h[t]/∂θ
+
+    Returns:
+        (NLL, gradient); the gradient is zero where NLL is INVALID_NLL
+    """
+    omega, alpha, beta = params
+    if omega <= 0 or alpha < 0 or beta < 0 or alpha + beta >= 1:
+        return INVALID_NLL, np.zeros(3)
+
+    h = garch_variance(squared_residuals, omega, alpha, beta, h0)
+    if np.any(h[1:] <= 0):
+        return INVALID_NLL, np.zeros(3)
+
+    dh = variance_derivatives((1.0, squared_residuals[:-1]), h, beta)
+    h, e2 = h[1:], squared_residuals[1:]
+
+    nll = 0.5 * float(np.sum(np.log(h) + e2 / h))
+    weights = 0.5 * (1.0 / h - e2 / h ** 2)
+    return nll, dh @ weights
+
+
+def variance_derivatives(
+        drive_derivatives,
+        h: NDArray[np.float64],
+        beta: float,
+) -> NDArray[np.float64]:
+    """
+    Derivatives of the path of variance_filter with respect to the
+    parameters of its drive and to β.
+
+    Args:
+        drive_derivatives: ∂drive[t-1]/∂θ for each drive parameter θ, as
+            arrays over t = 1..n-1 or scalars, e.g. (1, ε²[t-1]) for (ω, α)
+        h: h[0..n-1]
+        beta: Pole of the filter
+
+    Returns:
+        (len(drive_derivatives) + 1, n-1) array of ∂h[t]/∂(θ..., β)
+    """
+    drive = np.empty((len(drive_derivatives) + 1, len(h) - 1))
+    for row, derivative in zip(drive, drive_derivatives):
+        row[:] = derivative
+    drive[-1] = h[:-1]
+    return lfilter([1.0], [1.0, -beta], drive, axis=1)
+
+
+def variance_beta_derivatives(
+        dh: NDArray[np.float64],
+        beta: float,
+) -> NDArray[np.float64]:
+    """
+    Drive terms of the second derivatives of the variance_filter path that
+    involve β, the only ones that do not vanish when the drive is linear in
+    its parameters:
+
+        ∂²h[t]/∂θᵢ∂θⱼ = β·∂²h[t-1]/∂θᵢ∂θⱼ + δᵢβ·∂h[t-1]/∂θⱼ + δⱼβ·∂h[t-1]/∂θᵢ
+
+    Args:
+        dh: ∂h[t]/∂θ for t = 1..n-1, as returned by variance_derivatives (β last)
+
+    Returns:
+        Array shaped like dh whose row i is ∂²h/∂θᵢ∂β for θᵢ ≠ β and half of
+        ∂²h/∂β² for θᵢ = β; adding its contraction to both the β row and
+        the β column of a Hessian therefore counts every term once.
+    """
+    # ∂h[t-1]/∂θ for t = 1..n-1 (∂h[0]/∂θ = 0)
+    dh_lagged = np.zeros_like(dh)
+    dh_lagged[:, 1:] = dh[:, :-1]
+    return lfilter([1.0], [1.0, -beta], dh_lagged, axis=1)
+
+
+def garch_hessian_and_opg(
+        params: NDArray[np.float64],
+        squared_residuals: NDArray[np.float64],
+        h0: float,
+) -> tuple[NDArray[np.float64], NDArray[np.float64]]:
+    """
+    Analytic Hessian of the NLL and outer product of the per-observation
+    scores, at (ω, α, β).
+
+    Second derivatives of the variance path again follow the one-pole
+    recursion; only pairs involving β have a drive term,
+
+        ∂²h[t]/∂θᵢ∂θⱼ = β·∂²h[t-1]/∂θᵢ∂θⱼ + δᵢβ·∂h[t-1]/∂θⱼ + δⱼβ·∂h[t-1]/∂θᵢ
+
+    and with lₜ = ½(ln h[t] + ε²[t]/h[t]),
+
+        ∂²lₜ/∂θᵢ∂θⱼ = ½(2ε²/h³ - 1/h²)·∂h/∂θᵢ·∂h/∂θⱼ + ½(1/h - ε²/h²)·∂²h/∂θᵢ∂θⱼ
+
+    The two matrices combine into the Bollerslev-Wooldridge sandwich
+    covariance H⁻¹·OPG·H⁻¹ (or H⁻¹ alone under correct specification).
+
+    Returns:
+        (Hessian, OPG), both 3x3
+    """
+    omega, alpha, beta = params
+    h = garch_variance(squared_residuals, omega, alpha, beta, h0)
+    dh = variance_derivatives((1.0, squared_residuals[:-1]), h, beta)
+
+    d2h_beta = variance_beta_derivatives(dh, beta)
+
+    h, e2 = h[1:], squared_residuals[1:]
+    weights = 0.5 * (1.0 / h - e2 / h ** 2)
+    curvature = 0.5 * (2.0 * e2 / h ** 3 - 1.0 / h ** 2)
+
+    hessian = (dh * curvature) @ dh.T
+    cross = d2h_beta @ weights
+    hessian[:, 2] += cross
+    hessian[2, :] += cross
+
+    scores = dh * weights
+    return hessian, scores @ scores.T
+
+
+@dataclass(frozen=True, slots=True)
+class GARCHBatchFit:
+    """Result of fit_garch_batch, one row (or matrix) per series."""
+    params: NDArray[np.float64]  # (n_series, 3): ω, α, β
+    nll: NDArray[np.float64]  # (n_series,)
+    hessian: NDArray[np.float64]  # (n_series, 3, 3)
+    opg: NDArray[np.float64]  # (n_series, 3, 3)
+    converged: NDArray[np.bool_]  # (n_series,)
+    iterations: NDArray[np.int64]  # (n_series,)
+
+
+def garch_batch_variance(
+        squared_residuals: NDArray[np.float64],
+        params: NDArray[np.float64],
+        h0: NDArray[np.float64],
+) -> NDArray[np.float64]:
+    """
+    Variance paths of many series, as garch_variance.
+
+    Args:
+        squared_residuals: ε², shape (n, n_series)
+        params: (n_series, 3) array of (ω, α, β)
+        h0: Variance of each series' first observation, shape (n_series,)
+
+    Returns:
+        h, shape (n, n_series)
+    """
+    e2 = np.ascontiguousarray(np.asarray(squared_residuals, dtype=float).T)
+    return _variance_paths(e2, np.asarray(params, dtype=float), np.asarray(h0, dtype=float)).T
+
+
+def garch_batch_neg_log_likelihood(
+        squared_residuals: NDArray[np.float64],
+        params: NDArray[np.float64],
+        h0: NDArray[np.float64],
+) -> NDArray[np.float64]:
+    """garch_neg_log_likelihood of every series, shape (n_series,); arguments as garch_batch_variance."""
+    e2 = np.ascontiguousarray(np.asarray(squared_residuals, dtype=float).T)
+    return _batch_nll(e2, np.asarray(params, dtype=float), np.asarray(h0, dtype=float))
+
+
+def fit_garch_batch(
+        squared_residuals: NDArray[np.float64],
+        h0: NDArray[np.float64],
+        x0: NDArray[np.float64] | None = None,
+        max_iter: int = 100,
+        tol: float = 1e-10,
+) -> GARCHBatchFit:
+    """
+    Fits GARCH(1,1) to many same-length series together.
+
+    Projected Newton with a backtracking line search on the analytic
+    Hessian, in the same scaled variables as GARCHEstimator (ω in units of
+    h0). Each iteration evaluates only the series that have not converged
+    yet. Variables at a bound with the gradient pointing outward are held
+    fixed, and the Hessian is made positive definite by flipping and
+    flooring its eigenvalues, so every step is a descent step.
+
+    Args:
+        squared_residuals: ε², shape (n, n_series)
+        h0: Variance of each series' first observation, shape (n_series,)
+        x0: Starting (ω, α, β) per series, shape (n_series, 3); defaults
+            to the best point of a small variance-targeting grid
+        max_iter: Newton iterations per series
+        tol: Convergence threshold on the Newton decrement, relative to
+            the NLL
+
+    Returns:
+        GARCHBatchFit
+    """
+    # Series-major internally, so recursions run along contiguous memory
+    e2 = np.ascontiguousarray(np.asarray(squared_residuals, dtype=float).T)
+    h0 = np.asarray(h0, dtype=float)
+    m = len(h0)
+
+    scale = np.ones((m, 3))
+    scale[:, 0] = h0
+
+    lower = np.zeros((m, 3))
+    lower[:, 0] = 1e-10 / h0
+    upper = np.full((m, 3), 0.999)
+    upper[:, 0] = np.inf
+
+    if x0 is None:
+        x = _grid_start(e2, h0)
+    else:
+        x = np.asarray(x0, dtype=float) / scale
+    x = _project(x, lower, upper)
+
+    converged = np.zeros(m, dtype=bool)
+    iterations = np.zeros(m, dtype=np.int64)
+
+    for _ in range(max_iter):
+        active = np.flatnonzero(~converged)
+        if len(active) == 0:
+            break
+
+        e2a, s, h0a = e2[active], scale[active], h0[active]
+        lo, hi = lower[active], upper[active]
+        xa = x[active]
+
+        f, g, hess, _ = _batch_derivatives(e2a, xa * s, h0a, opg=False)
+        g = g * s
+        hess = hess * s[:, :, None] * s[:, None, :]
+        direction = _newton_direction(xa, g, hess, lo, hi)
+
+        # Newton decrement: predicted decrease of the NLL
+        decrement = -np.einsum("mi,mi->m", g, direction)
+        done = decrement <= tol * np.maximum(1.0, np.abs(f))
+        converged[active[done]] = True
+        iterations[active[~done]] += 1
+
+        keep = np.flatnonzero(~done)
+        x[active[keep]], stalled = _line_search(
+            e2a[keep], h0a[keep], s[keep], lo[keep], hi[keep],
+            xa[keep], f[keep], g[keep], direction[keep],
+        )
+        # No acceptable step: stationary up to line search precision
+        converged[active[keep[stalled]]] = True
+
+    params = x * scale
+    nll, _, hessian, opg = _batch_derivatives(e2, params, h0)
+    return GARCHBatchFit(
+        params=params,
+        nll=nll,
+        hessian=hessian,
+        opg=opg,
+        converged=converged,
+        iterations=iterations,
+    )
+
+
+# The batch helpers below take series-major arrays: ε² of shape (n_series, n)
+
+def _variance_paths(e2: NDArray, params: NDArray, h0: NDArray) -> NDArray[np.float64]:
+    omega, alpha, beta = params.T
+    drive = np.empty_like(e2)
+    drive[:, 0] = h0
+    np.multiply(e2[:, :-1], alpha[:, None], out=drive[:, 1:])
+    drive[:, 1:] += omega[:, None]
+    return _batch_recursion(drive, beta)
+
+
+def _batch_nll(e2: NDArray, params: NDArray, h0: NDArray) -> NDArray[np.float64]:
+    h = _variance_paths(e2, params, h0)[:, 1:]
+    with np.errstate(divide="ignore", invalid="ignore"):
+        nll = 0.5 * np.sum(np.log(h) + e2[:, 1:] / h, axis=1)
+
+    omega, alpha, beta = params.T
+    valid = (omega > 0) & (alpha >= 0) & (beta >= 0) & (alpha + beta < 1) & np.all(h > 0, axis=1)
+    return np.where(valid, nll, INVALID_NLL)
+
+
+def _batch_derivatives(
+        e2: NDArray,
+        params: NDArray,
+        h0: NDArray,
+        opg: bool = True,
+) -> tuple[NDArray, NDArray, NDArray, NDArray | None]:
+    """
+    NLL, gradient, Hessian and (optionally) OPG of every series, as in
+    garch_neg_log_likelihood_and_grad and garch_hessian_and_opg.
+
+    Returns:
+        (nll (n_series,), gradient (n_series, 3),
+         Hessian (n_series, 3, 3), OPG (n_series, 3, 3) or None)
+    """
+    m, n = e2.shape
+    beta = params[:, 2]
+    h = _variance_paths(e2, params, h0)
+
+    # ∂h/∂(ω, α, β), then ∂²h/∂(ω, α, β)∂β; both zero at t = 0
+    drive = np.zeros((3, m, n))
+    drive[0, :, 1:] = 1.0
+    drive[1, :, 1:] = e2[:, :-1]
+    drive[2, :, 1:] = h[:, :-1]
+    dh = _batch_recursion(drive, beta)
+
+    drive[:, :, 1:] = dh[:, :, :-1]
+    d2h_beta = _batch_recursion(drive, beta)
+
+    h, e2, dh, d2h_beta = h[:, 1:], e2[:, 1:], dh[:, :, 1:], d2h_beta[:, :, 1:]
+    inv_h = 1.0 / h
+    z = e2 * inv_h  # ε²/h
+    weights = 0.5 * inv_h * (1.0 - z)
+    curvature = 0.5 * inv_h ** 2 * (2.0 * z - 1.0)
+
+    nll = 0.5 * np.sum(np.log(h) + z, axis=1)
+    scores = weights * dh  # (3, m, n-1)
+    grad = scores.sum(axis=2).T
+
+    hessian = np.empty((m, 3, 3))
+    curved = curvature * dh
+    for i in range(3):
+        for j in range(i, 3):
+            hessian[:, i, j] = hessian[:, j, i] = np.einsum("mt,mt->m", curved[i], dh[j])
+    cross = np.einsum("mt,imt->mi", weights, d2h_beta)
+    hessian[:, :, 2] += cross
+    hessian[:, 2, :] += cross
+
+    if not opg:
+        return nll, grad, hessian, None
+
+    outer = np.empty((m, 3, 3))
+    for i in range(3):
+        for j in range(i, 3):
+            outer[:, i, j] = outer[:, j, i] = np.einsum("mt,mt->m", scores[i], scores[j])
+    return nll, grad, hessian, outer
+
+
+# Starting points (α, β) tried by fit_garch_batch; ω targets the sample variance
+_GRID = ((0.03, 0.8), (0.05, 0.9), (0.1, 0.85), (0.1, 0.6), (0.15, 0.8), (0.05, 0.94))
+
+
+def _grid_start(e2: NDArray, h0: NDArray) -> NDArray[np.float64]:
+    """Best grid point of every series, in scaled variables."""
+    m = len(h0)
+    best_x = np.zeros((m, 3))
+    best_nll = np.full(m, np.inf)
+
+    for alpha, beta in _GRID:
+        x = np.tile([1.0 - alpha - beta, alpha, beta], (m, 1))
+        params = x.copy()
+        params[:, 0] *= h0
+        nll = _batch_nll(e2, params, h0)
+        better = nll < best_nll
+        best_x[better] = x[better]
+        best_nll[better] = nll[better]
+
+    return best_x
+
+
+def _line_search(e2, h0, s, lower, upper, x, f, g, direction, max_halvings: int = 30) -> tuple[NDArray, NDArray]:
+    """
+    Armijo backtracking along the projected Newton path, per series.
+
+    Returns:
+        (new points, mask of series without an acceptable step, which
+         keep their current point)
+    """
+    step = np.ones(len(x))
+    x_new = x.copy()
+    pending = np.arange(len(x))
+
+    for _ in range(max_halvings):
+        if len(pending) == 0:
+            break
+        trial = _project(x[pending] + step[pending, None] * direction[pending], lower[pending], upper[pending])
+        f_trial = _batch_nll(e2[pending], trial * s[pending], h0[pending])
+        decrease = np.einsum("mi,mi->m", g[pending], trial - x[pending])
+        accepted = f_trial <= f[pending] + 1e-4 * decrease
+
+        x_new[pending[accepted]] = trial[accepted]
+        step[pending] *= 0.5
+        pending = pending[~accepted]
+
+    stalled = np.zeros(len(x), dtype=bool)
+    stalled[pending] = True
+    return x_new, stalled
+
+
+def _batch_recursion(drive: NDArray[np.float64], beta: NDArray[np.float64]) -> NDArray[np.float64]:
+    """
+    y[0] = drive[0], y[t] = drive[t] + β·y[t-1] along the last axis, with
+    one β per series (second to last axis).
+
+    Time is split into blocks of _BLOCK steps. Within a block,
+    y[j] = βʲ·Σ_{i≤j} β⁻ⁱ·drive[i] is a cumulative sum; the blocks are then
+    chained through their last values. Series with β below _MIN_BLOCK_BETA
+    (where β⁻ⁱ would grow too large) are stepped through one by one.
+    """
+    small = beta < _MIN_BLOCK_BETA
+    if not small.any():
+        return _blocked_recursion(drive, beta)
+
+    out = np.empty_like(drive)
+    out[..., small, :] = _stepwise_recursion(drive[..., small, :], beta[small])
+    out[..., ~small, :] = _blocked_recursion(drive[..., ~small, :], beta[~small])
+    return out
+
+
+# Time steps per block of _blocked_recursion, and the smallest β it handles
+# (β^-(_BLOCK - 1) stays far from overflowing)
+_BLOCK = 32
+_MIN_BLOCK_BETA = 0.01
+
+
+def _blocked_recursion(drive: NDArray[np.float64], beta: NDArray[np.float64]) -> NDArray[np.float64]:
+    *lead, m, n = drive.shape
+    n_blocks = -(-n // _BLOCK)
+
+    blocks = np.zeros((*lead, m, n_blocks * _BLOCK))
+    blocks[..., :n] = drive
+    blocks = blocks.reshape(*lead, m, n_blocks, _BLOCK)
+
+    powers = beta[:, None, None] ** np.arange(_BLOCK)  # βʲ, shape (m, 1, _BLOCK)
+    blocks *= 1.0 / powers
+    local = np.cumsum(blocks, axis=-1, out=blocks)
+    local *= powers
+
+    # Value at the end of each block, carried into the next one
+    carry = local[..., -1].copy()  # (..., m, n_blocks)
+    beta_block = beta ** _BLOCK
+    for b in range(1, n_blocks):
+        carry[..., b] += beta_block * carry[..., b - 1]
+    local[..., 1:, :] += (powers * beta[:, None, None]) * carry[..., :-1, None]
+
+    return local.reshape(*lead, m, n_blocks * _BLOCK)[..., :n]
+
+
+def _stepwise_recursion(drive: NDArray[np.float64], beta: NDArray[np.float64]) -> NDArray[np.float64]:
+    out = np.empty_like(drive)
+    out[..., 0] = drive[..., 0]
+    for t in range(1, drive.shape[-1]):
+        out[..., t] = drive[..., t] + beta * out[..., t - 1]
+    return out
+
+
+def _project(x: NDArray, lower: NDArray, upper: NDArray) -> NDArray:
+    """Clips to the box, then shrinks α and β together to keep α + β ≤ MAX_PERSISTENCE."""
+    x = np.clip(x, lower, upper)
+    persistence = x[:, 1] + x[:, 2]
+    over = persistence > MAX_PERSISTENCE
+    x[over, 1:] *= (MAX_PERSISTENCE / persistence[over])[:, None]
+    return x
+
+
+def _newton_direction(x, g, hess, lower, upper) -> NDArray[np.float64]:
+    """Projected Newton direction with the binding bounds held fixed."""
+    binding = ((x <= lower) & (g > 0)) | ((x >= upper) & (g < 0))
+    free = ~binding
+
+    reduced = hess * (free[:, :, None] & free[:, None, :])
+    i = np.arange(3)
+    reduced[:, i, i] = np.where(binding, 1.0, reduced[:, i, i])
+
+    eigenvalues, eigenvectors = np.linalg.eigh(reduced)
+    eigenvalues = np.abs(eigenvalues)
+    floor = 1e-8 * np.max(eigenvalues, axis=1, keepdims=True)
+    eigenvalues = np.maximum(eigenvalues, np.maximum(floor, 1e-12))
+
+    g_free = np.where(free, g, 0.0)
+    coefficients = np.einsum("mji,mj->mi", eigenvectors, g_free) / eigenvalues
+    return -np.einsum("mij,mj->mi", eigenvectors, coefficients)
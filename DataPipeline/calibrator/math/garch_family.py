@@ -0,0 +1,341 @@
+"""
+Likelihood kernels of the asymmetric GARCH family, with Gaussian or
+Student-t innovations.
+
+    ε[t] = √h[t]·z[t],   z[t] iid with mean 0 and variance 1
+
+    GJR-GARCH:  h[t] = ω + (α + γ·1[ε[t-1] < 0])·ε²[t-1] + β·h[t-1]
+    EGARCH:     ln h[t] = ω + α·(|z[t-1]| - √(2/π)) + γ·z[t-1] + β·ln h[t-1]
+
+Each variance equation returns the path h[1..n-1] together with its
+derivatives with respect to (ω, α, γ, β); the innovation density turns the
+pair into per-observation scores by the chain rule. Any variance equation
+therefore combines with any density, and every combination has an analytic
+gradient.
+
+GJR-GARCH is linear in h and runs on the GARCH(1,1) filter of math.garch
+with the drive ω + (α + γ·1[ε[t-1] < 0])·ε²[t-1]. EGARCH feeds z = ε/√h back into the recursion, which no linear filter can
+express, so it runs as one sequential pass over Python floats that carries
+the derivatives along.
+
+gjr_hessian_and_opg gives the analytic Hessian of GJR-GARCH, whose second
+derivatives again follow the shared filter. EGARCH has no such closed form
+here; its Hessian is taken numerically from the analytic gradient.
+
+E|z| in EGARCH is the Gaussian √(2/π) whatever the density, as is usual;
+any other constant would only shift ω.
+"""
+
+import math
+
+import numpy as np
+from numpy.typing import NDArray
+from scipy.special import digamma, gammaln, polygamma
+
+from .garch import INVALID_NLL, variance_beta_derivatives, variance_derivatives, variance_filter
+
+VARIANCE_EQUATIONS = ("gjr", "egarch")
+INNOVATIONS = ("normal", "student_t")
+
+# E|z| of a standard normal
+_ABS_MEAN = math.sqrt(2.0 / math.pi)
+_LOG_2PI = math.log(2.0 * math.pi)
+
+
+def gjr_variance(
+        residuals: NDArray[np.float64],
+        omega: float,
+        alpha: float,
+        gamma: float,
+        beta: float,
+        h0: float,
+) -> NDArray[np.float64]:
+    """
+    Conditional variance path of a GJR-GARCH(1,1) process.
+
+    Args:
+        residuals: ε[0..n-1]
+        omega, alpha, gamma, beta: Variance equation parameters
+        h0: Variance of the first observation
+
+    Returns:
+        h[0..n-1]
+    """
+    if len(residuals) == 0:
+        return np.empty(0)
+    e = residuals[:-1]
+    return variance_filter(omega + (alpha + gamma * (e < 0)) * e ** 2, beta, h0)
+
+
+def gjr_variance_and_derivatives(
+        params: NDArray[np.float64],
+        residuals: NDArray[np.float64],
+        h0: float,
+) -> tuple[NDArray[np.float64], NDArray[np.float64]]:
+    """
+    GJR-GARCH variance path and its derivatives.
+
+    As for GARCH(1,1), the derivatives follow the variance recursion itself,
+
+        ∂h[t]/∂θ = (1, ε²[t-1], 1[ε[t-1] < 0]·ε²[t-1], h[t-1]) + β·∂h[t-1]/∂θ
+
+    with ∂h[0]/∂θ = 0.
+
+    Args:
+        params: (ω, α, γ, β)
+        residuals: ε[0..n-1]
+        h0: Variance of the first observation
+
+    Returns:
+        (h[1..n-1], (4, n-1) array of ∂h[t]/∂(ω, α, γ, β))
+    """
+    omega, alpha, gamma, beta = params[:4]
+    h = gjr_variance(residuals, omega, alpha, gamma, beta, h0)
+
+    e2 = residuals[:-1] ** 2
+    return h[1:], variance_derivatives((1.0, e2, e2 * (residuals[:-1] < 0)), h, beta)
+
+
+def egarch_variance_and_derivatives(
+        params: NDArray[np.float64],
+        residuals: NDArray[np.float64],
+        h0: float,
+) -> tuple[NDArray[np.float64], NDArray[np.float64]]:
+    """
+    EGARCH(1,1) variance path and its derivatives.
+
+    With g = ln h and z[t-1] = ε[t-1]·exp(-g[t-1]/2),
+
+        ∂g[t]/∂θ = (1, |z[t-1]| - √(2/π), z[t-1], g[t-1])
+                   + (β - ½(α·|z[t-1]| + γ·z[t-1]))·∂g[t-1]/∂θ
+
+    and ∂h/∂θ = h·∂g/∂θ.
+
+    Args:
+        params: (ω, α, γ, β)
+        residuals: ε[0..n-1]
+        h0: Variance of the first observation
+
+    Returns:
+        (h[1..n-1], (4, n-1) array of ∂h[t]/∂(ω, α, γ, β)); NaN paths if
+        the recursion overflows
+    """
+    omega, alpha, gamma, beta = (float(p) for p in params[:4])
+    n = len(residuals)
+
+    g = math.log(h0)
+    d_omega = d_alpha = d_gamma = d_beta = 0.0
+    path = []
+    try:
+        for e in residuals[:-1].tolist():
+            z = e * math.exp(-0.5 * g)
+            abs_z = abs(z)
+            shock = abs_z - _ABS_MEAN
+            decay = beta - 0.5 * (alpha * abs_z + gamma * z)
+
+            d_omega = 1.0 + decay * d_omega
+            d_alpha = shock + decay * d_alpha
+            d_gamma = z + decay * d_gamma
+            d_beta = g + decay * d_beta
+            g = omega + alpha * shock + gamma * z + beta * g
+
+            path.append((g, d_omega, d_alpha, d_gamma, d_beta))
+    except OverflowError:
+        return np.full(n - 1, np.nan), np.full((4, n - 1), np.nan)
+
+    path = np.array(path).reshape(-1, 5).T
+    with np.errstate(over="ignore", invalid="ignore"):
+        h = np.exp(path[0])
+        return h, h * path[1:]
+
+
+_VARIANCE_EQUATIONS = {
+    "gjr": gjr_variance_and_derivatives,
+    "egarch": egarch_variance_and_derivatives,
+}
+
+
+def admissible(variance: str, params: NDArray[np.float64]) -> bool:
+    """
+    Whether params lie in the model's admissible region.
+
+    GJR-GARCH: ω > 0, α ≥ 0, α + γ ≥ 0, β ≥ 0 and α + γ/2 + β < 1 (positive
+    variance and covariance stationarity for symmetric innovations).
+    EGARCH: |β| < 1. Student-t: ν > 2.
+    """
+    omega, alpha, gamma, beta = params[:4]
+    if len(params) > 4 and not params[4] > 2:
+        return False
+    if variance == "gjr":
+        return omega > 0 and alpha >= 0 and alpha + gamma >= 0 and beta >= 0 and alpha + gamma / 2 + beta < 1
+    return abs(beta) < 1
+
+
+def garch_family_scores(
+        variance: str,
+        innovations: str,
+        params: NDArray[np.float64],
+        residuals: NDArray[np.float64],
+        h0: float,
+) -> tuple[float, NDArray[np.float64]]:
+    """
+    Negative log-likelihood and per-observation scores.
+
+    With lₜ the log-density of ε[t] given h[t], the NLL is -Σ_{t=1}^{n-1} lₜ
+    (the first observation only seeds the recursion), including all
+    constants, so values are comparable across densities. Scores are the
+    derivatives of -lₜ; they sum to the gradient, and their outer product
+    is the OPG matrix of the sandwich covariance.
+
+    Only the variance path is checked (finite and positive), not the
+    admissible region, so this can be differentiated numerically at the
+    region's boundary.
+
+    Args:
+        variance: "gjr" or "egarch"
+        innovations: "normal" or "student_t"
+        params: (ω, α, γ, β), followed by ν for Student-t
+        residuals: ε[0..n-1]
+        h0: Variance of the first observation
+
+    Returns:
+        (NLL, scores of shape (len(params), n-1)); (INVALID_NLL, zeros) if
+        the variance path or the result is not finite, or h is not positive
+    """
+    h, dh = _VARIANCE_EQUATIONS[variance](params, residuals, h0)
+    invalid = INVALID_NLL, np.zeros((len(params), len(h)))
+    if not np.all(h > 0) or not np.all(np.isfinite(h)):
+        return invalid
+
+    with np.errstate(over="ignore", divide="ignore", invalid="ignore"):
+        nll, scores = _density_scores(innovations, params, residuals[1:] ** 2, h, dh)
+    if not np.isfinite(nll) or not np.all(np.isfinite(scores)):
+        return invalid
+    return nll, scores
+
+
+def _density_scores(
+        innovations: str,
+        params: NDArray[np.float64],
+        e2: NDArray[np.float64],
+        h: NDArray[np.float64],
+        dh: NDArray[np.float64],
+) -> tuple[float, NDArray[np.float64]]:
+    """NLL and scores from ε²[1..n-1], h[1..n-1] and ∂h/∂(ω, α, γ, β)."""
+    if innovations == "normal":
+        nll = 0.5 * float(np.sum(_LOG_2PI + np.log(h) + e2 / h))
+        return nll, dh * (0.5 * (1.0 / h - e2 / h ** 2))
+
+    # Student-t scaled to unit variance:
+    #   -lₜ = -c(ν) + ½ ln h + (ν+1)/2 · ln(1 + q),   q = ε²/(h(ν-2))
+    nu = float(params[4])
+    c = gammaln((nu + 1) / 2) - gammaln(nu / 2) - 0.5 * math.log(math.pi * (nu - 2))
+    dc = 0.5 * (digamma((nu + 1) / 2) - digamma(nu / 2)) - 0.5 / (nu - 2)
+
+    q = e2 / (h * (nu - 2))
+    log1p_q = np.log1p(q)
+    ratio = q / (1 + q)
+
+    nll = float(np.sum(0.5 * np.log(h) + 0.5 * (nu + 1) * log1p_q)) - len(h) * c
+
+    scores = np.empty((5, len(h)))
+    scores[:4] = dh * ((1 - (nu + 1) * ratio) / (2 * h))
+    scores[4] = 0.5 * log1p_q - (nu + 1) * ratio / (2 * (nu - 2)) - dc
+    return nll, scores
+
+
+def _density_derivatives(
+        innovations: str,
+        params: NDArray[np.float64],
+        e2: NDArray[np.float64],
+        h: NDArray[np.float64],
+) -> tuple[NDArray[np.float64], ...]:
+    """
+    Derivatives of -lₜ in h and ν: (∂/∂h, ∂²/∂h², ∂²/∂h∂ν, ∂²/∂ν²), the
+    last two None for Gaussian innovations.
+    """
+    if innovations == "normal":
+        return 0.5 * (1.0 / h - e2 / h ** 2), 0.5 * (2.0 * e2 / h ** 3 - 1.0 / h ** 2), None, None
+
+    # With q = ε²/(h(ν-2)) and r = q/(1+q): ∂r/∂h = -r(1-r)/h and
+    # ∂r/∂ν = -r(1-r)/(ν-2)
+    nu = float(params[4])
+    d2c = 0.25 * (polygamma(1, (nu + 1) / 2) - polygamma(1, nu / 2)) + 0.5 / (nu - 2) ** 2
+
+    q = e2 / (h * (nu - 2))
+    ratio = q / (1 + q)
+
+    d_h = (1 - (nu + 1) * ratio) / (2 * h)
+    d2_hh = ((nu + 1) * ratio * (2 - ratio) - 1) / (2 * h ** 2)
+    d2_hnu = -(ratio - (nu + 1) * ratio * (1 - ratio) / (nu - 2)) / (2 * h)
+    d2_nunu = (nu + 1) * ratio * (2 - ratio) / (2 * (nu - 2) ** 2) - ratio / (nu - 2) - d2c
+    return d_h, d2_hh, d2_hnu, d2_nunu
+
+
+def gjr_hessian_and_opg(
+        innovations: str,
+        params: NDArray[np.float64],
+        residuals: NDArray[np.float64],
+        h0: float,
+) -> tuple[NDArray[np.float64], NDArray[np.float64]]:
+    """
+    Analytic Hessian of the GJR-GARCH NLL and outer product of the
+    per-observation scores, as garch_hessian_and_opg for GARCH(1,1).
+
+    The drive is linear in (ω, α, γ), so the only second derivatives of h
+    are those involving β (variance_beta_derivatives), and
+
+        ∂²(-lₜ)/∂θᵢ∂θⱼ = ∂²(-lₜ)/∂h²·∂h/∂θᵢ·∂h/∂θⱼ + ∂(-lₜ)/∂h·∂²h/∂θᵢ∂θⱼ
+
+    with ν entering -lₜ directly for Student-t innovations.
+
+    Args:
+        innovations: "normal" or "student_t"
+        params: (ω, α, γ, β), followed by ν for Student-t
+        residuals: ε[0..n-1]
+        h0: Variance of the first observation
+
+    Returns:
+        (Hessian, OPG), both len(params) x len(params); NaN if the variance
+        path is not finite and positive
+    """
+    h, dh = gjr_variance_and_derivatives(params, residuals, h0)
+    k = len(params)
+    if not np.all(h > 0) or not np.all(np.isfinite(h)):
+        return np.full((k, k), np.nan), np.full((k, k), np.nan)
+
+    e2 = residuals[1:] ** 2
+    with np.errstate(over="ignore", divide="ignore", invalid="ignore"):
+        _, scores = _density_scores(innovations, params, e2, h, dh)
+        d_h, d2_hh, d2_hnu, d2_nunu = _density_derivatives(innovations, params, e2, h)
+
+    hessian = np.zeros((k, k))
+    hessian[:4, :4] = (dh * d2_hh) @ dh.T
+    cross = variance_beta_derivatives(dh, params[3]) @ d_h
+    hessian[:4, 3] += cross
+    hessian[3, :4] += cross
+    if k > 4:
+        hessian[:4, 4] = hessian[4, :4] = dh @ d2_hnu
+        hessian[4, 4] = d2_nunu.sum()
+
+    return hessian, scores @ scores.T
+
+
+def garch_family_neg_log_likelihood_and_grad(
+        variance: str,
+        innovations: str,
+        params: NDArray[np.float64],
+        residuals: NDArray[np.float64],
+        h0: float,
+) -> tuple[float, NDArray[np.float64]]:
+    """
+    Negative log-likelihood and its gradient, as garch_family_scores.
+
+    Returns:
+        (NLL, gradient); (INVALID_NLL, zeros) outside the admissible region
+    """
+    if not admissible(variance, params):
+        return INVALID_NLL, np.zeros(len(params))
+
+    nll, scores = garch_family_scores(variance, innovations, params, residuals, h0)
+    return nll, scores.sum(axis=1)
@@ -104,17 +104,22 @@ def find_decorrelation_lag(
         x: NDArray[np.float64],
         significance_level: float = 0.05,
         max_lag: int = 100,
+        acf: Optional[NDArray[np.float64]] = None,
 ) -> int:
     """
     Find the lag at which autocorrelation becomes insignificant.
 
     Uses Bartlett's formula for significance threshold.
 
+    Args:
+        acf: Precomputed autocorrelation of x up to at least max_lag
+
     Returns:
         Lag at which ACF drops below significance threshold
     """
     n = len(x)
-    acf = autocorrelation(x, max_lag)
+    if acf is None:
+        acf = autocorrelation(x, max_lag)
 
     # Bartlett's threshold (approximate 95% CI)
     threshold = stats.norm.ppf(1 - significance_level / 2) / np.sqrt(n)
@@ -177,6 +182,58 @@ def hessian_numerical(
     return hessian
 
 
+def jacobian_numerical(
+        func,
+        x: NDArray[np.float64],
+        epsilon: float = 1e-5,
+) -> NDArray[np.float64]:
+    """
+    Compute numerical Jacobian using central differences.
+
+    Applied to an analytic gradient this gives the Hessian with one
+    function evaluation per step instead of four.
+
+    Args:
+        func: Function to differentiate (vector output)
+        x: Point at which to evaluate Jacobian
+        epsilon: Step size for finite differences
+
+    Returns:
+        Jacobian matrix, J[i, j] = ∂func(x)[i] / ∂x[j]
+    """
+    columns = []
+    for j in range(len(x)):
+        x_p = x.copy()
+        x_m = x.copy()
+        x_p[j] += epsilon
+        x_m[j] -= epsilon
+        columns.append((np.asarray(func(x_p)) - np.asarray(func(x_m))) / (2 * epsilon))
+
+    return np.column_stack(columns)
+
+
+def sandwich_covariance(
+        hessian: NDArray[np.float64],
+        opg: Optional[NDArray[np.float64]] = None,
+) -> NDArray[np.float64]:
+    """
+    Parameter covariance of an M-estimator: the Bollerslev-Wooldridge
+    sandwich H⁻¹·OPG·H⁻¹, valid under misspecified innovations, or H⁻¹
+    alone if opg is omitted.
+
+    Returns:
+        Covariance matrix, NaN where the Hessian is singular
+    """
+    try:
+        hess_inv = np.linalg.inv(hessian)
+    except np.linalg.LinAlgError:
+        return np.full_like(hessian, np.nan)
+
+    if opg is None:
+        return hess_inv
+    return hess_inv @ opg @ hess_inv
+
+
 def confidence_interval_from_hessian(
         hessian: NDArray[np.float64],
         param_idx: int,
@@ -191,16 +248,33 @@ def confidence_interval_from_hessian(
     """
     try:
         cov_matrix = np.linalg.inv(hessian)
-        variance = cov_matrix[param_idx, param_idx]
+    except np.linalg.LinAlgError:
+        return np.nan, np.nan, np.nan
 
-        if variance < 0:
-            # Hessian not positive definite at optimum
-            return np.nan, np.nan, np.nan
+    return confidence_interval_from_covariance(cov_matrix, param_idx, confidence_level, param_value)
 
-        std_error = np.sqrt(variance)
-    except np.linalg.LinAlgError:
+
+def confidence_interval_from_covariance(
+        cov_matrix: NDArray[np.float64],
+        param_idx: int,
+        confidence_level: float = 0.95,
+        param_value: float = 0.0,
+) -> tuple[float, float, float]:
+    """
+    Compute confidence interval from a parameter covariance matrix
+    (e.g. inverse Hessian or a sandwich estimate).
+
+    Returns:
+        (standard_error, ci_lower, ci_upper)
+    """
+    variance = cov_matrix[param_idx, param_idx]
+
+    if not variance >= 0:
+        # Negative or NaN: covariance not positive definite at optimum
         return np.nan, np.nan, np.nan
 
+    std_error = np.sqrt(variance)
+
     z = stats.norm.ppf(1 - (1 - confidence_level) / 2)
     ci_lower = param_value - z * std_error
     ci_upper = param_value + z * std_error
@@ -213,6 +287,7 @@ def kmeans_1d(
         k: int,
         max_iter: int = 100,
         n_init: int = 10,
+        rng: Optional[np.random.RandomState] = None,
 ) -> tuple[NDArray[np.int64], NDArray[np.float64]]:
     """
     1D k-means clustering (optimized for univariate data).
@@ -222,10 +297,12 @@ def kmeans_1d(
         k: Number of clusters
         max_iter: Maximum iterations per initialization
         n_init: Number of random initializations
+        rng: Random state for the initializations (defaults to the global one)
 
     Returns:
         (labels, centroids)
     """
+    rng = rng if rng is not None else np.random
     n = len(x)
     best_labels = None
     best_centroids = None
@@ -234,13 +311,13 @@ def kmeans_1d(
     for _ in range(n_init):
         # Random initialization using k-means++
         centroids = np.zeros(k)
-        centroids[0] = x[np.random.randint(n)]
+        centroids[0] = x[rng.randint(n)]
 
         for c in range(1, k):
             distances = np.min([np.abs(x - centroids[j]) for j in range(c)], axis=0)
             probs = distances ** 2
             probs /= probs.sum()
-            centroids[c] = x[np.random.choice(n, p=probs)]
+            centroids[c] = x[rng.choice(n, p=probs)]
 
         # Iterate
         for _ in range(max_iter):
@@ -284,6 +361,7 @@ def bootstrap_statistic(
         n_bootstrap: int = 1000,
         confidence_level: float = 0.95,
         block_size: Optional[int] = None,
+        rng: Optional[np.random.RandomState] = None,
 ) -> tuple[float, float, float]:
     """
     Bootstrap confidence interval for a statistic.
@@ -294,10 +372,12 @@ def bootstrap_statistic(
         n_bootstrap: Number of bootstrap samples
         confidence_level: Confidence level for interval
         block_size: If provided, use block bootstrap
+        rng: Random state for resampling (defaults to the global one)
 
     Returns:
         (point_estimate, ci_lower, ci_upper)
     """
+    rng = rng if rng is not None else np.random
     n = len(x)
     point_estimate = statistic_func(x)
 
@@ -306,13 +386,13 @@ def bootstrap_statistic(
     for b in range(n_bootstrap):
         if block_size is None:
             # Standard bootstrap
-            indices = np.random.randint(0, n, size=n)
+            indices = rng.randint(0, n, size=n)
         else:
             # Block bootstrap
             n_blocks = (n + block_size - 1) // block_size
             indices = []
             for _ in range(n_blocks):
-                start = np.random.randint(0, n - block_size + 1)
+                start = rng.randint(0, n - block_size + 1)
                 indices.extend(range(start, start + block_size))
             indices = np.array(indices[:n])
 
@@ -19,6 +19,7 @@ import numpy as np
 from numpy.typing import NDArray
 
 from ..data.types import OHLCVData
+from .features import FeatureCache, feature_cache
 
 
 class VolatilityEstimator(Enum):
@@ -30,6 +31,16 @@ class VolatilityEstimator(Enum):
     YANG_ZHANG = auto()
 
 
+# Relative efficiency of each estimator compared to close-to-close
+EFFICIENCY_VS_CLOSE = {
+    VolatilityEstimator.CLOSE_TO_CLOSE: 1.0,
+    VolatilityEstimator.PARKINSON: 5.2,
+    VolatilityEstimator.GARMAN_KLASS: 7.4,
+    VolatilityEstimator.ROGERS_SATCHELL: 6.0,
+    VolatilityEstimator.YANG_ZHANG: 8.0,
+}
+
+
 @dataclass(frozen=True, slots=True)
 class VolatilityEstimate:
     """Result of volatility estimation."""
@@ -169,6 +180,7 @@ def estimate_volatility(
         data: OHLCVData,
         method: VolatilityEstimator = VolatilityEstimator.YANG_ZHANG,
         trading_days_per_year: float = 252.0,
+        features: Optional[FeatureCache] = None,
 ) -> VolatilityEstimate:
     """
     Estimate volatility using the specified method.
@@ -177,31 +189,24 @@ def estimate_volatility(
         data: OHLCV data
         method: Estimation method to use
         trading_days_per_year: Annualization factor
+        features: Feature cache of `data` to take the variance series from
 
     Returns:
         VolatilityEstimate with daily variance and annualized volatility
     """
-    efficiency_map = {
-        VolatilityEstimator.CLOSE_TO_CLOSE: 1.0,
-        VolatilityEstimator.PARKINSON: 5.2,
-        VolatilityEstimator.GARMAN_KLASS: 7.4,
-        VolatilityEstimator.ROGERS_SATCHELL: 6.0,
-        VolatilityEstimator.YANG_ZHANG: 8.0,
+    feature_map = {
+        VolatilityEstimator.CLOSE_TO_CLOSE: "close_to_close_variance",
+        VolatilityEstimator.PARKINSON: "parkinson_variance",
+        VolatilityEstimator.GARMAN_KLASS: "garman_klass_variance",
+        VolatilityEstimator.ROGERS_SATCHELL: "rogers_satchell_variance",
+        VolatilityEstimator.YANG_ZHANG: "yang_zhang_variance",
     }
 
-    if method == VolatilityEstimator.CLOSE_TO_CLOSE:
-        daily_var = close_to_close_variance(data.log_returns)
-    elif method == VolatilityEstimator.PARKINSON:
-        daily_var = parkinson_variance(data.highs, data.lows)
-    elif method == VolatilityEstimator.GARMAN_KLASS:
-        daily_var = garman_klass_variance(data.opens, data.highs, data.lows, data.closes)
-    elif method == VolatilityEstimator.ROGERS_SATCHELL:
-        daily_var = rogers_satchell_variance(data.opens, data.highs, data.lows, data.closes)
-    elif method == VolatilityEstimator.YANG_ZHANG:
-        daily_var = yang_zhang_variance(data.opens, data.highs, data.lows, data.closes)
-    else:
+    if method not in feature_map:
         raise ValueError(f"Unknown estimator: {method}")
 
+    daily_var = feature_cache(data, features).get(feature_map[method])
+
     # Ensure non-negative (numerical issues can cause tiny negatives)
     daily_var = max(0.0, daily_var)
 
@@ -211,23 +216,25 @@ def estimate_volatility(
         daily_variance=daily_var,
         annualized_volatility=annualized_vol,
         estimator=method,
-        efficiency_vs_close=efficiency_map[method],
+        efficiency_vs_close=EFFICIENCY_VS_CLOSE[method],
     )
 
 
 def estimate_all_volatilities(
         data: OHLCVData,
         trading_days_per_year: float = 252.0,
+        features: Optional[FeatureCache] = None,
 ) -> dict[VolatilityEstimator, VolatilityEstimate]:
     """
     Compute volatility estimates using all available methods.
 
     Useful for comparing estimators and detecting anomalies.
     """
+    features = feature_cache(data, features)
     results = {}
     for method in VolatilityEstimator:
         try:
-            results[method] = estimate_volatility(data, method, trading_days_per_year)
+            results[method] = estimate_volatility(data, method, trading_days_per_year, features)
         except (ValueError, RuntimeWarning):
             continue
     return results
@@ -15,6 +15,8 @@ from ..data.types import (
     GBMParameters,
     HestonParameters,
     GARCHParameters,
+    GJRGARCHParameters,
+    EGARCHParameters,
     RegimeSwitchingParameters,
     BlockBootstrapParameters,
 )
@@ -51,6 +53,12 @@ class ResultFormatter:
         if result.block_bootstrap:
             self._print_bootstrap(result.block_bootstrap)
 
+        if result.gjr_garch:
+            self._print_asymmetric_garch(result.gjr_garch)
+
+        if result.egarch:
+            self._print_asymmetric_garch(result.egarch)
+
         if result.warnings:
             self.console.print()
             self.console.print("[yellow]Warnings:[/yellow]")
@@ -176,6 +184,53 @@ class ResultFormatter:
         self.console.print()
         self.console.print(table)
 
+    def _print_asymmetric_garch(self, params: GJRGARCHParameters | EGARCHParameters) -> None:
+        """Print GJR-GARCH or EGARCH parameters."""
+        egarch = isinstance(params, EGARCHParameters)
+        innovations = "Gaussian" if params.nu is None else "Student-t"
+        table = Table(title=f"{'EGARCH' if egarch else 'GJR-GARCH'}(1,1), {innovations}", show_header=True)
+        table.add_column("Parameter", style="cyan")
+        table.add_column("Value", style="green")
+        table.add_column("95% CI", style="dim")
+
+        if egarch:
+            rows = [
+                ("ω (log-variance constant)", params.omega, ".4f"),
+                ("α (magnitude)", params.alpha, ".4f"),
+                ("γ (asymmetry)", params.gamma, ".4f"),
+                ("β (persistence)", params.beta, ".4f"),
+            ]
+        else:
+            rows = [
+                ("ω (constant)", params.omega, ".2e"),
+                ("α (ARCH)", params.alpha, ".4f"),
+                ("γ (asymmetry)", params.gamma, ".4f"),
+                ("β (GARCH)", params.beta, ".4f"),
+                ("α + γ/2 + β (persistence)", params.persistence, ".4f"),
+            ]
+        if params.nu is not None:
+            rows.append(("ν (degrees of freedom)", params.nu, ".2f"))
+
+        table.add_row(
+            "μ (mean return)",
+            f"{params.mu.value:.2%}",
+            f"[{params.mu.ci.lower:.2%}, {params.mu.ci.upper:.2%}]" if params.mu.ci else "—",
+        )
+        for name, param, fmt in rows:
+            table.add_row(
+                name,
+                f"{param.value:{fmt}}",
+                f"[{param.ci.lower:{fmt}}, {param.ci.upper:{fmt}}]" if param.ci else "—",
+            )
+        table.add_row(
+            "Unconditional σ",
+            f"{100 * (params.unconditional_var.value ** 0.5) * (252 ** 0.5):.2f}%",
+            "—",
+        )
+
+        self.console.print()
+        self.console.print(table)
+
     def _print_regime_switching(self, params: RegimeSwitchingParameters) -> None:
         """Print regime-switching parameters."""
         table = Table(title=f"Regime-Switching ({params.n_regimes} regimes)", show_header=True)
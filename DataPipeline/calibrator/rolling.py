@@ -0,0 +1,294 @@
+"""
+Rolling (walk-forward) calibration.
+
+Slides a fixed-length window over one dataset and re-estimates the models
+on every window, producing a table of parameters indexed by window end date.
+
+- Windows are zero-copy views of the dataset (OHLCVData.islice).
+- GBM and the range-based volatility estimators are computed for all windows
+  at once from cumulative sums of the per-bar series.
+- The GARCH models and regime-switching start from the previous window's
+  solution.
+"""
+
+from dataclasses import dataclass, fields
+from typing import Callable, Iterable
+
+import numpy as np
+import pandas as pd
+from numpy.typing import NDArray
+
+from .core import Calibrator, CalibratorConfig
+from .data.types import (
+    ModelType,
+    OHLCVData,
+    ParameterEstimate,
+    RegimeSwitchingParameters,
+)
+from .math.features import FeatureCache
+from .math.volatility import EFFICIENCY_VS_CLOSE, VolatilityEstimator
+
+
+@dataclass
+class RollingConfig:
+    """Configuration for rolling calibration."""
+    window: int = 252  # Bars per window
+    step: int = 21  # Bars between consecutive window ends
+    warm_start: bool = True  # Start optimizers from the previous window's solution
+
+
+class RollingCalibrator:
+    """
+    Re-estimates models over a sliding window.
+
+    Usage:
+        rolling = RollingCalibrator(RollingConfig(window=252, step=21))
+        table = rolling.run(data)
+        table["garch_persistence"].plot()
+    """
+
+    def __init__(
+            self,
+            rolling_config: RollingConfig | None = None,
+            config: CalibratorConfig | None = None,
+            models: Iterable[ModelType] | None = None,
+            progress_callback: Callable[[str], None] | None = None,
+    ):
+        """
+        Args:
+            rolling_config: Window length, step and warm start switch
+            config: Calibration configuration
+            models: Models to estimate (defaults to the ones enabled in config)
+            progress_callback: Optional callback for progress updates
+        """
+        self.rolling_config = rolling_config or RollingConfig()
+        self.calibrator = Calibrator(config)
+        self.progress_callback = progress_callback or (lambda x: None)
+
+        if self.rolling_config.window < 3:
+            raise ValueError("Window must span at least 3 bars")
+        if self.rolling_config.step < 1:
+            raise ValueError("Step must be at least 1 bar")
+
+        self._models = [step.model for step in self.calibrator._steps(models)]
+
+    def windows(self, data: OHLCVData) -> list[tuple[int, int]]:
+        """(start, stop) bar indices of every window, oldest first."""
+        window, step = self.rolling_config.window, self.rolling_config.step
+        return [(stop - window, stop) for stop in range(window, len(data) + 1, step)]
+
+    def run(self, data: OHLCVData) -> pd.DataFrame:
+        """
+        Calibrate every window of the dataset.
+
+        Returns:
+            DataFrame indexed by window end date, with the window start date,
+            one column per parameter value ("garch_alpha") and standard error
+            ("garch_alpha_se"), and the window's warnings. Parameters of a
+            model that failed on a window are NaN.
+        """
+        windows = self.windows(data)
+        if not windows:
+            raise ValueError(
+                f"Need at least {self.rolling_config.window} bars, got {len(data)}"
+            )
+
+        starts = np.array([s for s, _ in windows])
+        stops = np.array([e for _, e in windows])
+
+        table = pd.DataFrame(
+            {"start_date": data.dates[starts], "n_observations": stops - starts},
+            index=pd.Index(data.dates[stops - 1], name="end_date"),
+        )
+
+        # Closed-form estimators, all windows at once
+        table = table.assign(**_rolling_volatility(
+            data, starts, stops, self.calibrator.config.trading_days_per_year
+        ))
+        if ModelType.GBM in self._models:
+            table = table.assign(**_rolling_gbm(
+                table, data, starts, stops, self.calibrator.config,
+                self.calibrator._gbm_estimator.volatility_method,
+            ))
+
+        # Iterative estimators, window by window
+        rows, warnings = self._estimate_windows(data, windows)
+        if rows:
+            table = pd.concat([table, pd.DataFrame(rows, index=table.index)], axis=1)
+        table["warnings"] = warnings
+
+        return table
+
+    def _estimate_windows(self, data: OHLCVData, windows: list[tuple[int, int]]):
+        estimators = self.calibrator._estimators
+        models = [m for m in self._models if m != ModelType.GBM]
+        if not models:
+            return [], [[] for _ in windows]
+
+        rows, warnings = [], []
+        previous: dict[ModelType, object] = {}
+
+        for i, (start, stop) in enumerate(windows):
+            self.progress_callback(f"Calibrating window {i + 1}/{len(windows)}...")
+            view = data.islice(start, stop)
+            features = FeatureCache(view)
+            row, window_warnings = {}, []
+
+            for model in models:
+                kwargs = {}
+                if self.rolling_config.warm_start and previous.get(model) is not None:
+                    kwargs = _warm_start(model, previous[model])
+
+                try:
+                    params = estimators[model].estimate(view, features, **kwargs)
+                except Exception as e:
+                    window_warnings.append(f"{model.name} estimation failed: {e}")
+                    previous[model] = None
+                    continue
+
+                previous[model] = params
+                row.update(_flatten(model, params))
+                window_warnings.extend(estimators[model].warnings)
+
+            rows.append(row)
+            warnings.append(window_warnings)
+
+        return rows, warnings
+
+
+def _warm_start(model: ModelType, params) -> dict:
+    """Estimator keyword arguments that start from the previous window's solution."""
+    if model == ModelType.GARCH:
+        return {"initial_params": (params.omega.value, params.alpha.value, params.beta.value)}
+    if model in (ModelType.GJR_GARCH, ModelType.EGARCH):
+        initial = [params.omega.value, params.alpha.value, params.gamma.value, params.beta.value]
+        if params.nu is not None:
+            initial.append(params.nu.value)
+        return {"initial_params": initial}
+    if model == ModelType.REGIME_SWITCHING:
+        return {"initial": params}
+    return {}
+
+
+_PREFIXES = {
+    ModelType.GBM: "gbm",
+    ModelType.HESTON: "heston",
+    ModelType.GARCH: "garch",
+    ModelType.REGIME_SWITCHING: "regime",
+    ModelType.BLOCK_BOOTSTRAP: "bootstrap",
+    ModelType.GJR_GARCH: "gjr_garch",
+    ModelType.EGARCH: "egarch",
+}
+
+
+def _flatten(model: ModelType, params) -> dict[str, float]:
+    """Parameter values and standard errors as flat columns."""
+    prefix = _PREFIXES[model]
+    row = {}
+
+    if isinstance(params, RegimeSwitchingParameters):
+        for i, regime in enumerate(params.regimes):
+            row.update(_estimate_columns(f"{prefix}_{i}_mu", regime.mu))
+            row.update(_estimate_columns(f"{prefix}_{i}_sigma", regime.sigma))
+            row[f"{prefix}_{i}_stay"] = float(params.transition_matrix[i, i])
+            row[f"{prefix}_{i}_weight"] = float(params.stationary_distribution[i])
+        return row
+
+    for f in fields(params):
+        value = getattr(params, f.name)
+        if isinstance(value, ParameterEstimate):
+            row.update(_estimate_columns(f"{prefix}_{f.name}", value))
+    return row
+
+
+def _estimate_columns(name: str, estimate: ParameterEstimate) -> dict[str, float]:
+    se = estimate.std_error
+    return {name: estimate.value, f"{name}_se": np.nan if se is None else se}
+
+
+def _window_sums(series: NDArray[np.float64], starts, stops) -> tuple[NDArray, NDArray]:
+    """
+    Sums of x and x² over series[starts[i]:stops[i]] for every window.
+
+    The series is centered on its overall mean first, which keeps the
+    difference of cumulative sums accurate for variances.
+    """
+    centered = series - series.mean()
+    s1 = np.concatenate(([0.0], np.cumsum(centered)))
+    s2 = np.concatenate(([0.0], np.cumsum(centered ** 2)))
+    return s1[stops] - s1[starts], s2[stops] - s2[starts]
+
+
+def _window_mean(series, starts, stops) -> NDArray[np.float64]:
+    total, _ = _window_sums(series, starts, stops)
+    return total / (stops - starts) + series.mean()
+
+
+def _window_var(series, starts, stops) -> NDArray[np.float64]:
+    """Sample variance (ddof=1) of every window."""
+    total, total_sq = _window_sums(series, starts, stops)
+    n = stops - starts
+    with np.errstate(divide="ignore", invalid="ignore"):
+        return (total_sq - total ** 2 / n) / (n - 1)
+
+
+def _rolling_daily_variances(data: OHLCVData, starts, stops) -> dict[str, NDArray[np.float64]]:
+    """
+    Daily variance of every window by each range-based estimator.
+
+    Window [s, e) covers bars s..e-1 and returns s..e-2, matching
+    estimate_volatility() on data.islice(s, e).
+    """
+    features = FeatureCache(data)
+    ret_stops = stops - 1
+
+    # Yang-Zhang drops the window's first bar (it has no previous close)
+    n = stops - starts - 1
+    with np.errstate(divide="ignore", invalid="ignore"):
+        k = 0.34 / (1.34 + (n + 1) / (n - 1))
+    yang_zhang = (
+        _window_var(features.get("log_overnight"), starts, ret_stops)
+        + k * _window_var(features.get("log_co"), starts + 1, stops)
+        + (1 - k) * _window_mean(features.get("rogers_satchell"), starts + 1, stops)
+    )
+    yang_zhang[n < 2] = np.nan
+
+    return {
+        "close_to_close": _window_var(data.log_returns, starts, ret_stops),
+        "parkinson": _window_mean(features.get("parkinson"), starts, stops),
+        "garman_klass": _window_mean(features.get("garman_klass"), starts, stops),
+        "rogers_satchell": _window_mean(features.get("rogers_satchell"), starts, stops),
+        "yang_zhang": yang_zhang,
+    }
+
+
+def _rolling_volatility(data: OHLCVData, starts, stops, trading_days_per_year: float) -> dict[str, NDArray]:
+    """Annualized volatility of every window by each estimator."""
+    return {
+        f"vol_{name}": np.sqrt(np.maximum(variance, 0.0) * trading_days_per_year)
+        for name, variance in _rolling_daily_variances(data, starts, stops).items()
+    }
+
+
+def _rolling_gbm(
+        table: pd.DataFrame,
+        data: OHLCVData,
+        starts,
+        stops,
+        config: CalibratorConfig,
+        volatility_method: VolatilityEstimator,
+) -> dict[str, NDArray]:
+    """GBMEstimator (with the given volatility method) for every window, from the rolling columns."""
+    t = config.trading_days_per_year
+    n = stops - starts - 1  # returns per window
+
+    sigma = table[f"vol_{volatility_method.name.lower()}"].to_numpy()
+    sigma_daily = sigma / np.sqrt(t)
+    mean_log_return = _window_mean(data.log_returns, starts, stops - 1)
+
+    return {
+        "gbm_mu": mean_log_return * t + 0.5 * sigma ** 2,
+        "gbm_mu_se": sigma_daily / np.sqrt(n) * t,
+        "gbm_sigma": sigma,
+        "gbm_sigma_se": sigma / np.sqrt(2 * n) / np.sqrt(EFFICIENCY_VS_CLOSE[volatility_method]),
+    }
@@ -0,0 +1,52 @@
+"""Shared fixtures; lives at the DataPipeline root so its modules are importable in tests."""
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from calibrator.data import OHLCVData
+
+
+def make_ohlcv(
+        n: int = 500,
+        ticker: str = "TEST",
+        start: str = "2020-01-01",
+        seed: int = 0,
+        params: tuple[float, float, float] = (2e-6, 0.08, 0.9),
+) -> OHLCVData:
+    """Business-day OHLCV bars whose log returns follow GARCH(1,1) with `params`."""
+    rng = np.random.default_rng(seed)
+    omega, alpha, beta = params
+
+    returns = np.empty(n - 1)
+    h = omega / (1.0 - alpha - beta)
+    for t in range(n - 1):
+        returns[t] = np.sqrt(h) * rng.standard_normal()
+        h = omega + alpha * returns[t] ** 2 + beta * h
+
+    closes = 100.0 * np.exp(np.concatenate(([0.0], np.cumsum(returns))))
+    opens = np.concatenate(([closes[0]], closes[:-1]))
+    spread = np.abs(rng.normal(0.0, 0.005, size=(2, n)))
+    highs = np.maximum(opens, closes) * (1.0 + spread[0])
+    lows = np.minimum(opens, closes) * (1.0 - spread[1])
+    volumes = rng.integers(1_000, 1_000_000, size=n).astype(float)
+    dates = pd.bdate_range(start, periods=n).values.astype("datetime64[D]")
+
+    return OHLCVData.from_arrays(dates, opens, highs, lows, closes, volumes, ticker=ticker)
+
+
+def central_differences(f, x, rel_step=1e-5):
+    """Jacobian of f at x by central differences, one column per coordinate."""
+    columns = []
+    for i in range(len(x)):
+        step = rel_step * abs(x[i])
+        up, down = x.copy(), x.copy()
+        up[i] += step
+        down[i] -= step
+        columns.append((np.asarray(f(up)) - np.asarray(f(down))) / (2 * step))
+    return np.stack(columns, axis=-1)
+
+
+@pytest.fixture
+def ohlcv() -> OHLCVData:
+    return make_ohlcv()
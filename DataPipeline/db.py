@@ -70,6 +70,8 @@ class Database:
         if key == "garch": return "Garch"
         if key == "regime_switching": return "RegimeSwitching"
         if key == "block_bootstrap": return "BlockedBootstrap"
+        if key == "gjr_garch": return "GjrGarch"
+        if key == "egarch": return "EGarch"
         return key.capitalize()
 
     def save_correlations(self, correlations: list[dict]):
@@ -1,40 +1,503 @@
-import yfinance as yf
+import os
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from datetime import timedelta
+from pathlib import Path
+
+import numpy as np
 import pandas as pd
-from calibrator.data import OHLCVData, OHLCVLoader
+from calibrator.data import OHLCVData, OHLCVLoader, DataLoadError, save_ohlcv_store
+from sources import DataSource, YahooSource, period_start
+
+# Local history cache, one .ohlcv store per ticker
+DEFAULT_CACHE_DIR = Path(__file__).resolve().parent / ".market_cache"
+
+# Cached history younger than this is served without any network request
+DEFAULT_CACHE_TTL = 12 * 3600  # seconds
+
+# Days re-downloaded before the last cached bar, to detect revised history
+# (e.g. dividend adjustments) when fetching only the delta
+DELTA_OVERLAP_DAYS = 10
+
+# Days a cached history may start after the beginning of the requested period
+# and still count as covering it (weekends and holidays at the period start)
+PERIOD_START_TOLERANCE_DAYS = 7
+
+# Provider request budget shared by all fetch threads
+DEFAULT_REQUESTS_PER_SECOND = 2.0
+DEFAULT_BURST = 4
+DEFAULT_MAX_WORKERS = 4
+
+# Symbols per multi-ticker download request
+DEFAULT_BATCH_SIZE = 100
+
+
+class _BatchRequestError(Exception):
+    """A multi-ticker request failed as a whole."""
+
+
+def _batches(items: list, size: int):
+    for i in range(0, len(items), size):
+        yield items[i:i + size]
+
+
+def _ticker_frame(combined: pd.DataFrame, ticker: str, tickers: list[str]) -> pd.DataFrame:
+    """The columns of one ticker in a multi-ticker download, without its empty rows."""
+    if isinstance(combined.columns, pd.MultiIndex):
+        if ticker not in combined.columns.get_level_values(0):
+            raise ValueError(f"No data found for {ticker}")
+        frame = combined[ticker]
+    elif len(tickers) == 1:
+        frame = combined
+    else:
+        raise ValueError(f"Unexpected batch response layout for {ticker}")
+
+    # Dates on which only other tickers traded come back as all-NaN rows
+    return frame.dropna(how="all")
+
+
+class RateLimiter:
+    """
+    Thread-safe token bucket.
+
+    Tokens refill at `rate` per second up to `burst`. Each request takes one
+    token; callers that find the bucket empty reserve a future token and
+    sleep until it is due, so waiting threads are served in arrival order.
+    """
+
+    def __init__(self, rate: float, burst: int = 1, clock=time.monotonic, sleep=time.sleep):
+        if rate <= 0:
+            raise ValueError("Rate must be positive")
+        self.rate = rate
+        self.burst = max(1, burst)
+        self._clock = clock
+        self._sleep = sleep
+        self._tokens = float(self.burst)
+        self._updated = clock()
+        self._lock = threading.Lock()
+
+    def acquire(self) -> None:
+        """Block until a request may be made."""
+        with self._lock:
+            now = self._clock()
+            self._tokens = min(self.burst, self._tokens + (now - self._updated) * self.rate)
+            self._updated = now
+            self._tokens -= 1
+            wait = -self._tokens / self.rate if self._tokens < 0 else 0.0
+
+        if wait > 0:
+            self._sleep(wait)
+
+
+@dataclass
+class FetchResults:
+    """Outcome of fetching many tickers: loaded data and per-ticker errors."""
+    data: dict[str, OHLCVData] = field(default_factory=dict)
+    errors: dict[str, str] = field(default_factory=dict)
+
+
+class MarketDataStore:
+    """
+    Market data shared by all stages of one pipeline run.
+
+    Each ticker is fetched at most once per store; later requests for it are
+    served from memory, including a recorded failure.
+    """
+
+    def __init__(self, fetcher: "DataFetcher"):
+        self.fetcher = fetcher
+        self._fetched = FetchResults()
+
+    def load(self, tickers: list[str]) -> FetchResults:
+        """Returns data and errors for the given tickers, fetching only the ones not seen yet."""
+        tickers = list(dict.fromkeys(tickers))
+        missing = [t for t in tickers if t not in self._fetched.data and t not in self._fetched.errors]
+
+        if missing:
+            fetched = self.fetcher.fetch_all(missing)
+            self._fetched.data.update(fetched.data)
+            self._fetched.errors.update(fetched.errors)
+
+        return FetchResults(
+            data={t: self._fetched.data[t] for t in tickers if t in self._fetched.data},
+            errors={t: self._fetched.errors[t] for t in tickers if t in self._fetched.errors},
+        )
+
+    def get(self, ticker: str) -> OHLCVData:
+        """Returns the data of one ticker, raising ValueError if it could not be fetched."""
+        result = self.load([ticker])
+        if ticker in result.errors:
+            raise ValueError(f"No data for {ticker}: {result.errors[ticker]}")
+        return result.data[ticker]
 
 
 class DataFetcher:
-    def __init__(self):
+    def __init__(
+            self,
+            source: DataSource | None = None,
+            cache_dir: str | Path | None = DEFAULT_CACHE_DIR,
+            cache_ttl: float = DEFAULT_CACHE_TTL,
+            offline: bool = False,
+            rate_limiter: RateLimiter | None = None,
+            max_retries: int = 3,
+            retry_backoff: float = 1.0,
+    ):
+        """
+        Args:
+            source: Provider of price histories (defaults to Yahoo Finance)
+            cache_dir: Directory for cached histories (None disables the cache)
+            cache_ttl: Seconds a cached history is served without checking for new bars
+            offline: Never touch the network; serve everything from the cache
+            rate_limiter: Budget for provider requests (defaults to
+                DEFAULT_REQUESTS_PER_SECOND with bursts of DEFAULT_BURST)
+            max_retries: Extra attempts for a failed request
+            retry_backoff: Seconds before the first retry, doubled for each next one
+        """
         self.loader = OHLCVLoader()
+        self.source = source or YahooSource()
+        self.cache_dir = Path(cache_dir) if cache_dir is not None else None
+        self.cache_ttl = cache_ttl
+        self.offline = offline
+        self.rate_limiter = rate_limiter or RateLimiter(DEFAULT_REQUESTS_PER_SECOND, DEFAULT_BURST)
+        self.max_retries = max_retries
+        self.retry_backoff = retry_backoff
+
+        # Start of the period of each full download, by ticker, until the
+        # download is written to the cache
+        self._full_starts: dict[str, pd.Timestamp] = {}
+
+        if self.cache_dir is not None:
+            self.cache_dir.mkdir(parents=True, exist_ok=True)
+
+    def fetch_ticker(self, ticker_symbol: str, period="10y", force_refresh: bool = False) -> OHLCVData:
+        """
+        Returns the history of a ticker as OHLCVData.
+
+        With a cache, a fresh cached history is returned as is; a stale one is
+        extended with only the bars after its last date. A cached history that
+        does not cover `period` (e.g. cached for "1y", now asked for "10y") is
+        downloaded again in full, unless an earlier full download showed that
+        the source has no older bars. force_refresh skips the cache and
+        downloads the full period again.
+        """
+        cached = None if force_refresh else self._read_cache(ticker_symbol)
+        short = cached is not None and not self._covers(cached, period)
+
+        if cached is not None and (self.offline or (not short and self._cache_age(ticker_symbol) < self.cache_ttl)):
+            if short:
+                print(f"   ⚠️ Cached {ticker_symbol} does not cover {period} (offline mode).")
+            print(f"📦 Using cached {ticker_symbol} ({len(cached)} bars).")
+            return cached
+
+        if self.offline:
+            raise ValueError(f"No cached data for {ticker_symbol} (offline mode)")
+
+        try:
+            if cached is None or short:
+                data = self._download(ticker_symbol, period=period)
+            else:
+                data = self._update(cached, period=period)
+        except Exception as e:
+            if cached is None:
+                raise
+            print(f"   ⚠️ Update failed ({e}), using cached {ticker_symbol}.")
+            return cached
+
+        self._write_cache(data, unchanged=data is cached)
+        return data
+
+    def fetch_all(self, tickers: list[str], max_workers: int = DEFAULT_MAX_WORKERS) -> FetchResults:
+        """
+        Fetches many tickers concurrently.
+
+        Requests from all threads share the rate limiter, so N uncached tickers
+        take roughly N / rate seconds. A failing ticker is reported in
+        FetchResults.errors and does not affect the others.
+        """
+        tickers = list(dict.fromkeys(tickers))  # unique, order kept
+        results = FetchResults()
+
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            futures = {ticker: executor.submit(self.fetch_ticker, ticker) for ticker in tickers}
+
+        for ticker, future in futures.items():
+            try:
+                results.data[ticker] = future.result()
+            except Exception as e:
+                results.errors[ticker] = str(e)
+
+        return results
+
+    def fetch_many(
+            self,
+            tickers: list[str],
+            period="10y",
+            force_refresh: bool = False,
+            batch_size: int = DEFAULT_BATCH_SIZE,
+    ) -> FetchResults:
+        """
+        Fetches many tickers with the provider's multi-symbol download.
+
+        Follows the same cache rules as fetch_ticker: fresh cached histories
+        are served as is, stale ones are extended with one bulk request for
+        their recent bars, and uncached tickers, or cached ones not covering
+        `period`, are downloaded in batches of `batch_size` symbols. A ticker
+        missing from a batch response is reported in FetchResults.errors
+        without failing the rest.
+        """
+        tickers = list(dict.fromkeys(tickers))
+        results = FetchResults()
+        stale: dict[str, OHLCVData] = {}
+        short: dict[str, OHLCVData] = {}
+        missing: list[str] = []
+
+        for ticker in tickers:
+            cached = None if force_refresh else self._read_cache(ticker)
+            covers = cached is not None and self._covers(cached, period)
+            if cached is not None and (self.offline or (covers and self._cache_age(ticker) < self.cache_ttl)):
+                results.data[ticker] = cached
+            elif self.offline:
+                results.errors[ticker] = f"No cached data for {ticker} (offline mode)"
+            elif cached is None:
+                missing.append(ticker)
+            elif not covers:
+                short[ticker] = cached
+                missing.append(ticker)
+            else:
+                stale[ticker] = cached
+
+        if results.data:
+            print(f"📦 Using cached data for {len(results.data)} tickers.")
+
+        for batch in _batches(missing, batch_size):
+            for ticker, outcome in self._download_batch(batch, period=period).items():
+                if isinstance(outcome, Exception) and ticker in short:
+                    print(f"   ⚠️ Download failed ({outcome}), using cached {ticker}.")
+                    results.data[ticker] = short[ticker]
+                elif isinstance(outcome, Exception):
+                    results.errors[ticker] = str(outcome)
+                else:
+                    self._write_cache(outcome)
+                    results.data[ticker] = outcome
+
+        for batch in _batches(list(stale), batch_size):
+            start = min(stale[t].dates[-1].item() for t in batch) - timedelta(days=DELTA_OVERLAP_DAYS)
+            for ticker, outcome in self._download_batch(batch, start=start).items():
+                cached = stale[ticker]
+                try:
+                    if isinstance(outcome, (ValueError, DataLoadError)):
+                        # Nothing (or too little) new to convert
+                        outcome = None
+                    elif isinstance(outcome, Exception):
+                        raise outcome
+                    data = self._apply_update(cached, outcome, period=period)
+                except Exception as e:
+                    print(f"   ⚠️ Update failed ({e}), using cached {ticker}.")
+                    results.data[ticker] = cached
+                    continue
+
+                self._write_cache(data, unchanged=data is cached)
+                results.data[ticker] = data
+
+        # Report in request order
+        return FetchResults(
+            data={t: results.data[t] for t in tickers if t in results.data},
+            errors={t: results.errors[t] for t in tickers if t in results.errors},
+        )
 
-    def fetch_ticker(self, ticker_symbol: str, period="10y") -> OHLCVData:
+    def _with_retries(self, description: str, request, *args, **kwargs):
+        """Rate-limited provider request, retried with exponential backoff."""
+        for attempt in range(self.max_retries + 1):
+            self.rate_limiter.acquire()
+            try:
+                return request(*args, **kwargs)
+            except Exception as e:
+                if attempt == self.max_retries:
+                    raise
+                delay = self.retry_backoff * 2 ** attempt
+                print(f"   ⚠️ Request for {description} failed ({e}), retrying in {delay:.1f}s...")
+                time.sleep(delay)
+
+    def _download(self, ticker_symbol: str, period="10y", start=None) -> OHLCVData:
         """
-        Downloads data from Yahoo Finance and converts it to OHLCVData.
+        Downloads data from the source and converts it to OHLCVData.
         """
         print(f"⬇️ Downloading {ticker_symbol}...")
 
-        # 1. Download from Yahoo
-        ticker = yf.Ticker(ticker_symbol)
-        df = ticker.history(period=period)
+        # 1. Download from the source
+        df = self._with_retries(ticker_symbol, self.source.history, ticker_symbol, period=period, start=start)
 
+        # 2. Convert using the library's loader
+        try:
+            ohlcv_data = self._frame_to_ohlcv(df, ticker_symbol)
+            if start is None:
+                self._record_full_download(ohlcv_data, period)
+            print(f"   ✅ Loaded {len(ohlcv_data)} bars.")
+            return ohlcv_data
+        except DataLoadError as e:
+            print(f"   ❌ Conversion failed: {e}")
+            raise e
+
+    def _download_batch(self, tickers: list[str], period="10y", start=None) -> dict[str, OHLCVData | Exception]:
+        """
+        Downloads several tickers in one request.
+
+        Returns the OHLCVData of every ticker, or the exception that prevented
+        loading it. A failed request marks the whole batch as failed.
+        """
+        print(f"⬇️ Downloading {len(tickers)} tickers in one batch...")
+
+        try:
+            combined = self._with_retries(
+                f"{len(tickers)} tickers", self.source.batch_history, tickers, period=period, start=start
+            )
+        except Exception as e:
+            print(f"   ❌ Batch download failed: {e}")
+            error = _BatchRequestError(str(e))
+            return {ticker: error for ticker in tickers}
+
+        outcomes: dict[str, OHLCVData | Exception] = {}
+        for ticker in tickers:
+            try:
+                outcomes[ticker] = self._frame_to_ohlcv(_ticker_frame(combined, ticker, tickers), ticker)
+                if start is None:
+                    self._record_full_download(outcomes[ticker], period)
+            except (ValueError, DataLoadError) as e:
+                outcomes[ticker] = e
+
+        n_loaded = sum(not isinstance(o, Exception) for o in outcomes.values())
+        print(f"   ✅ Loaded {n_loaded}/{len(tickers)} tickers.")
+        return outcomes
+
+    def _frame_to_ohlcv(self, df: pd.DataFrame, ticker_symbol: str) -> OHLCVData:
+        """Converts a provider frame indexed by date into OHLCVData."""
         if df.empty:
             raise ValueError(f"No data found for {ticker_symbol}")
 
-        # 2. Clean up DataFrame for the Loader
-        # yfinance returns columns like "Open", "High", etc.
-        # The loader expects lower case or standard names.
-        df.reset_index(inplace=True)
+        # Sources return yfinance-style columns ("Open", "High", etc.) with the dates as
+        # index; the loader detects those names once the index is a column.
+        df = df.reset_index()
 
         # Ensure timezone naive dates (Postgres preference usually, but loader handles it)
         if 'Date' in df.columns:
             df['Date'] = pd.to_datetime(df['Date']).dt.date
 
-        # 3. Convert using the library's loader
         # This validates the data structure automatically
+        return self.loader.load_from_dataframe(df, ticker=ticker_symbol)
+
+    def _update(self, cached: OHLCVData, period="10y") -> OHLCVData:
+        """
+        Extends a cached history with the bars after its last date.
+
+        A short overlap is downloaded along with the new bars. If the overlap
+        no longer matches the cache, the history has been revised upstream and
+        the full period is downloaded again.
+        """
+        last_date = cached.dates[-1].item()
+
         try:
-            ohlcv_data = self.loader.load_from_dataframe(df, ticker=ticker_symbol)
-            print(f"   ✅ Loaded {len(ohlcv_data)} bars.")
-            return ohlcv_data
-        except Exception as e:
-            print(f"   ❌ Conversion failed: {e}")
-            raise e
\ No newline at end of file
+            recent = self._download(cached.ticker, start=last_date - timedelta(days=DELTA_OVERLAP_DAYS))
+        except (ValueError, DataLoadError):
+            # Nothing (or too little) new to convert, e.g. over a long weekend
+            recent = None
+
+        return self._apply_update(cached, recent, period=period)
+
+    def _apply_update(self, cached: OHLCVData, recent: OHLCVData | None, period="10y") -> OHLCVData:
+        """Merges recently downloaded bars into a cached history (see _update)."""
+        ticker_symbol = cached.ticker
+
+        if recent is not None:
+            overlap = (recent.dates >= cached.dates[0]) & (recent.dates <= cached.dates[-1])
+            positions = np.minimum(np.searchsorted(cached.dates, recent.dates[overlap]), len(cached) - 1)
+            revised = (
+                not np.array_equal(cached.dates[positions], recent.dates[overlap])
+                or not np.allclose(cached.closes[positions], recent.closes[overlap], rtol=1e-4)
+            )
+            if revised:
+                print(f"   🔄 History of {ticker_symbol} was revised, refreshing.")
+                return self._download(ticker_symbol, period=period)
+
+            new_rows = recent.dates > cached.dates[-1]
+            if new_rows.any():
+                data = cached.append({
+                    "dates": recent.dates[new_rows],
+                    "opens": recent.opens[new_rows],
+                    "highs": recent.highs[new_rows],
+                    "lows": recent.lows[new_rows],
+                    "closes": recent.closes[new_rows],
+                    "volumes": recent.volumes[new_rows],
+                })
+                print(f"   ➕ Added {int(new_rows.sum())} new bars to {ticker_symbol}.")
+                return data
+
+        print(f"   ✅ {ticker_symbol} is up to date.")
+        return cached
+
+    def _covers(self, cached: OHLCVData, period) -> bool:
+        """
+        Whether a cached history holds everything the source has for
+        `period`, counted back from its last bar.
+
+        That is the case if it reaches back to the start of the period, or
+        if its last full download asked for a period starting at least as
+        early: the source then had nothing older, e.g. for a recent listing.
+        """
+        first = period_start(pd.Timestamp(cached.dates[-1]), period) + timedelta(days=PERIOD_START_TOLERANCE_DAYS)
+        if cached.dates[0] <= first.to_datetime64():
+            return True
+
+        full_start = self._read_full_start(cached.ticker)
+        return full_start is not None and full_start <= first
+
+    def _record_full_download(self, data: OHLCVData, period) -> None:
+        """Notes the period start of a full download, stored with it by _write_cache."""
+        if self.cache_dir is not None:
+            self._full_starts[data.ticker.upper()] = period_start(pd.Timestamp(data.dates[-1]), period)
+
+    def _cache_path(self, ticker_symbol: str) -> Path:
+        return self.cache_dir / f"{ticker_symbol.upper()}.ohlcv"
+
+    def _full_start_path(self, ticker_symbol: str) -> Path:
+        """Start of the period the cached history was last downloaded in full for."""
+        return self.cache_dir / f"{ticker_symbol.upper()}.full_start"
+
+    def _read_full_start(self, ticker_symbol: str) -> pd.Timestamp | None:
+        try:
+            return pd.Timestamp(self._full_start_path(ticker_symbol).read_text().strip())
+        except (OSError, ValueError):
+            return None
+
+    def _read_cache(self, ticker_symbol: str) -> OHLCVData | None:
+        if self.cache_dir is None:
+            return None
+
+        path = self._cache_path(ticker_symbol)
+        if not path.exists():
+            return None
+
+        try:
+            return self.loader.load_mmap(path, ticker=ticker_symbol)
+        except DataLoadError as e:
+            print(f"   ⚠️ Ignoring unreadable cache for {ticker_symbol}: {e}")
+            return None
+
+    def _write_cache(self, data: OHLCVData, unchanged: bool = False) -> None:
+        if self.cache_dir is None:
+            return
+
+        path = self._cache_path(data.ticker)
+        if unchanged:
+            # Nothing new upstream: just mark the cached history as checked
+            os.utime(path)
+        else:
+            save_ohlcv_store(data, path)
+
+        full_start = self._full_starts.pop(data.ticker.upper(), None)
+        if full_start is not None:
+            self._full_start_path(data.ticker).write_text(full_start.isoformat())
+
+    def _cache_age(self, ticker_symbol: str) -> float:
+        return time.time() - self._cache_path(ticker_symbol).stat().st_mtime
@@ -1,15 +1,22 @@
 import time
 import argparse
-from fetcher import DataFetcher
+from fetcher import DataFetcher, MarketDataStore
+from sources import ReplaySource
 from db import Database
-from calibrator import Calibrator, CalibratorConfig
+from calibrator import CalibratorConfig, ResultCache
 from correlations import calculate_and_save_correlations
+from pipeline import CalibrationPipeline, DEFAULT_CALIBRATE_WORKERS, DEFAULT_RESULT_CACHE_DIR
 
 # Configuration
 TICKERS = ["SPY", "QQQ", "IWM", "DIA", "VIX", "TLT", "GLD"]
 
 
-def run_calibration(fetcher: DataFetcher, db: Database):
+def run_calibration(
+        store: MarketDataStore,
+        db: Database,
+        workers: int = DEFAULT_CALIBRATE_WORKERS,
+        result_cache: ResultCache | None = None,
+):
     print("--- 🚀 Starting Parameter Calibration ---")
 
     # Configure Math Engine
@@ -19,55 +26,31 @@ def run_calibration(fetcher: DataFetcher, db: Database):
         estimate_garch=True,
         estimate_regime_switching=True,
         estimate_bootstrap=True,
+        estimate_gjr_garch=False,
+        estimate_egarch=False,
         n_regimes=2
     )
-    calibrator = Calibrator(calib_config)
 
-    for ticker in TICKERS:
-        process_single_ticker(ticker, fetcher, calibrator, db)
-        time.sleep(1)  # Be nice to API
-
-
-def process_single_ticker(ticker, fetcher, calibrator, db):
-    try:
-        # 1. Fetch
-        data = fetcher.fetch_ticker(ticker)
-
-        # 2. Save Raw History
-        raw_history = []
-        import pandas as pd
-        import numpy as np
-
-        series = pd.Series(data.closes)
-        returns = series.pct_change()
-        # Simple rolling vol for UI visualization
-        rolling_vol = returns.rolling(20).std() * np.sqrt(252)
-        rolling_vol = rolling_vol.fillna(0.2)
-
-        for i in range(len(data.closes)):
-            raw_history.append({
-                "Price": round(data.closes[i], 4),
-                "Vol": round(rolling_vol.iloc[i], 4)
-            })
-
-        db.save_market_data(ticker, raw_history)
-
-        # 3. Calibrate
-        print(f"   🧮 Calibrating models for {ticker}...")
-        calibration_result = calibrator.calibrate(data)
+    # Fetch, calibrate and save concurrently, ticker by ticker; calibration
+    # runs in `workers` processes that receive only the price arrays
+    pipeline = CalibrationPipeline(
+        store, db, calib_config,
+        calibrate_workers=workers,
+        report_interval=5.0,
+        result_cache=result_cache,
+    )
+    pipeline.run(TICKERS)
 
-        # 4. Save Parameters
-        db.save_calibration_result(calibration_result)
-        print(f"   ✨ Finished {ticker}")
 
-    except Exception as e:
-        print(f"   ❌ Error processing {ticker}: {e}")
+def run_correlations(store: MarketDataStore, db: Database):
+    print("--- 🔗 Starting Correlation Analysis ---")
 
+    # Already loaded by the calibration stage when running --mode all
+    fetched = store.load(TICKERS)
+    for ticker, error in fetched.errors.items():
+        print(f"   ⚠️ Skipping {ticker} for correlation: {error}")
 
-def run_correlations(db: Database):
-    print("--- 🔗 Starting Correlation Analysis ---")
-    # This function handles its own fetching to ensure alignment
-    calculate_and_save_correlations(TICKERS, db)
+    calculate_and_save_correlations([fetched.data[t] for t in TICKERS if t in fetched.data], db)
 
 
 if __name__ == "__main__":
@@ -80,18 +63,46 @@ if __name__ == "__main__":
         default="all",
         help="Which part of the pipeline to run."
     )
+    parser.add_argument(
+        "--offline",
+        action="store_true",
+        help="Use only the local market data cache, no downloads."
+    )
+    parser.add_argument(
+        "--replay",
+        metavar="DIR",
+        help="Serve recorded histories from DIR (e.g. the market data cache) instead of Yahoo Finance."
+    )
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=DEFAULT_CALIBRATE_WORKERS,
+        help="Processes calibrating tickers in parallel (results do not depend on it)."
+    )
+    parser.add_argument(
+        "--no-result-cache",
+        action="store_true",
+        help="Recalibrate every ticker, even if its data and config are unchanged since the last run."
+    )
     args = parser.parse_args()
 
     # 2. Init Shared Services
     start_time = time.time()
     db_instance = Database()
-    fetcher_instance = DataFetcher()
+    if args.replay:
+        # Recorded data only: nothing to download, nothing to cache
+        fetcher_instance = DataFetcher(source=ReplaySource(args.replay), cache_dir=None)
+    else:
+        fetcher_instance = DataFetcher(offline=args.offline)
+    # One fetch per ticker for the whole run, shared by all stages
+    store_instance = MarketDataStore(fetcher_instance)
 
     # 3. Execution Logic
     if args.mode in ["all", "calibration"]:
-        run_calibration(fetcher_instance, db_instance)
+        result_cache = None if args.no_result_cache else ResultCache(DEFAULT_RESULT_CACHE_DIR)
+        run_calibration(store_instance, db_instance, workers=args.workers, result_cache=result_cache)
 
     if args.mode in ["all", "correlations"]:
-        run_correlations(db_instance)
+        run_correlations(store_instance, db_instance)
 
     print(f"🏁 Pipeline Finished in {round(time.time() - start_time, 2)}s")
\ No newline at end of file
@@ -0,0 +1,247 @@
+import asyncio
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, replace
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+from calibrator import Calibrator, CalibratorConfig, CalibrationResult, OHLCVData, ResultCache
+from db import Database
+from fetcher import DEFAULT_MAX_WORKERS, MarketDataStore
+
+# Items a stage may get ahead of the next one before it has to wait
+DEFAULT_QUEUE_SIZE = 8
+
+# Processes for the CPU-bound calibration stage
+DEFAULT_CALIBRATE_WORKERS = min(4, os.cpu_count() or 1)
+
+# Calibration results of previous runs, keyed by prices and config
+DEFAULT_RESULT_CACHE_DIR = Path(__file__).resolve().parent / ".result_cache"
+
+# End-of-stream marker passed down the queues
+_DONE = object()
+
+
+@dataclass
+class StageStats:
+    """Counters for one pipeline stage."""
+    name: str
+    processed: int = 0
+    failed: int = 0
+    busy_seconds: float = 0.0
+    max_queue_depth: int = 0  # deepest the stage's input queue got
+    started: float | None = None
+    finished: float | None = None
+
+    @property
+    def elapsed(self) -> float:
+        if self.started is None:
+            return 0.0
+        return (self.finished or time.perf_counter()) - self.started
+
+    @property
+    def throughput(self) -> float:
+        """Items completed per second of stage wall time."""
+        return self.processed / self.elapsed if self.elapsed > 0 else 0.0
+
+    def summary(self) -> str:
+        return (
+            f"{self.name:<9} {self.processed:>4} ok {self.failed:>3} failed | "
+            f"{self.throughput:6.2f}/s | busy {self.busy_seconds:6.2f}s | "
+            f"max queue {self.max_queue_depth}"
+        )
+
+
+def build_market_history(data: OHLCVData) -> list[dict]:
+    """Close prices with a 20-day rolling volatility, as stored for the UI."""
+    returns = pd.Series(data.closes).pct_change()
+    # Simple rolling vol for UI visualization
+    rolling_vol = (returns.rolling(20).std() * np.sqrt(252)).fillna(0.2)
+
+    prices = np.round(data.closes, 4)
+    vols = np.round(rolling_vol.to_numpy(), 4)
+    return [{"Price": float(p), "Vol": float(v)} for p, v in zip(prices, vols)]
+
+
+class CalibrationPipeline:
+    """
+    fetch → calibrate → persist, with the stages running concurrently.
+
+    Fetches run in threads (sharing the fetcher's rate limit), calibration in
+    a process pool through Calibrator.calibrate_many (one task per ticker,
+    whose models share one feature cache) and database writes in a thread of
+    their own. A ticker's market history is written as soon as it is
+    fetched, so it is saved even if its calibration fails; its calibration
+    result follows once calibrated. Persist counts both kinds of writes.
+    Stages are connected by bounded queues, so a slow stage holds back the
+    ones feeding it instead of letting work pile up in memory.
+    """
+
+    def __init__(
+            self,
+            store: MarketDataStore,
+            db: Database,
+            config: CalibratorConfig | None = None,
+            fetch_concurrency: int = DEFAULT_MAX_WORKERS,
+            calibrate_workers: int = DEFAULT_CALIBRATE_WORKERS,
+            queue_size: int = DEFAULT_QUEUE_SIZE,
+            report_interval: float | None = None,
+            result_cache: ResultCache | None = None,
+    ):
+        """
+        Args:
+            store: Market data for this run
+            db: Destination of histories and calibration results
+            config: Calibration configuration
+            fetch_concurrency: Tickers fetched at the same time
+            calibrate_workers: Processes calibrating at the same time (also the
+                number of tickers being calibrated at once)
+            queue_size: Capacity of each queue between stages
+            report_interval: Seconds between queue depth reports (None for no reports)
+            result_cache: Results of earlier runs; tickers whose prices and
+                config are unchanged are not recalibrated
+        """
+        self.store = store
+        self.db = db
+        # The process pool parallelizes over tickers; estimators of one
+        # ticker run one after another in their worker, never in a nested pool
+        self.config = replace(config or CalibratorConfig(), executor=None, max_workers=None)
+        self.calibrator = Calibrator(self.config, cache=result_cache)
+        self.fetch_concurrency = max(1, fetch_concurrency)
+        self.calibrate_workers = max(1, calibrate_workers)
+        self.queue_size = queue_size
+        self.report_interval = report_interval
+
+        self.stats = {name: StageStats(name) for name in ("fetch", "calibrate", "persist")}
+
+    def run(self, tickers: list[str]) -> dict[str, StageStats]:
+        """Runs the pipeline over all tickers and returns the per-stage counters."""
+        return asyncio.run(self.run_async(tickers))
+
+    async def run_async(self, tickers: list[str]) -> dict[str, StageStats]:
+        pending = asyncio.Queue()
+        for ticker in dict.fromkeys(tickers):
+            pending.put_nowait(ticker)
+        self.stats["fetch"].max_queue_depth = pending.qsize()
+
+        fetched = asyncio.Queue(maxsize=self.queue_size)
+        calibrated = asyncio.Queue(maxsize=self.queue_size)
+
+        with ProcessPoolExecutor(max_workers=self.calibrate_workers) as pool:
+            fetchers = [asyncio.create_task(self._fetch(pending, fetched, calibrated)) for _ in range(self.fetch_concurrency)]
+            calibrators = [
+                asyncio.create_task(self._calibrate(fetched, calibrated, pool))
+                for _ in range(self.calibrate_workers)
+            ]
+            persister = asyncio.create_task(self._persist(calibrated))
+            reporter = asyncio.create_task(self._report(fetched, calibrated)) if self.report_interval else None
+
+            await asyncio.gather(*fetchers)
+            for _ in calibrators:
+                await fetched.put(_DONE)
+            await asyncio.gather(*calibrators)
+            await calibrated.put(_DONE)
+            await persister
+
+            if reporter is not None:
+                reporter.cancel()
+
+        for stats in self.stats.values():
+            print(f"   📈 {stats.summary()}")
+        cache = self.calibrator.cache
+        if cache is not None:
+            print(f"   📦 Result cache: {cache.hits} reused, {cache.misses} calibrated")
+        return self.stats
+
+    async def _fetch(self, pending: asyncio.Queue, fetched: asyncio.Queue, calibrated: asyncio.Queue) -> None:
+        stats = self.stats["fetch"]
+        stats.started = stats.started or time.perf_counter()
+
+        while not pending.empty():
+            ticker = pending.get_nowait()
+            started = time.perf_counter()
+            try:
+                data = await asyncio.to_thread(self.store.get, ticker)
+            except Exception as e:
+                stats.failed += 1
+                print(f"   ❌ Error processing {ticker}: {e}")
+                continue
+            finally:
+                stats.busy_seconds += time.perf_counter() - started
+
+            stats.processed += 1
+            # The market history is saved whatever becomes of the calibration
+            await self._put(calibrated, (data, None), self.stats["persist"])
+            await self._put(fetched, data, self.stats["calibrate"])
+
+        stats.finished = time.perf_counter()
+
+    async def _calibrate(self, fetched: asyncio.Queue, calibrated: asyncio.Queue, pool: ProcessPoolExecutor) -> None:
+        stats = self.stats["calibrate"]
+        stats.started = stats.started or time.perf_counter()
+
+        while (data := await fetched.get()) is not _DONE:
+            print(f"   🧮 Calibrating models for {data.ticker}...")
+            started = time.perf_counter()
+            try:
+                result = await asyncio.to_thread(self._calibrate_one, data, pool)
+            except Exception as e:
+                stats.failed += 1
+                print(f"   ❌ Error processing {data.ticker}: {e}")
+                continue
+            finally:
+                stats.busy_seconds += time.perf_counter() - started
+
+            stats.processed += 1
+            await self._put(calibrated, (data, result), self.stats["persist"])
+
+        stats.finished = time.perf_counter()
+
+    async def _persist(self, calibrated: asyncio.Queue) -> None:
+        stats = self.stats["persist"]
+        stats.started = time.perf_counter()
+
+        while (item := await calibrated.get()) is not _DONE:
+            data, result = item
+            started = time.perf_counter()
+            try:
+                await asyncio.to_thread(self._save, data, result)
+            except Exception as e:
+                stats.failed += 1
+                print(f"   ❌ Error processing {data.ticker}: {e}")
+                continue
+            finally:
+                stats.busy_seconds += time.perf_counter() - started
+
+            stats.processed += 1
+            if result is not None:
+                print(f"   ✨ Finished {data.ticker}")
+
+        stats.finished = time.perf_counter()
+
+    def _calibrate_one(self, data: OHLCVData, pool: ProcessPoolExecutor) -> CalibrationResult:
+        return next(self.calibrator.calibrate_many([data], executor=pool))
+
+    def _save(self, data: OHLCVData, result: CalibrationResult | None) -> None:
+        """Saves the market history of a fetched ticker (result None) or its calibration result."""
+        if result is None:
+            self.db.save_market_data(data.ticker, build_market_history(data))
+        else:
+            self.db.save_calibration_result(result)
+
+    @staticmethod
+    async def _put(queue: asyncio.Queue, item, consumer: StageStats) -> None:
+        """Hands an item to the next stage, waiting while its queue is full."""
+        await queue.put(item)
+        consumer.max_queue_depth = max(consumer.max_queue_depth, queue.qsize())
+
+    async def _report(self, fetched: asyncio.Queue, calibrated: asyncio.Queue) -> None:
+        while True:
+            await asyncio.sleep(self.report_interval)
+            done = ", ".join(f"{s.name} {s.processed}" for s in self.stats.values())
+            print(
+                f"   📊 Queues: to calibrate {fetched.qsize()}/{self.queue_size}, "
+                f"to persist {calibrated.qsize()}/{self.queue_size} | done: {done}"
+            )
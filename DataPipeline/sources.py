@@ -0,0 +1,175 @@
+import random
+import threading
+import time
+import zlib
+from collections import Counter
+from pathlib import Path
+from typing import Protocol
+
+import pandas as pd
+from calibrator.data import OHLCVData, OHLCVLoader
+
+# File types a ReplaySource serves, in order of preference per ticker
+REPLAY_SUFFIXES = (".ohlcv", ".parquet", ".csv")
+
+_PERIOD_UNITS = {"d": "days", "wk": "weeks", "mo": "months", "y": "years"}
+
+
+class DataSource(Protocol):
+    """
+    Provider of daily price histories for DataFetcher.
+
+    Both methods return frames shaped like yfinance output: a date index and
+    "Open", "High", "Low", "Close", "Volume" columns. history() covers one
+    ticker; batch_history() covers several, with (ticker, field) columns and
+    tickers without data left out.
+    """
+
+    def history(self, ticker: str, period: str = "10y", start=None) -> pd.DataFrame:
+        ...
+
+    def batch_history(self, tickers: list[str], period: str = "10y", start=None) -> pd.DataFrame:
+        ...
+
+
+class YahooSource:
+    """Yahoo Finance through yfinance."""
+
+    def history(self, ticker: str, period: str = "10y", start=None) -> pd.DataFrame:
+        # Imported here so offline and replay runs do not need yfinance
+        import yfinance as yf
+
+        if start is not None:
+            return yf.Ticker(ticker).history(start=start)
+        return yf.Ticker(ticker).history(period=period)
+
+    def batch_history(self, tickers: list[str], period: str = "10y", start=None) -> pd.DataFrame:
+        import yfinance as yf
+
+        kwargs = {"start": start} if start is not None else {"period": period}
+        return yf.download(
+            tickers, group_by="ticker", auto_adjust=True,
+            threads=False, progress=False, **kwargs,
+        )
+
+
+class ReplaySource:
+    """
+    Serves recorded histories from a directory, without network access.
+
+    Recordings are files named after their ticker (SPY.ohlcv, SPY.parquet or
+    SPY.csv), so the market data cache directory can be replayed as is.
+    Tickers without a recording of their own are served one of the existing
+    recordings, chosen by a hash of the symbol, which lets a few files stand
+    in for a universe of any size.
+
+    Periods are counted back from the last recorded bar rather than from
+    today, so a replay returns the same bars on every run.
+    """
+
+    def __init__(
+            self,
+            directory: str | Path,
+            latency: float = 0.0,
+            failure_rate: float = 0.0,
+            fail_tickers: tuple[str, ...] = (),
+            seed: int = 0,
+    ):
+        """
+        Args:
+            directory: Directory with the recorded histories
+            latency: Seconds each request takes
+            failure_rate: Probability that a request raises ConnectionError
+            fail_tickers: Tickers whose requests always fail
+            seed: Seed for the injected failures
+        """
+        self.directory = Path(directory)
+        self.latency = latency
+        self.failure_rate = failure_rate
+        self.fail_tickers = {t.upper() for t in fail_tickers}
+        self.seed = seed
+
+        self._recordings = {}
+        for suffix in reversed(REPLAY_SUFFIXES):
+            for path in sorted(self.directory.glob(f"*{suffix}")):
+                self._recordings[path.stem.upper()] = path
+        if not self._recordings:
+            raise ValueError(f"No recorded histories in {self.directory}")
+
+        self._loader = OHLCVLoader()
+        self._loaded: dict[Path, OHLCVData] = {}
+        self._attempts = Counter()
+        self._lock = threading.Lock()
+
+    def history(self, ticker: str, period: str = "10y", start=None) -> pd.DataFrame:
+        self._request(ticker)
+        if ticker.upper() in self.fail_tickers:
+            raise ConnectionError(f"Injected failure for {ticker}")
+        return self._frame(ticker, period, start)
+
+    def batch_history(self, tickers: list[str], period: str = "10y", start=None) -> pd.DataFrame:
+        self._request(",".join(tickers))
+        frames = {
+            ticker: self._frame(ticker, period, start)
+            for ticker in tickers
+            if ticker.upper() not in self.fail_tickers
+        }
+        if not frames:
+            return pd.DataFrame()
+        return pd.concat(frames, axis=1)
+
+    def _request(self, key: str) -> None:
+        """Simulates the cost and unreliability of one provider request."""
+        if self.latency > 0:
+            time.sleep(self.latency)
+
+        if self.failure_rate > 0:
+            # Decided per (key, attempt) so the outcome does not depend on
+            # the order in which threads issue their requests
+            with self._lock:
+                self._attempts[key] += 1
+                attempt = self._attempts[key]
+            if random.Random(f"{self.seed}:{key}:{attempt}").random() < self.failure_rate:
+                raise ConnectionError(f"Injected failure for {key} (attempt {attempt})")
+
+    def _frame(self, ticker: str, period: str, start) -> pd.DataFrame:
+        data = self._recording(ticker)
+
+        if start is not None:
+            first = pd.Timestamp(start)
+        else:
+            first = period_start(pd.Timestamp(data.dates[-1]), period)
+        rows = data.dates >= first.to_datetime64()
+
+        return pd.DataFrame(
+            {
+                "Open": data.opens[rows],
+                "High": data.highs[rows],
+                "Low": data.lows[rows],
+                "Close": data.closes[rows],
+                "Volume": data.volumes[rows],
+            },
+            index=pd.DatetimeIndex(data.dates[rows], name="Date"),
+        )
+
+    def _recording(self, ticker: str) -> OHLCVData:
+        path = self._recordings.get(ticker.upper())
+        if path is None:
+            paths = list(self._recordings.values())
+            # Stable across runs, unlike hash()
+            path = paths[zlib.crc32(ticker.upper().encode()) % len(paths)]
+
+        with self._lock:
+            if path not in self._loaded:
+                self._loaded[path] = self._loader.load(path, ticker=path.stem.upper())
+            return self._loaded[path]
+
+
+def period_start(last: pd.Timestamp, period: str) -> pd.Timestamp:
+    """First date covered by a yfinance-style period ("5d", "6mo", "10y", "max") ending at `last`."""
+    if period == "max":
+        return pd.Timestamp.min
+    for suffix, unit in _PERIOD_UNITS.items():
+        if period.endswith(suffix) and period[:-len(suffix)].isdigit():
+            return last - pd.DateOffset(**{unit: int(period[:-len(suffix)])})
+    raise ValueError(f"Unsupported period: {period}")
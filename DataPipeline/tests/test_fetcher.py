@@ -0,0 +1,94 @@
+import pytest
+
+from calibrator.data import save_ohlcv_store
+from conftest import make_ohlcv
+from fetcher import DataFetcher, RateLimiter
+from sources import ReplaySource
+
+
+class CountingSource(ReplaySource):
+    """ReplaySource that records the (ticker, period, start) of every request."""
+
+    def __init__(self, directory):
+        super().__init__(directory)
+        self.requests = []
+
+    def history(self, ticker, period="10y", start=None):
+        self.requests.append((ticker, period, start))
+        return super().history(ticker, period=period, start=start)
+
+    def batch_history(self, tickers, period="10y", start=None):
+        self.requests.extend((ticker, period, start) for ticker in tickers)
+        return super().batch_history(tickers, period=period, start=start)
+
+    def full_downloads(self, ticker):
+        return sum(1 for t, _, start in self.requests if t == ticker and start is None)
+
+
+@pytest.fixture
+def source(tmp_path):
+    recordings = tmp_path / "recordings"
+    recordings.mkdir()
+    # About eleven years of bars, and a recent listing with about one
+    save_ohlcv_store(make_ohlcv(2900, ticker="OLD", start="2012-01-02"), recordings / "OLD.ohlcv")
+    save_ohlcv_store(make_ohlcv(300, ticker="NEW", start="2022-06-01", seed=1), recordings / "NEW.ohlcv")
+    return CountingSource(recordings)
+
+
+def make_fetcher(source, tmp_path, cache_ttl=0.0):
+    return DataFetcher(
+        source=source,
+        cache_dir=tmp_path / "cache",
+        cache_ttl=cache_ttl,
+        rate_limiter=RateLimiter(1e6, 100),
+    )
+
+
+def test_covers_period_counted_from_last_bar(source, tmp_path):
+    fetcher = make_fetcher(source, tmp_path)
+    data = make_ohlcv(2900, ticker="OLD", start="2012-01-02")
+
+    assert fetcher._covers(data, "10y")
+    assert not fetcher._covers(data, "15y")
+    assert fetcher._covers(data, "1y")
+    assert fetcher._covers(data.tail(260), "1y")
+    assert not fetcher._covers(data.tail(260), "2y")
+
+
+def test_short_history_is_downloaded_in_full_once(source, tmp_path):
+    fetcher = make_fetcher(source, tmp_path)
+    first = fetcher.fetch_ticker("NEW", period="10y")
+    second = fetcher.fetch_ticker("NEW", period="10y")
+
+    assert len(first) == len(second) == 300
+    assert source.full_downloads("NEW") == 1
+    # The second call only asked for bars after the cached ones
+    assert source.requests[-1][2] is not None
+
+    # Also across fetcher instances and through the batch path
+    results = make_fetcher(source, tmp_path).fetch_many(["NEW"], period="10y")
+    assert len(results.data["NEW"]) == 300
+    assert source.full_downloads("NEW") == 1
+
+
+def test_longer_period_than_last_full_download_downloads_again(source, tmp_path):
+    fetcher = make_fetcher(source, tmp_path)
+    fetcher.fetch_ticker("OLD", period="1y")
+    fetcher.fetch_ticker("OLD", period="1y")
+    assert source.full_downloads("OLD") == 1
+
+    data = fetcher.fetch_ticker("OLD", period="5y")
+    assert source.full_downloads("OLD") == 2
+    assert fetcher._covers(data, "5y")
+
+
+def test_short_history_without_full_download_record_is_not_covered(source, tmp_path):
+    fetcher = make_fetcher(source, tmp_path)
+    data = fetcher.fetch_ticker("NEW", period="10y")
+    assert fetcher._covers(data, "10y")
+
+    fetcher._full_start_path("NEW").write_text("not a date")
+    assert not fetcher._covers(data, "10y")
+
+    fetcher._full_start_path("NEW").unlink()
+    assert not fetcher._covers(data, "10y")
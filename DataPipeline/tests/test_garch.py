@@ -0,0 +1,74 @@
+import numpy as np
+import pytest
+
+from calibrator.math.garch import (
+    INVALID_NLL,
+    garch_hessian_and_opg,
+    garch_neg_log_likelihood,
+    garch_neg_log_likelihood_and_grad,
+)
+from conftest import central_differences, make_ohlcv
+
+PARAMS = np.array([3e-6, 0.1, 0.85])
+
+
+@pytest.fixture
+def e2():
+    returns = make_ohlcv(1000, seed=3).log_returns
+    return (returns - returns.mean()) ** 2
+
+
+def reference_terms(params, e2, h0):
+    """Per-observation NLL terms, by the recursion written out step by step."""
+    omega, alpha, beta = params
+    h, terms = h0, []
+    for t in range(1, len(e2)):
+        h = omega + alpha * e2[t - 1] + beta * h
+        terms.append(0.5 * (np.log(h) + e2[t] / h))
+    return np.array(terms)
+
+
+def reference_nll(params, e2, h0):
+    return reference_terms(params, e2, h0).sum()
+
+
+def test_nll_matches_recursion(e2):
+    h0 = e2.mean()
+    nll, _ = garch_neg_log_likelihood_and_grad(PARAMS, e2, h0)
+
+    assert nll == pytest.approx(reference_nll(PARAMS, e2, h0), rel=1e-12)
+    assert garch_neg_log_likelihood(PARAMS, e2, h0) == pytest.approx(nll, rel=1e-12)
+
+
+@pytest.mark.parametrize("params", [PARAMS, np.array([1e-5, 0.02, 0.6]), np.array([5e-7, 0.2, 0.79])])
+def test_gradient_matches_finite_differences(e2, params):
+    h0 = e2.mean()
+    _, grad = garch_neg_log_likelihood_and_grad(params, e2, h0)
+    numerical = central_differences(lambda x: reference_nll(x, e2, h0), params)
+
+    np.testing.assert_allclose(grad, numerical, rtol=1e-5, atol=1e-6 * np.abs(numerical).max())
+
+
+def test_gradient_outside_admissible_region(e2):
+    nll, grad = garch_neg_log_likelihood_and_grad(np.array([1e-6, 0.5, 0.5]), e2, e2.mean())
+
+    assert nll == INVALID_NLL
+    np.testing.assert_array_equal(grad, 0.0)
+
+
+@pytest.mark.parametrize("params", [PARAMS, np.array([1e-5, 0.02, 0.6]), np.array([5e-7, 0.2, 0.79])])
+def test_hessian_matches_finite_differences(e2, params):
+    h0 = e2.mean()
+    hessian, _ = garch_hessian_and_opg(params, e2, h0)
+    numerical = central_differences(lambda x: garch_neg_log_likelihood_and_grad(x, e2, h0)[1], params)
+
+    np.testing.assert_allclose(hessian, hessian.T)
+    np.testing.assert_allclose(hessian, numerical, rtol=1e-5, atol=1e-6 * np.abs(numerical).max())
+
+
+def test_opg_is_outer_product_of_scores(e2):
+    h0 = e2.mean()
+    _, opg = garch_hessian_and_opg(PARAMS, e2, h0)
+    scores = central_differences(lambda x: reference_terms(x, e2, h0), PARAMS)
+
+    np.testing.assert_allclose(opg, scores.T @ scores, rtol=1e-5, atol=1e-6 * np.abs(opg).max())
@@ -0,0 +1,70 @@
+import numpy as np
+import pytest
+
+from calibrator.estimators import GARCHEstimator
+from calibrator.math.garch import fit_garch_batch, garch_neg_log_likelihood
+from conftest import make_ohlcv
+
+FIELDS = ("mu", "omega", "alpha", "beta", "persistence", "unconditional_var")
+
+
+@pytest.fixture
+def datasets():
+    return [make_ohlcv(800, ticker=f"T{i}", seed=i) for i in range(5)]
+
+
+def squared_residuals(datasets):
+    residuals = [data.log_returns - data.log_returns.mean() for data in datasets]
+    return np.column_stack([r ** 2 for r in residuals]), np.array([r.var() for r in residuals])
+
+
+def test_batch_fit_matches_single_fits(datasets):
+    estimator = GARCHEstimator()
+    batch = estimator.estimate_batch(datasets)
+
+    for data, params in zip(datasets, batch):
+        single = estimator.estimate(data)
+        for name in FIELDS:
+            batch_value, single_value = getattr(params, name), getattr(single, name)
+            assert batch_value.value == pytest.approx(single_value.value, rel=1e-3)
+            assert batch_value.std_error == pytest.approx(single_value.std_error, rel=1e-2)
+
+
+def test_batch_fit_reaches_single_series_optimum(datasets):
+    e2, h0 = squared_residuals(datasets)
+    fit = fit_garch_batch(e2, h0)
+    estimator = GARCHEstimator()
+
+    assert fit.converged.all()
+    for i, data in enumerate(datasets):
+        single = estimator.estimate(data)
+        single_params = [single.omega.value, single.alpha.value, single.beta.value]
+        assert fit.nll[i] == pytest.approx(garch_neg_log_likelihood(fit.params[i], e2[:, i], h0[i]), rel=1e-12)
+        assert fit.nll[i] <= garch_neg_log_likelihood(single_params, e2[:, i], h0[i]) + 1e-6
+
+
+def test_batch_results_do_not_depend_on_batching(datasets):
+    e2, h0 = squared_residuals(datasets)
+    together = fit_garch_batch(e2, h0)
+
+    for i in range(len(datasets)):
+        alone = fit_garch_batch(e2[:, i:i + 1], h0[i:i + 1])
+        np.testing.assert_allclose(alone.params[0], together.params[i], rtol=1e-10)
+
+    estimator = GARCHEstimator()
+    chunked = estimator.estimate_batch(datasets, batch_size=2)
+    for a, b in zip(chunked, estimator.estimate_batch(datasets)):
+        assert a == b
+
+
+def test_batch_warnings_name_the_ticker():
+    estimator = GARCHEstimator()
+    estimator.estimate_batch([make_ohlcv(80, ticker="SHORT"), make_ohlcv(80, ticker="OTHER", seed=1)])
+
+    assert any(w.startswith("SHORT: Less than 100 observations") for w in estimator.warnings)
+    assert any(w.startswith("OTHER: ") for w in estimator.warnings)
+
+
+def test_batch_needs_equal_lengths():
+    with pytest.raises(ValueError, match="same length"):
+        GARCHEstimator().estimate_batch([make_ohlcv(300), make_ohlcv(400)])
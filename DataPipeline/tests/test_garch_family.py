@@ -0,0 +1,83 @@
+import numpy as np
+import pytest
+
+from calibrator.estimators import GJRGARCHEstimator
+from calibrator.estimators.garch_family import _GARCHFamilyEstimator
+from calibrator.math.garch import garch_hessian_and_opg
+from calibrator.math.garch_family import (
+    garch_family_neg_log_likelihood_and_grad,
+    gjr_hessian_and_opg,
+)
+from conftest import central_differences, make_ohlcv
+
+GJR_PARAMS = np.array([3e-6, 0.05, 0.08, 0.85])
+EGARCH_PARAMS = np.array([-0.3, 0.1, -0.05, 0.97])
+NU = 7.0
+
+
+@pytest.fixture
+def residuals():
+    returns = make_ohlcv(1000, seed=4).log_returns
+    return returns - returns.mean()
+
+
+def with_nu(params, innovations):
+    return np.append(params, NU) if innovations == "student_t" else params
+
+
+def assert_close(actual, expected):
+    np.testing.assert_allclose(actual, expected, rtol=1e-5, atol=1e-6 * np.abs(expected).max())
+
+
+@pytest.mark.parametrize("innovations", ["normal", "student_t"])
+@pytest.mark.parametrize("variance, params", [("gjr", GJR_PARAMS), ("egarch", EGARCH_PARAMS)])
+def test_gradient_matches_finite_differences(residuals, variance, params, innovations):
+    params = with_nu(params, innovations)
+    h0 = residuals.var()
+
+    def nll(x):
+        return garch_family_neg_log_likelihood_and_grad(variance, innovations, x, residuals, h0)[0]
+
+    _, grad = garch_family_neg_log_likelihood_and_grad(variance, innovations, params, residuals, h0)
+    assert_close(grad, central_differences(nll, params))
+
+
+@pytest.mark.parametrize("innovations", ["normal", "student_t"])
+def test_gjr_hessian_matches_finite_differences(residuals, innovations):
+    params = with_nu(GJR_PARAMS, innovations)
+    h0 = residuals.var()
+
+    def grad(x):
+        return garch_family_neg_log_likelihood_and_grad("gjr", innovations, x, residuals, h0)[1]
+
+    hessian, _ = gjr_hessian_and_opg(innovations, params, residuals, h0)
+    np.testing.assert_allclose(hessian, hessian.T)
+    assert_close(hessian, central_differences(grad, params))
+
+
+def test_gjr_without_asymmetry_is_garch(residuals):
+    params = np.array([3e-6, 0.1, 0.0, 0.85])
+    h0 = residuals.var()
+
+    hessian, opg = gjr_hessian_and_opg("normal", params, residuals, h0)
+    garch_hessian, garch_opg = garch_hessian_and_opg(params[[0, 1, 3]], residuals ** 2, h0)
+
+    keep = np.ix_([0, 1, 3], [0, 1, 3])
+    np.testing.assert_allclose(hessian[keep], garch_hessian, rtol=1e-10)
+    np.testing.assert_allclose(opg[keep], garch_opg, rtol=1e-10)
+
+
+def test_gjr_standard_errors_are_finite():
+    params = GJRGARCHEstimator(innovations="student_t").estimate(make_ohlcv(1000, seed=5))
+
+    for name in ("omega", "alpha", "gamma", "beta", "nu"):
+        estimate = getattr(params, name)
+        assert np.isfinite(estimate.std_error) and estimate.std_error > 0
+
+
+def test_family_hooks_are_abstract():
+    class Incomplete(_GARCHFamilyEstimator):
+        variance = "gjr"
+
+    with pytest.raises(TypeError, match="abstract"):
+        Incomplete()
@@ -0,0 +1,115 @@
+import pickle
+
+import numpy as np
+import pytest
+
+from calibrator.data import OHLCVLoader, save_ohlcv_store
+from conftest import make_ohlcv
+
+
+def test_islice_returns_views(ohlcv):
+    window = ohlcv.islice(100, 200)
+
+    assert len(window) == 100
+    assert window.n_returns == 99
+    assert np.shares_memory(window.closes, ohlcv.closes)
+    np.testing.assert_array_equal(window.dates, ohlcv.dates[100:200])
+    np.testing.assert_array_equal(window.log_returns, ohlcv.log_returns[100:199])
+    np.testing.assert_allclose(window.log_returns, np.diff(np.log(window.closes)))
+
+
+def test_islice_negative_indices_and_tail(ohlcv):
+    np.testing.assert_array_equal(ohlcv.islice(-50).closes, ohlcv.closes[-50:])
+    np.testing.assert_array_equal(ohlcv.tail(50).closes, ohlcv.closes[-50:])
+    assert len(ohlcv.tail(10 * len(ohlcv))) == len(ohlcv)
+
+
+def test_islice_needs_two_bars(ohlcv):
+    with pytest.raises(ValueError):
+        ohlcv.islice(10, 11)
+
+
+def test_window_is_inclusive(ohlcv):
+    window = ohlcv.window(ohlcv.dates[10], ohlcv.dates[19])
+    np.testing.assert_array_equal(window.dates, ohlcv.dates[10:20])
+
+
+COLUMNS = ("dates", "opens", "highs", "lows", "closes", "volumes", "log_returns")
+
+
+def assert_same_bars(actual, expected):
+    for name in COLUMNS:
+        np.testing.assert_array_equal(getattr(actual, name), getattr(expected, name))
+
+
+def test_append_matches_full_history(ohlcv):
+    grown = ohlcv.islice(0, 300)
+    for start in range(300, len(ohlcv), 50):
+        grown = grown.append(ohlcv.islice(start, start + 50))
+
+    assert_same_bars(grown, ohlcv)
+    # Chained returns are computed from the previous close, not recomputed in full
+    np.testing.assert_allclose(grown.log_returns, np.diff(np.log(ohlcv.closes)))
+
+
+def test_append_accepts_bars_and_columns(ohlcv):
+    head, rest = ohlcv.islice(0, 400), ohlcv.islice(400)
+    columns = {name: getattr(rest, name) for name in COLUMNS[:-1]}
+
+    assert_same_bars(head.append(list(rest.bars)), ohlcv)
+    assert_same_bars(head.append(columns), ohlcv)
+
+    columns.pop("volumes")
+    np.testing.assert_array_equal(head.append(columns).volumes[400:], 0.0)
+
+
+def test_append_reuses_buffer_of_newest_version(ohlcv):
+    first = ohlcv.islice(0, 400).append(ohlcv.islice(400, 450))
+    second = first.append(ohlcv.islice(450))
+
+    assert np.shares_memory(first.closes, second.closes)
+    assert_same_bars(second, ohlcv)
+
+
+def test_append_leaves_older_versions_unchanged():
+    base = make_ohlcv(300)
+    first = base.islice(0, 200).append(base.islice(200, 250))
+
+    # Both branch off `first`; the second must not overwrite the first's new bars
+    left = first.append(base.islice(250))
+    right = first.append(make_ohlcv(50, start="2021-12-01", seed=1))
+
+    assert_same_bars(first, base.islice(0, 250))
+    assert_same_bars(left, base)
+    assert len(right) == 300
+    assert not np.shares_memory(left.closes, right.closes)
+
+
+def test_append_rejects_overlapping_dates(ohlcv):
+    with pytest.raises(ValueError, match="must start after"):
+        ohlcv.append(ohlcv.islice(-10))
+
+
+def test_append_nothing_returns_self(ohlcv):
+    assert ohlcv.append([]) is ohlcv
+
+
+def test_pickle_round_trip(ohlcv):
+    assert_same_bars(pickle.loads(pickle.dumps(ohlcv)), ohlcv)
+
+
+def test_pickle_sends_only_the_columns(tmp_path, ohlcv):
+    path = save_ohlcv_store(ohlcv, tmp_path / "TEST.ohlcv")
+    mapped = OHLCVLoader().load_mmap(path)
+    grown = ohlcv.islice(0, 400).append(ohlcv.islice(400))
+    ohlcv.bars  # materialize the bar objects
+
+    for data in (mapped, grown, ohlcv, ohlcv.islice(100, 200)):
+        restored = pickle.loads(pickle.dumps(data))
+        assert_same_bars(restored, data)
+        assert not isinstance(restored.closes.base, np.memmap)
+
+    # Neither bar objects nor the append buffer's spare capacity are pickled
+    size = len(pickle.dumps(make_ohlcv()))
+    assert len(pickle.dumps(ohlcv)) == size
+    assert len(pickle.dumps(grown)) == size
@@ -0,0 +1,137 @@
+import os
+from datetime import date
+from dataclasses import replace
+
+import numpy as np
+import pytest
+
+from calibrator import Calibrator, CalibratorConfig, ResultCache
+from calibrator.cache import result_key
+from calibrator.data import CalibrationResult, ModelType, OHLCVLoader, save_ohlcv_store
+from conftest import make_ohlcv
+
+MODELS = (ModelType.GBM, ModelType.GARCH)
+
+
+def make_result(ticker="TEST", n=100, warnings=()):
+    return CalibrationResult(
+        ticker=ticker,
+        n_observations=n,
+        date_range=(date(2020, 1, 1), date(2020, 6, 1)),
+        warnings=list(warnings),
+    )
+
+
+def test_key_depends_only_on_contents(tmp_path, ohlcv):
+    config = CalibratorConfig()
+    key = result_key(ohlcv, config, MODELS)
+
+    mapped = OHLCVLoader().load_mmap(save_ohlcv_store(ohlcv, tmp_path / "TEST.ohlcv"))
+    assert result_key(mapped, config, MODELS) == key
+    assert result_key(ohlcv, CalibratorConfig(), reversed(MODELS)) == key
+
+    # A view into a longer history hashes like a standalone copy of its bars
+    window = ohlcv.islice(100, 300)
+    copy = type(ohlcv).from_arrays(
+        *(getattr(window, name).copy() for name in ("dates", "opens", "highs", "lows", "closes", "volumes")),
+        ticker=window.ticker,
+    )
+    assert result_key(window, config, MODELS) == result_key(copy, config, MODELS)
+
+
+def test_key_changes_with_inputs(ohlcv):
+    config = CalibratorConfig()
+    key = result_key(ohlcv, config, MODELS)
+
+    closes = ohlcv.closes.copy()
+    closes[-1] *= 1.0 + 1e-12
+    changed = type(ohlcv).from_arrays(
+        ohlcv.dates, ohlcv.opens, np.maximum(ohlcv.highs, closes), ohlcv.lows, closes, ohlcv.volumes,
+        ticker=ohlcv.ticker,
+    )
+
+    others = {
+        result_key(changed, config, MODELS),
+        result_key(make_ohlcv(ticker="OTHER"), config, MODELS),
+        result_key(ohlcv.islice(0, -1), config, MODELS),
+        result_key(ohlcv, replace(config, n_bootstrap=500), MODELS),
+        result_key(ohlcv, config, MODELS[:1]),
+        result_key(ohlcv, config, MODELS, version="0.0.0"),
+    }
+    assert key not in others
+    assert len(others) == 6
+
+
+def test_key_ignores_scheduling_fields(ohlcv):
+    config = CalibratorConfig()
+    scheduled = replace(config, executor="thread", max_workers=4)
+    assert result_key(ohlcv, scheduled, MODELS) == result_key(ohlcv, config, MODELS)
+
+
+def test_put_get_round_trip(tmp_path):
+    cache = ResultCache(tmp_path)
+    result = make_result(warnings=["note"])
+
+    assert cache.get("a") is None
+    cache.put("a", result)
+    assert cache.get("a") == result
+    assert cache.stats() == {"hits": 1, "misses": 1}
+
+
+def test_unreadable_entry_is_a_miss_and_removed(tmp_path):
+    cache = ResultCache(tmp_path)
+    cache.put("a", make_result())
+    path = cache._path("a")
+    path.write_bytes(path.read_bytes()[:10])
+
+    assert cache.get("a") is None
+    assert not path.exists()
+
+
+def test_evicts_least_recently_used(tmp_path):
+    cache = ResultCache(tmp_path)
+    for i, key in enumerate("abc"):
+        cache.put(key, make_result(ticker=key))
+        os.utime(cache._path(key), (1000 + i, 1000 + i))
+    entry_size = cache._path("a").stat().st_size
+
+    # Reading "a" makes "b" the least recently used
+    assert cache.get("a") is not None
+    cache.max_bytes = 3 * entry_size
+    cache.put("d", make_result(ticker="d"))
+
+    assert cache.get("b") is None
+    assert all(cache.get(key) is not None for key in "acd")
+    assert cache.size() <= cache.max_bytes
+
+
+def test_evict_keeps_everything_under_the_limit(tmp_path):
+    cache = ResultCache(tmp_path)
+    for key in "abc":
+        cache.put(key, make_result(ticker=key))
+
+    assert cache.evict() == 0
+    cache.max_bytes = 1
+    assert cache.evict() == 3
+    assert cache.size() == 0
+
+
+def test_max_bytes_must_be_positive(tmp_path):
+    with pytest.raises(ValueError):
+        ResultCache(tmp_path, max_bytes=0)
+
+
+def test_calibrator_reads_back_cached_result(tmp_path, ohlcv):
+    config = CalibratorConfig(
+        estimate_heston=False,
+        estimate_garch=False,
+        estimate_regime_switching=False,
+        estimate_bootstrap=False,
+    )
+    cache = ResultCache(tmp_path)
+
+    first = Calibrator(config, cache=cache).calibrate(ohlcv)
+    second = Calibrator(replace(config, executor="thread"), cache=cache).calibrate(ohlcv)
+
+    assert second == first
+    assert cache.stats() == {"hits": 1, "misses": 1}
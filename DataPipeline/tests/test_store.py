@@ -0,0 +1,77 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from calibrator.data import DataLoadError, OHLCVLoader, save_ohlcv_store
+from conftest import make_ohlcv
+
+COLUMNS = ("dates", "opens", "highs", "lows", "closes", "volumes", "log_returns")
+
+
+def assert_same_bars(actual, expected, tol=0.0):
+    assert actual.ticker == expected.ticker
+    np.testing.assert_array_equal(actual.dates, expected.dates)
+    for name in COLUMNS[1:]:
+        np.testing.assert_allclose(getattr(actual, name), getattr(expected, name), rtol=tol, atol=tol)
+
+
+def test_store_round_trip(tmp_path, ohlcv):
+    path = save_ohlcv_store(ohlcv, tmp_path / "TEST.ohlcv")
+
+    assert_same_bars(OHLCVLoader().load_mmap(path), ohlcv)
+    assert_same_bars(OHLCVLoader().load(path), ohlcv)
+
+
+def test_store_is_memory_mapped(tmp_path, ohlcv):
+    path = save_ohlcv_store(ohlcv, tmp_path / "TEST.ohlcv")
+    loaded = OHLCVLoader().load_mmap(path)
+
+    assert isinstance(loaded.closes.base, np.memmap)
+    assert not loaded.closes.flags.writeable
+
+
+def test_store_ticker_override(tmp_path, ohlcv):
+    path = save_ohlcv_store(ohlcv, tmp_path / "TEST.ohlcv")
+    assert OHLCVLoader().load_mmap(path, ticker="OTHER").ticker == "OTHER"
+
+
+def test_store_overwrite_leaves_no_temporary_files(tmp_path):
+    path = tmp_path / "TEST.ohlcv"
+    save_ohlcv_store(make_ohlcv(100, seed=1), path)
+    save_ohlcv_store(make_ohlcv(200, seed=2), path)
+
+    assert len(OHLCVLoader().load_mmap(path)) == 200
+    assert [p.name for p in tmp_path.iterdir()] == ["TEST.ohlcv"]
+
+
+def test_truncated_store_is_rejected(tmp_path, ohlcv):
+    path = save_ohlcv_store(ohlcv, tmp_path / "TEST.ohlcv")
+    path.write_bytes(path.read_bytes()[:-8])
+
+    with pytest.raises(DataLoadError, match="Corrupt"):
+        OHLCVLoader().load_mmap(path)
+
+
+def test_missing_store_is_rejected(tmp_path):
+    with pytest.raises(DataLoadError, match="not found"):
+        OHLCVLoader().load_mmap(tmp_path / "NONE.ohlcv")
+
+
+def test_csv_round_trip_and_date_range(tmp_path, ohlcv):
+    path = tmp_path / "TEST.csv"
+    pd.DataFrame({
+        "Date": pd.DatetimeIndex(ohlcv.dates),
+        "Open": ohlcv.opens,
+        "High": ohlcv.highs,
+        "Low": ohlcv.lows,
+        "Close": ohlcv.closes,
+        "Volume": ohlcv.volumes,
+    }).to_csv(path, index=False, float_format="%.17g")
+
+    # The CSV float parser may be off by an ulp
+    loader = OHLCVLoader()
+    assert_same_bars(loader.load(path), ohlcv, tol=1e-12)
+
+    start, end = ohlcv.dates[100], ohlcv.dates[199]
+    assert_same_bars(loader.load(path, start=start, end=end), ohlcv.islice(100, 200), tol=1e-12)
+    assert_same_bars(loader.load(path, chunk_size=64), ohlcv, tol=1e-12)